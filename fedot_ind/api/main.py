@@ -1,36 +1,31 @@
 import logging
 import os
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import partial
 from pathlib import Path
 from typing import Union
 
-import matplotlib
 import numpy as np
 import pandas as pd
 from fedot.api.main import Fedot
+from fedot.core.data.data import InputData
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.tasks import TsForecastingParams
-from fedot.core.visualisation.pipeline_specific_visuals import PipelineHistoryVisualizer
 from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
 
 from fedot_ind.api.utils.checkers_collections import DataCheck
-from fedot_ind.api.utils.industrial_strategy import IndustrialStrategy
+from fedot_ind.api.utils.pipeline_predictions import reuse_node_predictions
 from fedot_ind.api.utils.path_lib import DEFAULT_PATH_RESULTS as default_path_to_save_results
-from fedot_ind.core.architecture.abstraction.decorators import DaskServer
 from fedot_ind.core.architecture.preprocessing.data_convertor import ApiConverter
 from fedot_ind.core.architecture.settings.computational import BackendMethods
 from fedot_ind.core.operation.transformation.splitter import TSTransformer
-from fedot_ind.core.optimizer.IndustrialEvoOptimizer import IndustrialEvoOptimizer
 from fedot_ind.core.repository.constanst_repository import \
-    FEDOT_GET_METRICS, FEDOT_TUNING_METRICS, \
+    FEDOT_GET_METRICS, FEDOT_TUNING_METRICS, PROBABILITY_METRICS, \
     FEDOT_API_PARAMS, FEDOT_ASSUMPTIONS, FEDOT_TUNER_STRATEGY
-from fedot_ind.core.repository.industrial_implementations.abstract import build_tuner
-from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
-from fedot_ind.core.repository.model_repository import default_industrial_availiable_operation
-from fedot_ind.tools.explain.explain import PointExplainer
-from fedot_ind.tools.synthetic.anomaly_generator import AnomalyGenerator
-from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
+
+# model repository, Dask, visualisation, explainability and synthetic data are imported
+# inside the methods which use them, so the import of the API stays light for scoring workers
 
 warnings.filterwarnings("ignore")
 
@@ -41,6 +36,12 @@ class FedotIndustrial(Fedot):
     Args:
         input_config: dictionary with the parameters of the experiment.
         output_folder: path to the folder where the results will be saved.
+        evaluation_backend: executor used to evaluate population during composition. One of ``'dask'``,
+            ``'process'`` or ``'thread'``.
+        dask_cluster_params: parameters of the Dask cluster, see ``DaskServer``. ``n_workers``,
+            ``threads_per_worker``, ``memory_limit`` and ``processes`` size the local cluster, ``address``
+            attaches to the running scheduler instead. The cluster is started only when population is
+            evaluated in parallel with ``'dask'`` backend and is reused by next fits until ``shutdown``.
 
     Example:
         First, configure experiment and instantiate FedotIndustrial class::
@@ -69,6 +70,9 @@ class FedotIndustrial(Fedot):
     """
 
     def __init__(self, **kwargs):
+        from fedot_ind.api.utils.industrial_strategy import IndustrialStrategy
+        from fedot_ind.core.optimizer.IndustrialEvoOptimizer import IndustrialEvoOptimizer
+        from fedot_ind.core.repository.model_repository import default_industrial_availiable_operation
 
         # init Fedot and Industrial hyperparams and path to results
         self.output_folder = kwargs.get('output_folder', None)
@@ -78,6 +82,8 @@ class FedotIndustrial(Fedot):
         self.path_to_composition_results = kwargs.get('history_dir', None)
         self.backend_method = kwargs.get('backend', 'cpu')
         self.task_params = kwargs.get('task_params', None)
+        self.evaluation_backend = kwargs.get('evaluation_backend', 'dask')
+        self.dask_cluster_params = kwargs.get('dask_cluster_params', None)
 
         # TODO: unused params
         # self.model_params = kwargs.get('model_params', None)
@@ -116,6 +122,8 @@ class FedotIndustrial(Fedot):
         self.predicted_labels = None
         self.predicted_probs = None
         self.predict_data = None
+        self.checked_predict_data = None
+        self.raw_predict_data = None
         self.target_encoder = None
         self.is_finetuned = False
 
@@ -129,7 +137,7 @@ class FedotIndustrial(Fedot):
         )
 
         self.config_dict['optimizer'] = kwargs.get(
-            'optimizer', IndustrialEvoOptimizer)
+            'optimizer', partial(IndustrialEvoOptimizer, evaluation_backend=self.evaluation_backend))
         self.config_dict['initial_assumption'] = kwargs.get(
             'initial_assumption', FEDOT_ASSUMPTIONS[self.config_dict['problem']])
         self.config_dict['use_input_preprocessing'] = kwargs.get(
@@ -164,19 +172,28 @@ class FedotIndustrial(Fedot):
         globals()['backend_scipy'] = backend_scipy_current
 
     def __init_solver(self):
+        from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+        from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+
         self.logger.info('Initialising Industrial Repository')
         self.repo = IndustrialModels().setup_repository()
-        self.logger.info('Initialising Dask Server')
         self.config_dict['initial_assumption'] = self.config_dict['initial_assumption'].build()
-        self.dask_client = DaskServer().client
-        self.logger.info(
-            f'LinK Dask Server - {self.dask_client.dashboard_link}')
+        # cluster itself is started by the first parallel evaluation
+        DaskServer.configure(**(self.dask_cluster_params or {}))
         self.logger.info('Initialising solver')
         self.solver = Fedot(**self.config_dict)
 
+    @property
+    def dask_client(self):
+        """Client of the Dask cluster used for parallel evaluation, the cluster is started on the first access"""
+        from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+
+        return DaskServer().client
+
     def shutdown(self):
-        self.dask_client.close()
-        del self.dask_client
+        from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+
+        DaskServer.shutdown()
 
     def fit(self,
             input_data: tuple,
@@ -205,6 +222,30 @@ class FedotIndustrial(Fedot):
             self.solver.fit(self.train_data)
         self.is_finetuned = False
 
+    def _check_predict_data(self, predict_data) -> InputData:
+        """Checks data for prediction without copying its arrays. Data checked by the previous call of ``predict``
+        or ``predict_proba`` is reused if the same object (or tuple of the same arrays) or ``predict_data``
+        attribute is passed, so the data shouldn't be changed inplace between these calls. Solver gets
+        a shallow copy, so reassignment of its attributes doesn't affect the checked data.
+        """
+        if self.checked_predict_data is None or not (
+                predict_data is self.predict_data or
+                self._is_same_data(predict_data, self.raw_predict_data)):
+            self.checked_predict_data = DataCheck(
+                input_data=predict_data,
+                task=self.config_dict['problem'],
+                task_params=self.task_params,
+                industrial_task_params=self.industrial_strategy_params).check_input_data()
+            self.raw_predict_data = predict_data
+        return copy(self.checked_predict_data)
+
+    @staticmethod
+    def _is_same_data(data, other_data) -> bool:
+        if isinstance(data, tuple) and isinstance(other_data, tuple):
+            return len(data) == len(other_data) and all(
+                element is other_element for element, other_element in zip(data, other_data))
+        return data is other_data
+
     def predict(self,
                 predict_data: tuple,
                 predict_mode: str = 'default',
@@ -220,13 +261,7 @@ class FedotIndustrial(Fedot):
             the array with prediction values
 
         """
-        self.predict_data = deepcopy(
-            predict_data)  # we do not want to make inplace changes
-        self.predict_data = DataCheck(
-            input_data=self.predict_data,
-            task=self.config_dict['problem'],
-            task_params=self.task_params,
-            industrial_task_params=self.industrial_strategy_params).check_input_data()
+        self.predict_data = self._check_predict_data(predict_data)
         if self.industrial_strategy is not None and not self.is_finetuned:
             if predict_mode == 'ensemble':
                 predict = self.industrial_strategy_class.predict(
@@ -278,13 +313,7 @@ class FedotIndustrial(Fedot):
             the array with prediction probabilities
 
         """
-        self.predict_data = deepcopy(
-            predict_data)  # we do not want to make inplace changes
-        self.predict_data = DataCheck(
-            input_data=self.predict_data,
-            task=self.config_dict['problem'],
-            task_params=self.task_params,
-            industrial_task_params=self.industrial_strategy_params).check_input_data()
+        self.predict_data = self._check_predict_data(predict_data)
         if self.industrial_strategy is not None and not self.is_finetuned:
             predict = self.industrial_strategy_class.predict(
                 self.predict_data, 'probs')
@@ -306,6 +335,41 @@ class FedotIndustrial(Fedot):
         self.predicted_probs = predict
         return self.predicted_probs
 
+    def predict_all(self,
+                    predict_data: tuple,
+                    predict_mode: str = 'default',
+                    return_features: bool = False,
+                    **kwargs) -> dict:
+        """
+        Method to obtain prediction labels and probabilities from one execution of trained Industrial model.
+        Feature generators of the pipeline run once, only the final model predicts twice.
+
+        Args:
+            predict_data: tuple with test_features and test_target
+            predict_mode: ``default='default'``. Defines the mode of prediction. Could be 'default' or 'ensemble'.
+            return_features: if True, features passed to the final model are returned too
+
+        Returns:
+            dict with ``labels``, ``probs`` (None for not classification problems) and ``features``
+            (if requested, dict keyed by names of the nodes generating them)
+
+        """
+        with reuse_node_predictions(self._get_current_pipeline()) as features:
+            predictions = {'labels': self.predict(predict_data, predict_mode),
+                           'probs': None}
+            if self.config_dict['problem'] == 'classification':
+                predictions['probs'] = self.predict_proba(predict_data, predict_mode)
+        if return_features:
+            predictions['features'] = features
+        return predictions
+
+    def _get_current_pipeline(self):
+        if self.industrial_strategy is not None and not self.is_finetuned:
+            return None
+        if self.condition_check.solver_is_fedot_class(self.solver):
+            return self.solver.current_pipeline
+        return self.solver if isinstance(self.solver, Pipeline) else None
+
     def finetune(self,
                  train_data,
                  tuning_params=None,
@@ -320,6 +384,8 @@ class FedotIndustrial(Fedot):
                 mode: str, ``default='head'``. Defines the mode of fine-tuning. Could be 'full' or 'head'.
 
             """
+        from fedot_ind.core.repository.industrial_implementations.abstract import build_tuner
+
         if not self.condition_check.input_data_is_fedot_type(train_data):
             input_preproc = DataCheck(input_data=train_data,
                                       task=self.config_dict['problem'],
@@ -372,6 +438,7 @@ class FedotIndustrial(Fedot):
                     target: Union[list, np.array] = None,
                     metric_names: tuple = ('f1', 'roc_auc', 'accuracy'),
                     rounding_order: int = 3,
+                    predict_data: tuple = None,
                     **kwargs) -> pd.DataFrame:
         """
         Method to calculate metrics for Industrial model.
@@ -385,15 +452,25 @@ class FedotIndustrial(Fedot):
             target: target values
             metric_names: list of metric names
             rounding_order: rounding order for metrics
+            predict_data: tuple with test_features and test_target. If passed, labels and probabilities
+                are predicted for it with ``predict_all()``. Otherwise results of the last prediction are used,
+                missing probabilities are predicted for the last prediction data only if metrics based
+                on them (e.g. 'roc_auc') are requested.
 
         Returns:
             pandas DataFrame with calculated metrics
 
         """
         problem = self.config_dict['problem']
-        if problem == 'classification' and self.predicted_probs is None and 'roc_auc' in metric_names:
-            self.logger.info(
-                'Predicted probabilities are not available. Use `predict_proba()` method first')
+        if predict_data is not None:
+            self.predict_all(predict_data)
+        if problem == 'classification' and self.predicted_probs is None and \
+                any(metric in PROBABILITY_METRICS for metric in metric_names):
+            if self.predict_data is not None and not isinstance(self.predicted_labels, dict):
+                self.predict_proba(self.predict_data)
+            else:
+                self.logger.info(
+                    'Predicted probabilities are not available. Use `predict_proba()` method first')
         if isinstance(self.predicted_probs, dict):
             metric_dict = {
                 strategy: self._metric_evaluation_loop(
@@ -449,6 +526,8 @@ class FedotIndustrial(Fedot):
             path (str): path to the model
 
         """
+        from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+
         self.repo = IndustrialModels().setup_repository()
         if not path.__contains__('pipeline_saved'):
             dir_list = os.listdir(path)
@@ -499,6 +578,7 @@ class FedotIndustrial(Fedot):
                          See the function implementation for detailed information on
                          supported arguments.
         """
+        from fedot_ind.tools.explain.explain import PointExplainer
 
         methods = {'point': PointExplainer,
                    'shap': NotImplementedError,
@@ -525,6 +605,9 @@ class FedotIndustrial(Fedot):
                                  mode: str = 'all',
                                  return_history: bool = False):
         """ The function runs visualization of the composing history and the best pipeline. """
+        import matplotlib
+        from fedot.core.visualisation.pipeline_specific_visuals import PipelineHistoryVisualizer
+
         # Gather pipeline and history.
         matplotlib.use('TkAgg')
         if isinstance(opt_history_path, str):
@@ -562,6 +645,8 @@ class FedotIndustrial(Fedot):
             synthetic time series data.
 
         """
+        from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
+
         return TimeSeriesGenerator(ts_config).get_ts()
 
     @staticmethod
@@ -582,6 +667,7 @@ class FedotIndustrial(Fedot):
             returns initial time series data, modified time series data and dict with anomaly intervals.
 
         """
+        from fedot_ind.tools.synthetic.anomaly_generator import AnomalyGenerator
 
         generator = AnomalyGenerator(config=anomaly_config)
         init_synth_ts, mod_synth_ts, synth_inters = generator.generate(
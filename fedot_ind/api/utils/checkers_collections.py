@@ -46,8 +46,11 @@ class DataCheck:
         multi_features, X = check_multivariate_data(X)
         multi_target = len(y.shape) > 1 and y.shape[1] > 2
 
-        if multi_features:
-            features = np.array(X.tolist()).astype(float)
+        if multi_features and X.dtype != object:
+            features = np.asarray(X, dtype=float)
+        elif multi_features:
+            # nested pandas input, series of every cell are unpacked once
+            features = np.array(X.tolist(), dtype=float)
         else:
             features = X
 
@@ -127,14 +130,14 @@ class DataCheck:
     def _check_input_data_features(self):
         """Checks and preprocesses the features in the input data.
 
-        - Replaces NaN and infinite values with 0.
+        - Replaces NaN and infinite values with 0. Features are copied only if there are such values.
         - Converts features to torch format using NumpyConverter.
 
         """
-        self.input_data.features = np.where(
-            np.isnan(self.input_data.features), 0, self.input_data.features)
-        self.input_data.features = np.where(
-            np.isinf(self.input_data.features), 0, self.input_data.features)
+        is_finite = np.isfinite(self.input_data.features)
+        if not is_finite.all():
+            self.input_data.features = np.where(
+                is_finite, self.input_data.features, 0)
         if self.task != 'ts_forecasting':
             self.input_data.features = NumpyConverter(
                 data=self.input_data.features).convert_to_torch_format()
@@ -154,7 +157,11 @@ class DataCheck:
         elif self.task == 'regression':
             self.input_data.target = self.input_data.target.squeeze()
         elif self.task == 'classification':
-            self.input_data.target[self.input_data.target == -1] = 0
+            # target may be a view of the user's array, so it is not changed inplace
+            negative_labels = self.input_data.target == -1
+            if np.any(negative_labels):
+                self.input_data.target = np.where(
+                    negative_labels, 0, self.input_data.target)
 
     def check_available_operations(self, available_operations):
         pass
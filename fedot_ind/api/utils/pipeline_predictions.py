@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from copy import copy
+from typing import Optional
+
+from fedot.core.pipelines.pipeline import Pipeline
+
+
+@contextmanager
+def reuse_node_predictions(pipeline: Optional[Pipeline]):
+    """Context manager in which every node of the pipeline except the root computes its prediction once.
+    Repeated predictions of the pipeline on the same data (e.g. for labels and for probabilities) run
+    feature generators only for the first of them and differ by the root node only.
+
+    Args:
+        pipeline: fitted pipeline. If None, nothing is cached.
+
+    Yields:
+        dict with outputs of the nodes, which are inputs of the root node, keyed by node name.
+
+    """
+    root_inputs = {}
+    if pipeline is None:
+        yield root_inputs
+        return
+    nodes = [node for node in pipeline.nodes if node is not pipeline.root_node]
+    parents_of_root = pipeline.root_node.nodes_from or []
+    for node in nodes:
+        is_parent_of_root = any(node is parent for parent in parents_of_root)
+        node.predict = _cached_predict(node, root_inputs if is_parent_of_root else None)
+    try:
+        yield root_inputs
+    finally:
+        for node in nodes:
+            del node.predict
+
+
+def _cached_predict(node, root_inputs: Optional[dict]):
+    node_predict = node.predict
+    predictions = {}
+
+    def predict(input_data, output_mode: str = 'default'):
+        if output_mode not in predictions:
+            predictions[output_mode] = node_predict(input_data, output_mode)
+            if root_inputs is not None:
+                name = node.name if node.name not in root_inputs else f'{node.name}_{len(root_inputs)}'
+                root_inputs[name] = predictions[output_mode].predict
+        # consumers may reassign attributes of the output
+        return copy(predictions[output_mode])
+
+    return predict
@@ -1,12 +1,10 @@
-from weakref import WeakValueDictionary
-
-from distributed import Client, LocalCluster
 from fedot.core.data.data import InputData
 from fedot.core.repository.dataset_types import DataTypesEnum
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import CustomDatasetCLF, CustomDatasetTS, DataConverter, \
     TensorConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.repository.constanst_repository import DASK_CLUSTER_PARAMS
 
 
 def fedot_data_type(func):
@@ -102,7 +100,7 @@ def convert_to_input_data(func):
 
 
 class Singleton(type):
-    _instances = WeakValueDictionary()
+    _instances = {}
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
@@ -112,12 +110,54 @@ class Singleton(type):
 
 
 class DaskServer(metaclass=Singleton):
+    """Dask client shared by parallel parts of Industrial. Nothing is started until the first instantiation,
+    so runs which never evaluate in parallel don't pay for cluster startup. The server is kept alive between
+    fits until ``shutdown`` is called.
+
+    Parameters of the cluster are set with ``configure``. If ``address`` is given, client is attached to
+    the running scheduler, otherwise in-process ``LocalCluster`` is started with ``n_workers``,
+    ``threads_per_worker``, ``memory_limit`` and ``processes``.
+
+    """
+    cluster_params = DASK_CLUSTER_PARAMS
+
     def __init__(self):
-        print('Creating Dask Server')
-        cluster = LocalCluster(processes=False,
-                               # n_workers=4,
-                               # threads_per_worker=4,
-                               # memory_limit='3GB'
-                               )
-        # connect client to your cluster
-        self.client = Client(cluster)
+        from distributed import Client, LocalCluster
+
+        params = dict(self.cluster_params)
+        address = params.pop('address')
+        if address is not None:
+            print(f'Connecting to Dask Server {address}')
+            self.cluster = None
+            self.client = Client(address)
+        else:
+            print('Creating Dask Server')
+            self.cluster = LocalCluster(**params)
+            # connect client to your cluster
+            self.client = Client(self.cluster)
+
+    @classmethod
+    def configure(cls, **cluster_params):
+        """Sets parameters of the cluster, missing ones are taken from ``DASK_CLUSTER_PARAMS``.
+        Running server with other parameters is shut down and restarted on next use."""
+        unknown_params = set(cluster_params) - set(DASK_CLUSTER_PARAMS)
+        if unknown_params:
+            raise ValueError(
+                f'Unknown Dask cluster parameters {sorted(unknown_params)}. Use {list(DASK_CLUSTER_PARAMS)}')
+        cluster_params = {**DASK_CLUSTER_PARAMS, **cluster_params}
+        if cluster_params != cls.cluster_params:
+            cls.shutdown()
+            cls.cluster_params = cluster_params
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls in Singleton._instances
+
+    @classmethod
+    def shutdown(cls):
+        """Closes the client and the local cluster. Attached scheduler is left running."""
+        server = Singleton._instances.pop(cls, None)
+        if server is not None:
+            server.client.close()
+            if server.cluster is not None:
+                server.cluster.close()
@@ -1,9 +1,17 @@
+import os
 from functools import partial
+from typing import Iterable, Iterator, Union
+
 import pandas as pd
 from pymonad.list import ListMonad
 from pymonad.either import Right
 from fedot_ind.core.architecture.pipelines.abstract_pipeline import AbstractPipeline
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.detection.probalistic.kalman import LocalLevelKalmanFilter
+from fedot_ind.core.models.detection.subspaces.func_pca import FunctionalPCA
+from fedot_ind.core.models.detection.subspaces.sst import SingularSpectrumTransformation
 from fedot_ind.core.operation.transformation.basis.eigen_basis import EigenBasisImplementation
+from fedot_ind.core.repository.constanst_repository import STREAMING_DETECTOR_PARAMS
 
 
 class AnomalyDetectionPipelines(AbstractPipeline):
@@ -138,3 +146,76 @@ class AnomalyDetectionPipelines(AbstractPipeline):
 
     def __vector_based_pipeline(self):
         pass
+
+
+def read_chunks(source: Union[str, os.PathLike, np.ndarray, Iterable[np.ndarray]],
+                chunk_size: int = 1024) -> Iterator[np.ndarray]:
+    """Yields consecutive chunks of a time series. Path to ``.npy`` file is opened as memory map,
+    so only the current chunk is read from disk.
+
+    Args:
+        source: iterable of chunks, array (including ``np.memmap``) or path to ``.npy`` file.
+        chunk_size: number of samples in a chunk for array sources.
+
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = np.load(source, mmap_mode='r')
+    if isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_size):
+            yield source[start:start + chunk_size]
+    else:
+        yield from source
+
+
+class StreamingAnomalyDetection:
+    """Streaming counterpart of ``AnomalyDetectionPipelines``. Scores are yielded chunk by chunk and
+    everything the detector needs between chunks is kept inside of it: Hankel history for SST,
+    the fitted basis and the unfinished window for functional PCA, state and covariance for Kalman filter.
+    Memory depends on window size only, not on the length of the signal.
+
+    Args:
+        pipeline_type: ``'SST'``, ``'FunctionalPCA'`` or ``'Kalman'``.
+        model_hyperparams: hyperparameters of the detector. Missing ones are taken from
+            ``STREAMING_DETECTOR_PARAMS`` of the pipeline type. ``window_length`` and ``step`` set windows
+            for functional PCA.
+        chunk_size: number of samples in a chunk for array and file sources.
+
+    Example:
+        To score a recording stored on disk::
+
+            detector = StreamingAnomalyDetection('Kalman').fit(train_series)
+            for scores in detector.score('recording.npy'):
+                print(scores.max())
+
+    """
+
+    def __init__(self, pipeline_type: str = 'SST', model_hyperparams: dict = None, chunk_size: int = 1024):
+        detector_dict = {'SST': SingularSpectrumTransformation,
+                         'FunctionalPCA': FunctionalPCA,
+                         'Kalman': LocalLevelKalmanFilter}
+        if pipeline_type not in detector_dict:
+            raise ValueError(
+                f'Streaming is not supported for {pipeline_type}. Use one of {list(detector_dict)}')
+        self.pipeline_type = pipeline_type
+        self.model_hyperparams = {**STREAMING_DETECTOR_PARAMS[pipeline_type], **(model_hyperparams or {})}
+        self.chunk_size = chunk_size
+        self.window_length = self.model_hyperparams.get('window_length')
+        self.step = self.model_hyperparams.get('step', None)
+        self.detector = detector_dict[pipeline_type](self.model_hyperparams)
+
+    def fit(self, train_features: np.ndarray = None):
+        """Fits detector on the train series. SST compares windows of the stream itself and doesn't need it."""
+        if self.pipeline_type == 'FunctionalPCA':
+            windows = np.lib.stride_tricks.sliding_window_view(
+                np.asarray(train_features, dtype=float).ravel(), self.window_length)
+            self.detector.fit(windows[::self.step or 1])
+        elif self.pipeline_type == 'Kalman':
+            self.detector.fit(train_features)
+        return self
+
+    def score(self, source: Union[str, os.PathLike, np.ndarray, Iterable[np.ndarray]]) -> Iterator[np.ndarray]:
+        """Yields anomaly scores for every chunk of the source, see ``read_chunks``."""
+        chunks = read_chunks(source, self.chunk_size)
+        if self.pipeline_type == 'FunctionalPCA':
+            return self.detector.score_stream(chunks, self.window_length, self.step)
+        return self.detector.score_stream(chunks)
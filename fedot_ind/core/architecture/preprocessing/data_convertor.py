@@ -1,3 +1,6 @@
+import os
+import tempfile
+import weakref
 from functools import partial
 from inspect import signature
 
@@ -34,9 +37,24 @@ class CustomDatasetTS:
 
 
 class CustomDatasetCLF:
-    def __init__(self, ts):
-        self.x = torch.from_numpy(ts.features).to(default_device()).float()
-        if ts.task.task_type.value == 'classification':
+    """Torch dataset for classification and regression models.
+
+    Args:
+        ts: input data with features of shape (n_samples, n_channels, length).
+        lazy: if True, features and targets stay in numpy and each sample is converted to tensor
+            (and one-hot encoded) on access, so conversion runs batch by batch inside of DataLoader workers.
+            Otherwise the whole dataset is converted and moved to ``default_device()`` at once.
+
+    """
+
+    def __init__(self, ts, lazy: bool = False):
+        self.lazy = lazy
+        self.is_classification = ts.task.task_type.value == 'classification'
+        if lazy:
+            self.x = ts.features
+        else:
+            self.x = torch.from_numpy(ts.features).to(default_device()).float()
+        if self.is_classification:
             label_1 = max(ts.class_labels)
             label_0 = min(ts.class_labels)
             self.classes = ts.num_classes
@@ -54,18 +72,26 @@ class CustomDatasetCLF:
             else:
                 self.label_encoder = None
 
-            try:
-                self.y = torch.nn.functional.one_hot(
-                    torch.from_numpy(
-                        ts.target).long(),
-                    num_classes=self.classes).to(
-                    default_device()).squeeze(1)
-            except Exception:
-                self.y = torch.nn.functional.one_hot(torch.from_numpy(
-                    ts.target).long()).to(default_device()).squeeze(1)
-                self.classes = self.y.shape[1]
+            if lazy:
+                self.y = np.asarray(ts.target).astype(int)
+                if self.y.max() >= self.classes:
+                    self.classes = int(self.y.max()) + 1
+            else:
+                try:
+                    self.y = torch.nn.functional.one_hot(
+                        torch.from_numpy(
+                            ts.target).long(),
+                        num_classes=self.classes).to(
+                        default_device()).squeeze(1)
+                except Exception:
+                    self.y = torch.nn.functional.one_hot(torch.from_numpy(
+                        ts.target).long()).to(default_device()).squeeze(1)
+                    self.classes = self.y.shape[1]
         else:
-            self.y = torch.from_numpy(ts.target).to(default_device()).float()
+            if lazy:
+                self.y = ts.target
+            else:
+                self.y = torch.from_numpy(ts.target).to(default_device()).float()
             self.classes = 1
             self.label_encoder = None
 
@@ -73,12 +99,59 @@ class CustomDatasetCLF:
         self.supplementary_data = ts.supplementary_data
 
     def __getitem__(self, index):
-        return self.x[index], self.y[index]
+        if not self.lazy:
+            return self.x[index], self.y[index]
+        x = torch.from_numpy(np.array(self.x[index], dtype=np.float32))
+        if not self.is_classification:
+            return x, torch.from_numpy(np.asarray(self.y[index], dtype=np.float32))
+        y = torch.nn.functional.one_hot(torch.as_tensor(self.y[index]).long(),
+                                        num_classes=self.classes).reshape(-1)
+        return x, y
 
     def __len__(self):
         return self.n_samples
 
 
+class MemmapDatasetCLF(CustomDatasetCLF):
+    """Lazy ``CustomDatasetCLF`` with features in a memory-mapped ``.npy`` file. Samples are read from disk
+    on access, so the dataset doesn't keep features in memory and DataLoader workers share the page cache
+    instead of copies of the array.
+
+    Args:
+        ts: input data with features of shape (n_samples, n_channels, length).
+        path: path to ``.npy`` file for features. If None, temporary file is created and removed
+            together with the dataset.
+        chunk_size: number of samples written to the file at once, so features are never copied
+            to memory as a whole.
+
+    """
+
+    def __init__(self, ts, path: str = None, chunk_size: int = 1024):
+        super().__init__(ts, lazy=True)
+        if path is None:
+            file_descriptor, path = tempfile.mkstemp(suffix='.npy')
+            os.close(file_descriptor)
+            weakref.finalize(self, os.remove, path)
+        features = ts.features
+        x = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=tuple(features.shape))
+        for start in range(0, x.shape[0], chunk_size):
+            x[start:start + chunk_size] = np.asarray(features[start:start + chunk_size], dtype=np.float32)
+        x.flush()
+        del x
+        self.path = path
+        self.x = np.load(self.path, mmap_mode='r')
+
+    def __getstate__(self):
+        # workers started with spawn get the path and open the file themselves
+        state = self.__dict__.copy()
+        state['x'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.x = np.load(self.path, mmap_mode='r')
+
+
 class FedotConverter:
     def __init__(self, data):
         self.input_data = self.convert_to_input_data(data)
@@ -217,7 +290,19 @@ class FedotConverter:
 
 class TensorConverter:
     def __init__(self, data):
-        self.tensor_data = self.convert_to_tensor(data)
+        self._tensor_source = data
+        self._tensor_data = None
+
+    @property
+    def tensor_data(self):
+        # conversion of nested pandas data is expensive, so it is done on the first access only
+        if self._tensor_data is None:
+            self._tensor_data = self.convert_to_tensor(self._tensor_source)
+        return self._tensor_data
+
+    @tensor_data.setter
+    def tensor_data(self, tensor_data):
+        self._tensor_data = tensor_data
 
     def convert_to_tensor(self, data):
         if isinstance(data, tuple):
@@ -269,10 +354,9 @@ class TensorConverter:
 class NumpyConverter:
     def __init__(self, data):
         self.numpy_data = self.convert_to_array(data)
-        self.numpy_data = np.where(
-            np.isnan(self.numpy_data), 0, self.numpy_data)
-        self.numpy_data = np.where(
-            np.isinf(self.numpy_data), 0, self.numpy_data)
+        is_finite = np.isfinite(self.numpy_data)
+        if not is_finite.all():
+            self.numpy_data = np.where(is_finite, self.numpy_data, 0)
 
     def convert_to_array(self, data):
         if isinstance(data, tuple):
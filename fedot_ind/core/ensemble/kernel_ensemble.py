@@ -2,6 +2,7 @@ from copy import deepcopy
 from typing import Optional, Any
 
 import pandas as pd
+from MKLpy import algorithms as mkl_algorithms
 from MKLpy.callbacks import EarlyStopping
 from MKLpy.scheduler import ReduceOnWorsening
 from fedot.core.data.data import InputData
@@ -146,7 +147,8 @@ class KernelEnsembler(BaseExtractor):
         return KLtr
 
     def __one_stage_kernel(self, grammian_list, target):
-        mkl = KERNEL_ALGO[self.kernel_strategy](
+        mkl_algorithm = getattr(mkl_algorithms, KERNEL_ALGO[self.kernel_strategy])
+        mkl = mkl_algorithm(
             multiclass_strategy=self.multiclass_strategy).fit(grammian_list, target)
         kernel_weight_matrix = self.__convert_weights(mkl)
         return kernel_weight_matrix
@@ -160,11 +162,12 @@ class KernelEnsembler(BaseExtractor):
             metric=self.optimisation_metric,  # the metric we monitor
         )
 
-        mkl = KERNEL_ALGO[self.kernel_strategy](multiclass_strategy='ovr',
-                                                max_iter=self.epoch,
-                                                learner=SVC(C=1000),
-                                                learning_rate=self.lr,
-                                                callbacks=[earlystop],
-                                                scheduler=ReduceOnWorsening()).fit(grammian_list, target)
+        mkl_algorithm = getattr(mkl_algorithms, KERNEL_ALGO[self.kernel_strategy])
+        mkl = mkl_algorithm(multiclass_strategy='ovr',
+                            max_iter=self.epoch,
+                            learner=SVC(C=1000),
+                            learning_rate=self.lr,
+                            callbacks=[earlystop],
+                            scheduler=ReduceOnWorsening()).fit(grammian_list, target)
         kernel_weight_matrix = self.__convert_weights(mkl)
         return kernel_weight_matrix
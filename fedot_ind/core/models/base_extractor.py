@@ -14,7 +14,9 @@ from fedot_ind.core.architecture.abstraction.decorators import convert_to_input_
 from fedot_ind.core.metrics.metrics_implementation import *
 from fedot_ind.core.operation.IndustrialCachableOperation import IndustrialCachableOperationImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
-from fedot_ind.core.repository.constanst_repository import STAT_METHODS, STAT_METHODS_GLOBAL
+from fedot_ind.core.models.quantile.batch_stat_features import apply_along_last_axis
+from fedot_ind.core.repository.constanst_repository import BATCH_STAT_METHODS, BATCH_STAT_METHODS_GLOBAL, \
+    STAT_METHODS, STAT_METHODS_GLOBAL
 
 
 class BaseExtractor(IndustrialCachableOperationImplementation):
@@ -61,7 +63,11 @@ class BaseExtractor(IndustrialCachableOperationImplementation):
                             verbose=0, pre_dispatch="2*n_jobs")
         feature_matrix = parallel(delayed(self.generate_features_from_ts)(
             sample) for sample in input_data.features)
+        return self._stack_feature_matrix(feature_matrix)
 
+    def _stack_feature_matrix(self, feature_matrix: list) -> np.array:
+        """Stacks features of separate samples into a single feature matrix
+        """
         if len(feature_matrix[0].features.shape) > 1:
             stacked_data = np.stack([ts.features for ts in feature_matrix])
             self.predict = self._clean_predict(stacked_data)
@@ -116,6 +122,33 @@ class BaseExtractor(IndustrialCachableOperationImplementation):
             names.append(method[0])
         return features, names
 
+    @staticmethod
+    def get_batch_statistical_features(time_series: np.ndarray,
+                                       add_global_features: bool = False) -> tuple:
+        """
+        Method for creating baseline quantile features for a batch of time series in one pass.
+
+        Args:
+            add_global_features: if True, global features are added to the feature set
+            time_series: array of shape ``(..., length)``, statistics are computed over the last axis
+
+        Returns:
+            tuple: array of shape ``(..., n_features)`` and list of feature names
+
+        """
+        if add_global_features:
+            methods, batch_methods = STAT_METHODS_GLOBAL, BATCH_STAT_METHODS_GLOBAL
+        else:
+            methods, batch_methods = STAT_METHODS, BATCH_STAT_METHODS
+
+        features = []
+        for name, method in methods.items():
+            if name in batch_methods:
+                features.append(batch_methods[name](time_series))
+            else:
+                features.append(apply_along_last_axis(method, time_series))
+        return np.stack(features, axis=-1).astype(float), list(methods.keys())
+
     @convert_to_input_data
     def apply_window_for_stat_feature(self, ts_data: np.array,
                                       feature_generator: callable,
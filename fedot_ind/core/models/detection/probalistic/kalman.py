@@ -3,7 +3,10 @@ from copy import deepcopy
 from functools import partial
 from math import log
 
+from typing import Iterable, Iterator
+
 from numpy import dot, eye, zeros
+from scipy.signal import lfilter
 from sklearn.preprocessing import MinMaxScaler
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
@@ -452,3 +455,70 @@ class UnscentedKalmanFilter(AbstractKalmanFilter):
             dz = np.subtract(sigmas_h[i], z)
             Pxz += self.sigma_distribution.Wc[i] * np.outer(dx, dz)
         return Pxz
+
+
+class LocalLevelKalmanFilter:
+    """Linear Kalman filter of the local level model ``z_t = x_t + v_t``, ``x_t = x_{t-1} + w_t`` for online
+    anomaly scoring. Variances of process and measurement noise are estimated from the train series and the filter
+    works with the steady-state gain, so filtering of a whole chunk is a single first-order recursive filter.
+    State mean is carried between chunks, covariance stays at its steady-state value.
+
+    Parameters:
+        model_hyperparams:
+                        process_uncertainty: variance of ``w_t``. Estimated from train data if not set.
+                        measurement_uncertainty: variance of ``v_t``. Estimated from train data if not set.
+
+    """
+
+    def __init__(self, model_hyperparams: dict = None):
+        model_hyperparams = {} if model_hyperparams is None else model_hyperparams
+        self.process_uncertainty = model_hyperparams.get('process_uncertainty')  # Q
+        self.measurement_uncertainty = model_hyperparams.get('measurement_uncertainty')  # R
+        self.state = None  # x
+        self.uncertainty_covariance = None  # P
+        self.system_uncertainty = None  # S
+        self.kalman_gain = None  # K
+
+    def fit(self, train_features: np.ndarray):
+        train_features = np.asarray(train_features, dtype=float).ravel()
+        # increments of local level series have variance Q + 2R and lag one autocovariance -R
+        increments = np.diff(train_features)
+        increments = increments - np.mean(increments)
+        eps = np.finfo(float).eps
+        if self.measurement_uncertainty is None:
+            self.measurement_uncertainty = max(-np.mean(increments[1:] * increments[:-1]), eps)
+        if self.process_uncertainty is None:
+            self.process_uncertainty = max(np.var(increments) - 2 * self.measurement_uncertainty, eps)
+        # steady-state solution of the Riccati equation for the prior covariance
+        q, r = self.process_uncertainty, self.measurement_uncertainty
+        prior_covariance = (q + np.sqrt(q ** 2 + 4 * q * r)) / 2
+        self.system_uncertainty = prior_covariance + r
+        self.kalman_gain = prior_covariance / self.system_uncertainty
+        self.uncertainty_covariance = (1 - self.kalman_gain) * prior_covariance
+        self.state = train_features[0]
+        for _ in self.score_stream([train_features]):
+            pass
+        return self
+
+    def score_stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Online anomaly scoring of a time series which arrives in chunks.
+
+        Args:
+            chunks: iterable of consecutive 1D chunks of the time series.
+
+        Yields:
+            absolute innovations of every sample normalized by their standard deviation.
+
+        """
+        # x_t = (1 - K) x_{t-1} + K z_t
+        numerator, denominator = [self.kalman_gain], [1, self.kalman_gain - 1]
+        for chunk in chunks:
+            measurements = np.asarray(chunk, dtype=float).ravel()
+            if measurements.size == 0:
+                yield np.empty(0)
+                continue
+            states, _ = lfilter(numerator, denominator, measurements,
+                                zi=[(1 - self.kalman_gain) * self.state])
+            prior_states = np.concatenate([[self.state], states[:-1]])
+            self.state = states[-1]
+            yield np.abs(measurements - prior_states) / np.sqrt(self.system_uncertainty)
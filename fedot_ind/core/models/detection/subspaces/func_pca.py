@@ -1,3 +1,5 @@
+from typing import Iterable, Iterator
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from scipy.linalg import solve_triangular
 from sklearn.decomposition import PCA
@@ -202,6 +204,37 @@ class FunctionalPCA:
             input_data=test_features, predicted_data=recover)
         return recover, outlier_idx
 
+    def score_stream(self,
+                     chunks: Iterable[np.ndarray],
+                     window_length: int,
+                     step: int = None) -> Iterator[np.ndarray]:
+        """Online anomaly scoring of a time series which arrives in chunks with the fitted basis.
+        Windows of the series are projected on the principal components and scored by the norm of
+        reconstruction error. Only samples of the unfinished window are kept between chunks.
+
+        Args:
+            chunks: iterable of consecutive 1D chunks of the time series.
+            window_length: length of the windows the basis was fitted on.
+            step: step between windows. Defaults to ``window_length``.
+
+        Yields:
+            scores of windows which end inside of the chunk.
+
+        """
+        step = window_length if step is None else step
+        buffer = np.empty(0)
+        for chunk in chunks:
+            buffer = np.concatenate([buffer, np.asarray(chunk, dtype=float).ravel()])
+            n_windows = (buffer.size - window_length) // step + 1 if buffer.size >= window_length else 0
+            if n_windows == 0:
+                yield np.empty(0)
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(buffer, window_length)[::step][:n_windows]
+            # mean of the train data is used, so scores don't depend on the chunk
+            recover = self.inverse_transform(self._transform_basis(windows - self.mean_))
+            yield np.linalg.norm(windows - recover, axis=1)
+            buffer = buffer[n_windows * step:]
+
     def fit_transform(
             self,
             X: np.array,
@@ -1,3 +1,5 @@
+from typing import Iterable, Iterator
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from sklearn.preprocessing import MinMaxScaler
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
@@ -128,6 +130,11 @@ class SingularSpectrumTransformation:
                             functional principal component analysis. Defaults to 3.
                         window_length: Regularization object to be applied.
                         trajectory_window_length: .
+                        delay_lag: shift between history and test windows, at least 1.
+                            Defaults to half of window_length.
+                        online_mode: if True, scores are computed with the streaming engine, see ``score_stream``.
+                        chunk_size: number of samples processed at once in online mode and number of windows scored
+                            at once in offline mode. Defaults to 1024.
     Attributes:
 
     """
@@ -140,9 +147,14 @@ class SingularSpectrumTransformation:
             self.trajectory_window_length = model_hyperparams['trajectory_window_length']
             self.dynamic_mode = model_hyperparams['dynamic_mode']
             self.lag = model_hyperparams['delay_lag']
+            self.online_mode = model_hyperparams.get('online_mode', False)
+            self.chunk_size = model_hyperparams.get('chunk_size', 1024)
 
         if self.lag is None:
             self.lag = np.round(self.window_length / 2)
+        if int(self.lag) < 1:
+            # history and test windows must not coincide, and static mode takes test windows of lag samples
+            raise ValueError(f'Delay lag must be at least 1, got {self.lag}')
         if self.n_components is None:
             self.n_components = 2
 
@@ -151,8 +163,9 @@ class SingularSpectrumTransformation:
             .fit_transform(time_series.reshape(-1, 1))[:, 0]
         return time_series_scaled
 
-    def fit(self, train_features: np.ndarray) -> list:
-        if len(train_features) > 1:
+    def fit(self, train_features: np.ndarray) -> tuple:
+        train_features = np.asarray(train_features)
+        if train_features.ndim > 1:
             list_of_history, list_of_current = [], []
             for time_series in train_features:
                 history_state, current_state = self._fit(
@@ -163,45 +176,44 @@ class SingularSpectrumTransformation:
         else:
             return self._fit(train_features=train_features)
 
-    def _fit(self, train_features: np.ndarray) -> list:
-        """Core implementation of offline score calculation.
+    def _fit(self, train_features: np.ndarray) -> tuple:
+        """Core implementation of offline score calculation. Trajectory matrices of all windows are built at once
+        as read-only views over the time series, so no data is copied.
 
         Args:
             self.dynamic_mode: mode for SST metrics calculation.
             train_features: input 1D time series data.
 
         Returns
-            score: 1d array change point score with 1 and 0 if view True.
+            history and test trajectory matrices of shape (n_windows, rows, columns).
 
         """
-        train_features = np.array(train_features)
-        start_idx, end_idx = self.window_length + self.lag + 1, train_features.size + 1
-        test_features = []
+        train_features = np.asarray(train_features)
+        if self.online_mode:
+            # scores are computed from the time series itself in predict
+            return None, train_features
+        lag = int(self.lag)
+        start_idx, end_idx = self.window_length + lag + 1, train_features.size + 1
+        n_windows = end_idx - start_idx
         if self.dynamic_mode:
-            self.model = []
-            for t in range(start_idx, end_idx):
-                start_idx_hist, end_idx_hist = t - self.window_length - self.lag, t - self.lag
-                start_idx_test, end_idx_test = t - self.window_length, t
-                x_history = HankelMatrix(time_series=train_features[start_idx_hist:end_idx_hist],
-                                         window_length=self.trajectory_window_length)
-                x_test = HankelMatrix(time_series=train_features[start_idx_test:end_idx_test],
-                                      window_length=self.trajectory_window_length)
-                self.model.append(x_history)
-                test_features.append(x_test)
-
+            # test window ends at t and history window is shifted back by lag
+            windows = np.lib.stride_tricks.sliding_window_view(
+                train_features, self.window_length)
+            self.model = HankelMatrix.get_batch_trajectory_matrix(
+                windows[1:1 + n_windows], window_size=self.trajectory_window_length)[:, 0]
+            test_windows = windows[lag + 1:lag + 1 + n_windows]
         else:
-            self.model = HankelMatrix(time_series=train_features[:start_idx],
-                                      window_length=self.trajectory_window_length)
-            for t in range(start_idx, end_idx):
-                start_idx_test, end_idx_test = t - self.lag, t
-                x_test = HankelMatrix(time_series=train_features[start_idx_test:end_idx_test],
-                                      window_length=self.trajectory_window_length)
-                test_features.append(x_test)
+            self.model = HankelMatrix.get_batch_trajectory_matrix(
+                train_features[:start_idx], window_size=self.trajectory_window_length)[0, 0]
+            windows = np.lib.stride_tricks.sliding_window_view(train_features, lag)
+            test_windows = windows[start_idx - lag:start_idx - lag + n_windows]
+        test_features = HankelMatrix.get_batch_trajectory_matrix(
+            test_windows, window_size=self.trajectory_window_length)[:, 0]
 
         return self.model, test_features
 
-    def predict(self, test_features: list, target: list) -> list:
-        if len(test_features) > 1:
+    def predict(self, test_features, target):
+        if isinstance(test_features, list):
             residual_list = []
             for history_data, target_data in zip(test_features, target):
                 residual = self._predict(history_data, target_data)
@@ -212,36 +224,36 @@ class SingularSpectrumTransformation:
 
     def _predict(
             self,
-            test_features: HankelMatrix,
-            target: HankelMatrix) -> list:
-        """Core implementation of offline score calculation.
+            test_features: np.ndarray,
+            target: np.ndarray) -> np.ndarray:
+        """Core implementation of offline score calculation. Windows are scored with batched SVD in chunks
+        of ``chunk_size``, so only trajectory matrices of one chunk are materialized at once.
 
         Args:
             self.dynamic_mode: mode for SST metrics calculation.
-            _x: input 1D time series data.
+            test_features: history trajectory matrices obtained with fit.
+            target: test trajectory matrices obtained with fit.
 
         Returns
             score: 1d array change point score with 1 and 0 if view True.
-            :param target:
-            :param test_features:
 
         """
 
-        if self.dynamic_mode:
-            def dynamic_sst(trajectory_data_tuple): return self._sst_svd(
-                trajectory_data_tuple[0].trajectory_matrix,
-                trajectory_data_tuple[1].trajectory_matrix)
-            trajectory_data_tuple = list(zip(test_features, target))
-            score_list = list(map(dynamic_sst, trajectory_data_tuple))
-        else:
-            def static_sst(x_history): return self._sst_svd(
-                self.model.trajectory_matrix, x_history.trajectory_matrix)
-            score_list = list(map(static_sst, test_features))
+        if self.online_mode:
+            chunks = np.array_split(target, max(target.size // self.chunk_size, 1))
+            return np.concatenate(list(self.score_stream(chunks)))
+        # in static mode history is a single matrix which is broadcasted over all test windows
+        is_static = test_features.ndim == 2
+        score_list = np.concatenate([
+            self._sst_svd(test_features if is_static else test_features[start:start + self.chunk_size],
+                          target[start:start + self.chunk_size])
+            for start in range(0, max(target.shape[0], 1), self.chunk_size)])
         residual = np.diff(score_list)
         return residual
 
-    def _sst_svd(self, x_test: list = None, x_history: list = None) -> float:
-        """Singular value decomposition to count distance score between matrix
+    def _sst_svd(self, x_test: np.ndarray = None, x_history: np.ndarray = None):
+        """Singular value decomposition to count distance score between matrix. Stacks of matrices
+        of shape (n_windows, rows, columns) are supported and broadcasted.
 
         Args:
             x_test: current matrix of features
@@ -253,7 +265,80 @@ class SingularSpectrumTransformation:
         """
         u_test, s_test, _ = np.linalg.svd(x_test, full_matrices=False)
         u_history, s_hist, _ = np.linalg.svd(x_history, full_matrices=False)
-        s_cov = u_test[:, :self.n_components].T @ u_history[:,
-                                                            :self.n_components]
-        u_cov, s, _ = np.linalg.svd(s_cov, full_matrices=False)
-        return 1 - s[0]
+        return self._subspace_distance(u_test[..., :self.n_components], u_history[..., :self.n_components])
+
+    @staticmethod
+    def _subspace_distance(u_test: np.ndarray, u_history: np.ndarray) -> np.ndarray:
+        s = np.linalg.svd(np.swapaxes(u_test, -1, -2) @ u_history, compute_uv=False)
+        return 1 - s[..., 0]
+
+    def _window_subspaces(self, time_series: np.ndarray, window_length: int) -> np.ndarray:
+        """Leading left singular vectors of trajectory matrices of all windows of ``window_length`` in the series.
+        Covariance matrix of a window is the sum of outer products of its trajectory columns, so moving the window
+        by one step is a rank-one update plus a rank-one downdate. All of them are obtained at once as differences
+        of prefix sums, and subspaces come from a batched eigendecomposition of small (rows, rows) matrices
+        instead of SVD of every trajectory matrix.
+
+        Returns:
+            array of shape (n_windows, rows, n_components)
+
+        """
+        rows = HankelMatrix.get_window_length(window_length, self.trajectory_window_length) + 1
+        n_columns = window_length - rows + 1
+        columns = np.lib.stride_tricks.sliding_window_view(time_series, rows)
+        prefix = np.zeros((columns.shape[0] + 1, rows, rows))
+        np.cumsum(columns[:, :, np.newaxis] * columns[:, np.newaxis, :], axis=0, out=prefix[1:])
+        covariance = prefix[n_columns:] - prefix[:-n_columns]
+        _, eigenvectors = np.linalg.eigh(covariance)
+        return eigenvectors[..., ::-1][..., :self.n_components]
+
+    def score_stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Online change point scoring of a time series which arrives in chunks. Only the last window of samples
+        and subspaces of the last ``lag`` windows are kept between chunks, so memory does not depend on the length
+        of the stream. Concatenated outputs are equal to offline ``predict(*fit(time_series))``.
+
+        Args:
+            chunks: iterable of consecutive 1D chunks of the time series.
+
+        Yields:
+            scores of windows which end inside of the chunk.
+
+        """
+        lag = int(self.lag)
+        window_length = self.window_length if self.dynamic_mode else lag
+        start_idx = self.window_length + lag + 1
+        # in dynamic mode history subspace of a window is the subspace of the window lag steps before
+        first_end = self.window_length + 1 if self.dynamic_mode else start_idx
+        buffer, buffer_start = np.empty(0), 0
+        previous_subspaces, history_subspace, last_score = None, None, None
+        next_end = first_end
+        for chunk in chunks:
+            buffer = np.concatenate([buffer, np.asarray(chunk, dtype=float).ravel()])
+            buffer_end = buffer_start + buffer.size
+            if not self.dynamic_mode and history_subspace is None and buffer_end >= start_idx:
+                history = HankelMatrix.get_batch_trajectory_matrix(
+                    buffer[:start_idx - buffer_start], window_size=self.trajectory_window_length)[0, 0]
+                history_subspace = np.linalg.svd(history, full_matrices=False)[0][:, :self.n_components]
+            scores = np.empty(0)
+            if buffer_end >= next_end:
+                subspaces = self._window_subspaces(buffer[next_end - window_length - buffer_start:], window_length)
+                if self.dynamic_mode:
+                    if previous_subspaces is not None:
+                        subspaces = np.concatenate([previous_subspaces, subspaces])
+                    n_scored = max(buffer_end - max(next_end, start_idx) + 1, 0)
+                    if n_scored:
+                        scores = self._subspace_distance(subspaces[-n_scored:],
+                                                         subspaces[-n_scored - lag:subspaces.shape[0] - lag])
+                    previous_subspaces = subspaces[-lag:]
+                else:
+                    scores = self._subspace_distance(subspaces, history_subspace)
+                next_end = buffer_end + 1
+            if scores.size:
+                residual = np.diff(scores if last_score is None else np.concatenate([[last_score], scores]))
+                last_score = scores[-1]
+            else:
+                residual = scores
+            if history_subspace is not None or self.dynamic_mode:
+                keep = min(window_length - 1, buffer.size)
+                buffer_start, buffer = buffer_end - keep, buffer[buffer.size - keep:]
+            yield residual
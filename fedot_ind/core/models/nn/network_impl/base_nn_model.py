@@ -1,5 +1,5 @@
-import copy
 import os
+import tempfile
 
 import torch
 import torch.nn.functional as F
@@ -13,8 +13,8 @@ from typing import Optional
 
 from tqdm import tqdm
 
-from fedot_ind.core.architecture.abstraction.decorators import convert_inputdata_to_torch_dataset, \
-    convert_to_4d_torch_array, fedot_data_type
+from fedot_ind.core.architecture.abstraction.decorators import convert_to_4d_torch_array, fedot_data_type
+from fedot_ind.core.architecture.preprocessing.data_convertor import CustomDatasetCLF, MemmapDatasetCLF
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.nn.network_modules.layers.special import adjust_learning_rate, EarlyStopping
 
@@ -25,6 +25,13 @@ class BaseNeuralModel:
     Attributes:
         self.num_features: int, the number of features.
 
+    Training data is controlled by ``dataset_mode`` param: ``'eager'`` converts the whole dataset
+    to tensors on device before training, ``'lazy'`` converts samples batch by batch and ``'memmap'``
+    also keeps features in a memory-mapped file. ``num_workers``, ``persistent_workers``,
+    ``prefetch_factor`` and ``pin_memory`` are passed to ``torch.utils.data.DataLoader``; workers
+    and pinning are useful with lazy datasets only. Early stopping checkpoint is saved to ``checkpoint_folder``,
+    by default to a temporary folder which is removed after training.
+
     Example:
         To use this operation you can create pipeline as follows::
             from fedot.core.pipelines.pipeline_builder import PipelineBuilder
@@ -46,6 +53,14 @@ class BaseNeuralModel:
         self.epochs = params.get('epochs', 100)
         self.batch_size = params.get('batch_size', 16)
         self.activation = params.get('activation', 'ReLU')
+        self.inference_batch_size = params.get('inference_batch_size', 256)
+        self.inference_threads = params.get('inference_threads', None)
+        self.dataset_mode = params.get('dataset_mode', 'eager')
+        self.num_workers = params.get('num_workers', 0)
+        self.persistent_workers = params.get('persistent_workers', False)
+        self.prefetch_factor = params.get('prefetch_factor', 2)
+        self.pin_memory = params.get('pin_memory', torch.cuda.is_available())
+        self.checkpoint_folder = params.get('checkpoint_folder', None)
         self.learning_rate = 0.001
 
         self.label_encoder = None
@@ -89,19 +104,34 @@ class BaseNeuralModel:
             train_dataset = self._create_dataset(ts)
             val_dataset = None
 
-        train_loader = torch.utils.data.DataLoader(
-            train_dataset, batch_size=self.batch_size, shuffle=True)
+        train_loader = self._create_loader(train_dataset)
 
         if val_dataset is None:
             val_loader = val_dataset
         else:
-            val_loader = torch.utils.data.DataLoader(
-                val_dataset, batch_size=self.batch_size, shuffle=True)
+            val_loader = self._create_loader(val_dataset)
 
         self.label_encoder = train_dataset.label_encoder
         return train_loader, val_loader
 
+    def _create_loader(self, dataset):
+        loader_params = dict(batch_size=self.batch_size,
+                             shuffle=True,
+                             num_workers=self.num_workers,
+                             # tensors of eager dataset may already be on gpu and can't be pinned
+                             pin_memory=self.pin_memory and self.dataset_mode != 'eager')
+        if self.num_workers > 0:
+            loader_params.update(persistent_workers=self.persistent_workers,
+                                 prefetch_factor=self.prefetch_factor)
+        return torch.utils.data.DataLoader(dataset, **loader_params)
+
     def _train_loop(self, train_loader, val_loader, loss_fn, optimizer):
+        if self.checkpoint_folder is not None:
+            return self._train_epochs(train_loader, val_loader, loss_fn, optimizer, str(self.checkpoint_folder))
+        with tempfile.TemporaryDirectory(prefix='fedot_ind_checkpoint_') as checkpoint_folder:
+            return self._train_epochs(train_loader, val_loader, loss_fn, optimizer, checkpoint_folder)
+
+    def _train_epochs(self, train_loader, val_loader, loss_fn, optimizer, checkpoint_folder: str):
         early_stopping = EarlyStopping()
         scheduler = lr_scheduler.OneCycleLR(optimizer=optimizer,
                                             steps_per_epoch=len(train_loader),
@@ -110,10 +140,11 @@ class BaseNeuralModel:
         if val_loader is None:
             print('Not enough class samples for validation')
 
-        best_model = None
+        best_state = None
         best_val_loss = float('inf')
         val_interval = self.get_validation_frequency(
             self.epochs, self.learning_rate)
+        device = self._model_device()
 
         for epoch in range(1, self.epochs + 1):
             training_loss = 0.0
@@ -123,7 +154,7 @@ class BaseNeuralModel:
             correct = 0
             for batch in tqdm(train_loader):
                 optimizer.zero_grad()
-                inputs, targets = batch
+                inputs, targets = self._batch_to_device(batch, device)
                 output = self.model(inputs)
                 loss = loss_fn(output, targets.float())
                 loss.backward()
@@ -143,7 +174,7 @@ class BaseNeuralModel:
                 total = 0
                 correct = 0
                 for batch in val_loader:
-                    inputs, targets = batch
+                    inputs, targets = self._batch_to_device(batch, device)
                     output = self.model(inputs)
 
                     loss = loss_fn(output, targets.float())
@@ -154,9 +185,11 @@ class BaseNeuralModel:
                                 torch.argmax(targets, 1)).sum().item()
                 if valid_loss < best_val_loss:
                     best_val_loss = valid_loss
-                    best_model = copy.deepcopy(self.model)
+                    # snapshot of weights only, copied to cpu to not hold the second model on device
+                    best_state = {name: tensor.detach().to('cpu', copy=True)
+                                  for name, tensor in self.model.state_dict().items()}
 
-            early_stopping(training_loss, self.model, './')
+            early_stopping(training_loss, self.model, checkpoint_folder)
             adjust_learning_rate(optimizer, scheduler,
                                  epoch + 1, self.learning_rate, printout=False)
             scheduler.step()
@@ -165,8 +198,17 @@ class BaseNeuralModel:
                 print("Early stopping")
                 break
 
-        if best_model is not None:
-            self.model = best_model
+        if best_state is not None:
+            self.model.load_state_dict(best_state)
+
+    def _model_device(self) -> torch.device:
+        parameter = next(self.model.parameters(), None)
+        return parameter.device if parameter is not None else torch.device('cpu')
+
+    @staticmethod
+    def _batch_to_device(batch, device):
+        inputs, targets = batch
+        return inputs.to(device, non_blocking=True), targets.to(device, non_blocking=True)
 
     @fedot_data_type
     def predict(
@@ -190,12 +232,36 @@ class BaseNeuralModel:
 
     @convert_to_4d_torch_array
     def _predict_model(self, x_test, output_mode: str = 'default'):
-        self.model.eval()
-        # x_test = Tensor(x_test).to(default_device('cpu'))
-        x_test = Tensor(x_test).to(self._device)
-        pred = self.model(x_test)
+        pred = self._batch_inference(x_test)
         return self._convert_predict(pred, output_mode)
 
+    def _batch_inference(self, x_test) -> Tensor:
+        """Forward pass over test samples in mini-batches of ``inference_batch_size`` under
+        ``torch.inference_mode``. Outputs of batches are written into one preallocated buffer, so memory
+        used for inference doesn't grow with the number of samples. If ``inference_threads`` is set,
+        torch uses this number of threads during inference.
+        """
+        if len(x_test) == 0:
+            raise ValueError('Prediction requires at least one sample, got an empty array')
+        self.model.eval()
+        device = self._model_device()
+        n_threads = torch.get_num_threads()
+        if self.inference_threads is not None:
+            torch.set_num_threads(self.inference_threads)
+        try:
+            with torch.inference_mode():
+                pred = None
+                for start in range(0, len(x_test), self.inference_batch_size):
+                    batch = torch.as_tensor(x_test[start:start + self.inference_batch_size],
+                                            dtype=torch.float32).to(device)
+                    batch_pred = self.model(batch)
+                    if pred is None:
+                        pred = torch.empty((len(x_test), *batch_pred.shape[1:]), dtype=batch_pred.dtype)
+                    pred[start:start + batch_pred.shape[0]] = batch_pred.cpu()
+        finally:
+            torch.set_num_threads(n_threads)
+        return pred
+
     def _convert_predict(self, pred, output_mode: str = 'labels'):
         pred = F.softmax(pred, dim=1)
 
@@ -229,9 +295,10 @@ class BaseNeuralModel:
             prefix, map_location=torch.device('cpu')))
         os.remove(prefix)
 
-    @convert_inputdata_to_torch_dataset
     def _create_dataset(self, ts: InputData):
-        return ts
+        if self.dataset_mode == 'memmap':
+            return MemmapDatasetCLF(ts)
+        return CustomDatasetCLF(ts, lazy=self.dataset_mode == 'lazy')
 
     def _evaluate_num_of_epochs(self, ts):
         min_num_epochs = min(100, round(ts.features.shape[0] * 1.5))
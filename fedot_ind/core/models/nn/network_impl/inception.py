@@ -5,7 +5,6 @@ from fastcore.meta import delegates
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from torch import nn, optim
-from torch import Tensor
 from fedot_ind.core.architecture.abstraction.decorators import convert_to_3d_torch_array
 from fedot_ind.core.architecture.settings.computational import default_device
 from fedot_ind.core.models.nn.network_impl.base_nn_model import BaseNeuralModel
@@ -101,7 +100,5 @@ class InceptionTimeModel(BaseNeuralModel):
 
     @convert_to_3d_torch_array
     def _predict_model(self, x_test, output_mode: str = 'default'):
-        self.model.eval()
-        x_test = Tensor(x_test).to(default_device('cpu'))
-        pred = self.model(x_test)
+        pred = self._batch_inference(x_test)
         return self._convert_predict(pred, output_mode)
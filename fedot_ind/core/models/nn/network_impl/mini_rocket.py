@@ -1,4 +1,8 @@
+import os
+import tempfile
+import weakref
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
 import torch.nn as nn
@@ -88,19 +92,8 @@ class MiniRocketFeatures(nn.Module):
 
     def forward(self, x):
         _features = []
-        for i, (dilation, padding) in enumerate(
-                zip(self.dilations, self.padding)):
-            _padding1 = i % 2
-
-            # Convolution
-            C = F.conv1d(x.float(), self.kernels, padding=padding,
-                         dilation=dilation, groups=self.input_dim)
-            if self.input_dim > 1:  # multivariate
-                C = C.reshape(x.shape[0], self.input_dim, self.num_kernels, -1)
-                channel_combination = getattr(
-                    self, f'channel_combinations_{i}')
-                C = torch.mul(C, channel_combination)
-                C = C.sum(1)
+        for i in range(self.num_dilations):
+            C = self._convolve(x, i)
 
             # Bias
             if not self.prefit or self.fitting:
@@ -120,12 +113,76 @@ class MiniRocketFeatures(nn.Module):
                 bias_this_dilation = getattr(self, f'biases_{i}')
 
             # Features
-            _features.append(self._get_PPVs(
-                C[:, _padding1::2], bias_this_dilation[_padding1::2]))
-            _features.append(self._get_PPVs(
-                C[:, 1 - _padding1::2, padding:-padding], bias_this_dilation[1 - _padding1::2]))
+            _features.extend(self._get_dilation_PPVs(C, bias_this_dilation, i))
         return torch.cat(_features, dim=1)
 
+    def _convolve(self, x, i):
+        C = F.conv1d(x.float(), self.kernels, padding=self.padding[i],
+                     dilation=self.dilations[i], groups=self.input_dim)
+        if self.input_dim > 1:  # multivariate
+            C = C.reshape(x.shape[0], self.input_dim, self.num_kernels, -1)
+            channel_combination = getattr(
+                self, f'channel_combinations_{i}')
+            C = torch.mul(C, channel_combination)
+            C = C.sum(1)
+        return C
+
+    def _get_dilation_PPVs(self, C, bias, i):
+        _padding1, padding = i % 2, self.padding[i]
+        return [self._get_PPVs(C[:, _padding1::2], bias[_padding1::2]),
+                self._get_PPVs(C[:, 1 - _padding1::2, padding:-padding], bias[1 - _padding1::2])]
+
+    def _dilation_features(self, x, i):
+        C = self._convolve(x, i)
+        return torch.cat(self._get_dilation_PPVs(C, getattr(self, f'biases_{i}'), i), dim=1)
+
+    def transform(self, X, chunksize=1024, n_jobs=1, out=None):
+        """Streaming transform of prefitted module. Samples are processed in chunks and features of every
+        chunk are written directly into ``out``, so peak memory is defined by ``chunksize`` and not by the
+        number of samples.
+
+        Args:
+            X: array or tensor of shape (n_samples, input_dim, seq_len). Could be a memory map.
+            chunksize: number of samples processed at once.
+            n_jobs: number of threads used to process dilations of a chunk concurrently.
+            out: preallocated array (or ``np.memmap``) of shape (n_samples, num_features) for the features.
+                If ``None``, a new array is allocated.
+
+        Returns:
+            Array of shape (n_samples, num_features).
+        """
+        if not self.prefit:
+            self.fit(X)
+        num_samples = X.shape[0]
+        if out is None:
+            out = np.empty((num_samples, self.num_features), dtype=np.float32)
+        feature_bounds = np.cumsum(
+            [0, *(self.num_kernels * self.num_features_per_dilation)])
+        device = self.kernels.device
+
+        def write_dilation_features(i, x, start, stop):
+            features = self._dilation_features(x, i)
+            out[start:stop, feature_bounds[i]:feature_bounds[i + 1]] = features.cpu().numpy()
+
+        pool = ThreadPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        try:
+            with torch.no_grad():
+                for start in range(0, num_samples, chunksize):
+                    stop = min(start + chunksize, num_samples)
+                    x = X[start:stop]
+                    x = torch.from_numpy(np.ascontiguousarray(x)) if isinstance(x, np.ndarray) else x
+                    x = x.float().to(device)
+                    if pool is None:
+                        for i in range(self.num_dilations):
+                            write_dilation_features(i, x, start, stop)
+                    else:
+                        list(pool.map(lambda i: write_dilation_features(i, x, start, stop),
+                                      range(self.num_dilations)))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return out
+
     def _get_PPVs(self, C, bias):
         C = C.unsqueeze(-1)
         bias = bias.view(1, bias.shape[0], 1, bias.shape[1])
@@ -195,22 +252,25 @@ def get_minirocket_features(data,
                             model,
                             chunksize=1024,
                             use_cuda=None,
-                            convert_to_numpy=True):
-    """Function used to split a large dataset into chunks, avoiding OOM error."""
+                            convert_to_numpy=True,
+                            n_jobs=1,
+                            out=None):
+    """Function used to split a large dataset into chunks, avoiding OOM error.
+    Features are written chunk by chunk into ``out`` (e.g. ``np.memmap`` of shape (n_samples, num_features)).
+    If ``convert_to_numpy`` is False and ``out`` is not given, features are returned as a tensor on the device.
+    """
     use = torch.cuda.is_available() if use_cuda is None else use_cuda
     device = torch.device(torch.cuda.current_device()
                           ) if use else torch.device('cpu')
     model = model.to(device)
+    if convert_to_numpy or out is not None:
+        return model.transform(data, chunksize=chunksize, n_jobs=n_jobs, out=out)[:, :, None]
     if isinstance(data, np.ndarray):
-        data = torch.from_numpy(data).float().to(device)
+        data = torch.from_numpy(data)
     _features = []
     for oi in torch.split(data, chunksize):
-        _features.append(model(oi))
-    features = torch.cat(_features).unsqueeze(-1)
-    if convert_to_numpy:
-        return features.cpu().numpy()
-    else:
-        return features
+        _features.append(model(oi.float().to(device)))
+    return torch.cat(_features).unsqueeze(-1)
 
 
 class MiniRocketHead(nn.Sequential):
@@ -280,6 +340,10 @@ class MiniRocketExtractor(BaseExtractor):
 
     Attributes:
         self.num_features: int, the number of features.
+        self.chunk_size: int, the number of samples transformed at once. Defines peak memory of transform.
+        self.n_jobs: int, the number of threads used to process dilations concurrently.
+        self.memmap_folder: str, if set, features are written to ``.npy`` memory maps in this folder
+            instead of RAM. Files are removed once the features are garbage collected.
 
     Example:
         To use this operation you can create pipeline as follows::
@@ -301,56 +365,83 @@ class MiniRocketExtractor(BaseExtractor):
     def __init__(self, params: Optional[OperationParameters] = None):
         super().__init__(params)
         self.num_features = params.get('num_features', 10000)
+        self.chunk_size = params.get('chunk_size', 256)
+        self.n_jobs = params.get('n_jobs', 1)
+        self.memmap_folder = params.get('memmap_folder', None)
+        self.feature_generators = None
+        self.fitted_data_hash = None
 
     def __repr__(self):
         return 'LargeFeatureSpace'
 
-    def _save_and_clear_cache(self, model_list):
-        del model_list
+    def _save_and_clear_cache(self):
         with torch.no_grad():
             torch.cuda.empty_cache()
 
+    @staticmethod
+    def _split_channels(ts: np.array, mode: str = 'multivariate') -> list:
+        if ts.ndim == 2:
+            ts = ts.reshape(ts.shape[0], 1, ts.shape[1])
+        if ts.shape[1] > 1 and mode == 'chanel_independent':
+            return [ts[:, i:i + 1, :] for i in range(ts.shape[1])]
+        return [ts]
+
+    def _fit_feature_generators(self, ts: np.array, mode: str = 'multivariate') -> list:
+        return [MiniRocketFeatures(input_dim=data.shape[1],
+                                   seq_len=data.shape[2],
+                                   num_features=self.num_features).to(default_device()).fit(data)
+                for data in self._split_channels(ts, mode)]
+
+    def _allocate_features(self, shape: tuple) -> np.ndarray:
+        if self.memmap_folder is None:
+            return np.empty(shape, dtype=np.float32)
+        os.makedirs(self.memmap_folder, exist_ok=True)
+        file_descriptor, path = tempfile.mkstemp(suffix='.npy', prefix='minirocket_', dir=self.memmap_folder)
+        os.close(file_descriptor)
+        features = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=shape)
+        # file lives as long as the features (and views of them) are referenced
+        weakref.finalize(features, os.remove, path)
+        return features
+
+    def _clean_predict(self, predict: np.array):
+        # PPV features are proportions and are always finite,
+        # so features are returned as is and memory maps are not loaded into RAM
+        return predict
+
+    def fit(self, input_data: InputData):
+        """Fits MiniRocket kernels (dilations, biases and channel combinations) on train data.
+        Fitted kernels are stored in the extractor and reused for every subsequent transform.
+        """
+        features = input_data.features
+        self.feature_generators = self._fit_feature_generators(features)
+        # fitted state is a part of the cache key, otherwise features of the same data
+        # generated with kernels fitted on different samples would collide in cache
+        self.fitted_data_hash = self.cacher.hash_info(data=features)
+        self._save_and_clear_cache()
+        return self
+
     def _generate_features_from_ts(
             self,
             ts: np.array,
             mode: str = 'multivariate'):
 
-        if ts.shape[1] > 1 and mode == 'chanel_independent':
-            mrf = MiniRocketFeatures(
-                input_dim=1,
-                seq_len=ts.shape[2],
-                num_features=self.num_features).to(
-                default_device())
-
-            n_dim = range(ts.shape[1])
-            ts_converted = [ts[:, i, :] for i in n_dim]
-            ts_converted = [x.reshape(x.shape[0], 1, x.shape[1])
-                            for x in ts_converted]
-            model_list = [mrf for i in n_dim]
-        else:
-            mrf = MiniRocketFeatures(
-                input_dim=ts.shape[1],
-                seq_len=ts.shape[2],
-                num_features=self.num_features).to(
-                default_device())
-
-            ts_converted = [ts]
-            model_list = [mrf]
-
-        fitted_model = [model.fit(data)
-                        for model, data in zip(model_list, ts_converted)]
-        features = [get_minirocket_features(
-            data, model) for model, data in zip(fitted_model, ts_converted)]
-        minirocket_features = [feature_by_dim.swapaxes(
-            1, 2) for feature_by_dim in features]
-        minirocket_features = np.concatenate(minirocket_features, axis=1)
+        if self.feature_generators is None:
+            self.feature_generators = self._fit_feature_generators(ts, mode)
+        ts_converted = self._split_channels(ts, mode)
+        minirocket_features = self._allocate_features(
+            (ts.shape[0], len(ts_converted), self.feature_generators[0].num_features))
+        for i, (model, data) in enumerate(zip(self.feature_generators, ts_converted)):
+            get_minirocket_features(data, model,
+                                    chunksize=self.chunk_size,
+                                    n_jobs=self.n_jobs,
+                                    out=minirocket_features[:, i, :])
         minirocket_features = OutputData(
             idx=np.arange(
                 minirocket_features.shape[2]),
             task=self.task,
             predict=minirocket_features,
             data_type=DataTypesEnum.image)
-        self._save_and_clear_cache(model_list)
+        self._save_and_clear_cache()
         return minirocket_features
 
     def generate_minirocket_features(self, ts: np.array) -> InputData:
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Optional
+from typing import List, Optional, Union
 
 import numpy as np
 import torch
@@ -12,7 +12,6 @@ from torch import nn
 from fedot_ind.core.architecture.settings.computational import default_device
 from fedot_ind.core.models.nn.network_impl.base_nn_model import BaseNeuralModel
 from fedot_ind.core.models.nn.network_modules.layers.forecasting.nbeats import _NBeatsStack, NBeatsNet
-from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 
 
 class NBeatsModel(BaseNeuralModel):
@@ -86,11 +85,13 @@ class NBeatsModel(BaseNeuralModel):
     def _save_and_clear_cache(self):
         pass
 
-    def _create_predict_data(self, ts: np.ndarray):
-        x_trajectory = HankelMatrix(time_series=ts,
-                                    window_size=self.backcast_length,
-                                    strides=1)
-        return x_trajectory.trajectory_matrix.swapaxes(0, 1)
+    def _create_predict_data(self, ts: Union[np.ndarray, List[np.ndarray]]) -> np.ndarray:
+        """Last ``backcast_length`` observations of a series or of every series in a batch,
+        stacked into array of shape (n_series, backcast_length).
+        """
+        if isinstance(ts, np.ndarray) and ts.ndim == 1:
+            ts = ts[np.newaxis, :]
+        return np.stack([np.asarray(series)[-self.backcast_length:] for series in ts])
 
     def _fit_model(self, ts: InputData):
 
@@ -120,10 +121,20 @@ class NBeatsModel(BaseNeuralModel):
                        batch_size=self.batch_size)
 
     def _predict_model(self, x_test, output_mode: str = 'default'):
-        x_test_lagged = self._create_predict_data(x_test)
-        x_predict_lagged = self.model.predict(x_test_lagged)
-        forecast = x_predict_lagged[-1:, :].flatten()
-        return forecast
+        forecast = self.forecast_last_windows(x_test)
+        return forecast.flatten() if forecast.shape[0] == 1 else forecast
+
+    def forecast_last_windows(self, ts: Union[np.ndarray, List[np.ndarray]]) -> np.ndarray:
+        """Forecasts a series or a batch of series (2d array or list of series of different length).
+        Only the last window of every series is fed to the network, all of them in one forward pass.
+
+        Returns:
+            array of shape (n_series, forecast_length).
+
+        """
+        last_windows = self._create_predict_data(ts)
+        with torch.inference_mode():
+            return self.model.predict(last_windows)
 
 
 class NBeats(nn.Module):
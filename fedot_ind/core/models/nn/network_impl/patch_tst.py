@@ -352,11 +352,12 @@ class PatchTSTModel(BaseNeuralModel):
     def predict(self,
                 test_data,
                 output_mode: str = 'labels'):
-        y_pred = []
         self.forecast_mode = 'out_of_sample'
-        for model in self.model_list:
-            y_pred.append(self._predict_loop(model, test_data))
-        y_pred = np.array(y_pred)
+        if self.preprocess_to_lagged:
+            y_pred = np.array([self._predict_loop(model, test_data)
+                               for model in self.model_list])
+        else:
+            y_pred = self._predict_last_window(test_data)
         forecast_idx_predict = np.arange(start=test_data.idx[-self.horizon],
                                          stop=test_data.idx[-self.horizon] +
                                          y_pred.shape[1],
@@ -387,6 +388,27 @@ class PatchTSTModel(BaseNeuralModel):
             data_type=DataTypesEnum.table)
         return predict
 
+    def _last_window(self, test_data) -> torch.Tensor:
+        """Trailing ``test_patch_len`` observations of every channel as a batch of one sample."""
+        features = np.asarray(test_data.features)
+        if len(features.shape) == 1:
+            features = features.reshape(1, -1)
+        window = features[..., -self.test_patch_len:]
+        return torch.as_tensor(window, dtype=torch.float32).reshape(
+            1, -1, self.test_patch_len).to(default_device())
+
+    def _predict_last_window(self, test_data) -> np.ndarray:
+        """Out-of-sample forecast from the last window of the history only, so its cost doesn't
+        depend on the history length. The window is built once and passed to all models of ``model_list``.
+        """
+        last_window = self._last_window(test_data)
+        y_pred = []
+        with torch.inference_mode():
+            for model in self.model_list:
+                model.eval()
+                y_pred.append(model(last_window).flatten().cpu().numpy())
+        return np.array(y_pred)
+
     def _predict_loop(self, model,
                       test_data):
 
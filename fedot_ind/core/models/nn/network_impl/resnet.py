@@ -3,8 +3,7 @@ from typing import Optional
 import torch
 from fedot.core.operations.operation_parameters import OperationParameters
 from torch import nn
-from torch import optim, Tensor
-from torchvision.models import ResNet, resnet101, resnet152, resnet18, resnet34, resnet50
+from torch import optim
 
 from fedot_ind.core.architecture.abstraction.decorators import convert_to_4d_torch_array
 from fedot_ind.core.architecture.settings.computational import default_device
@@ -12,7 +11,25 @@ from fedot_ind.core.models.nn.network_impl.base_nn_model import BaseNeuralModel
 from fedot_ind.core.repository.constanst_repository import CROSS_ENTROPY, MULTI_CLASS_CROSS_ENTROPY, RMSE
 
 
-def resnet18_one_channel(**kwargs) -> ResNet:
+def _torchvision_resnet(name: str):
+    """Returns factory of torchvision ResNet which imports torchvision on the first call only"""
+
+    def factory(**kwargs) -> nn.Module:
+        from torchvision import models
+        return getattr(models, name)(**kwargs)
+
+    factory.__name__ = name
+    return factory
+
+
+resnet18 = _torchvision_resnet('resnet18')
+resnet34 = _torchvision_resnet('resnet34')
+resnet50 = _torchvision_resnet('resnet50')
+resnet101 = _torchvision_resnet('resnet101')
+resnet152 = _torchvision_resnet('resnet152')
+
+
+def resnet18_one_channel(**kwargs) -> nn.Module:
     """ResNet18 for one input channel"""
     model = resnet18(**kwargs)
     model.conv1 = nn.Conv2d(in_channels=1,
@@ -24,7 +41,7 @@ def resnet18_one_channel(**kwargs) -> ResNet:
     return model
 
 
-def resnet34_one_channel(**kwargs) -> ResNet:
+def resnet34_one_channel(**kwargs) -> nn.Module:
     """ResNet34 for one input channel"""
     model = resnet34(**kwargs)
     model.conv1 = nn.Conv2d(1, 64, kernel_size=7,
@@ -32,7 +49,7 @@ def resnet34_one_channel(**kwargs) -> ResNet:
     return model
 
 
-def resnet50_one_channel(**kwargs) -> ResNet:
+def resnet50_one_channel(**kwargs) -> nn.Module:
     """ResNet50 for one input channel"""
     model = resnet50(**kwargs)
     model.conv1 = nn.Conv2d(1, 64, kernel_size=7,
@@ -40,7 +57,7 @@ def resnet50_one_channel(**kwargs) -> ResNet:
     return model
 
 
-def resnet101_one_channel(**kwargs) -> ResNet:
+def resnet101_one_channel(**kwargs) -> nn.Module:
     """ResNet101 for one input channel"""
     model = resnet101(**kwargs)
     model.conv1 = nn.Conv2d(1, 64, kernel_size=7,
@@ -48,7 +65,7 @@ def resnet101_one_channel(**kwargs) -> ResNet:
     return model
 
 
-def resnet152_one_channel(**kwargs) -> ResNet:
+def resnet152_one_channel(**kwargs) -> nn.Module:
     """ResNet152 for one input channel"""
     model = resnet152(**kwargs)
     model.conv1 = nn.Conv2d(1, 64, kernel_size=7,
@@ -143,7 +160,5 @@ class ResNetModel(BaseNeuralModel):
 
     @convert_to_4d_torch_array
     def _predict_model(self, x_test):
-        self.model.eval()
-        x_test = Tensor(x_test).to(default_device())
-        pred = self.model(x_test)
+        pred = self._batch_inference(x_test)
         return self._convert_predict(pred)
@@ -89,6 +89,7 @@ class TransformerModel(BaseNeuralModel):
        """
 
     def __init__(self, params: Optional[OperationParameters] = {}):
+        super().__init__(params)
         self.num_classes = params.get('num_classes', 1)
         self.epochs = params.get('epochs', 10)
         self.batch_size = params.get('batch_size', 20)
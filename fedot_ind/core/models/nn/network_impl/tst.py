@@ -274,6 +274,7 @@ class TSTModel(BaseNeuralModel):
     """
 
     def __init__(self, params: Optional[OperationParameters] = {}):
+        super().__init__(params)
         self.num_classes = params.get('num_classes', 1)
         self.epochs = params.get('epochs', 100)
         self.batch_size = params.get('batch_size', 32)
@@ -2,7 +2,6 @@ from typing import Optional, Union
 
 import torch
 import torch.nn.functional as F
-from fastai.torch_core import Module
 from torch import nn, Tensor
 
 from fedot_ind.core.architecture.settings.computational import default_device
@@ -124,8 +123,9 @@ class LogCoshLoss(nn.Module):
             return loss
 
 
-class MaskedLossWrapper(Module):
+class MaskedLossWrapper(nn.Module):
     def __init__(self, crit):
+        super().__init__()
         self.loss = crit
 
     def forward(self, inp, targ):
@@ -136,7 +136,7 @@ class MaskedLossWrapper(Module):
         return self.loss(inp, targ)
 
 
-class CenterLoss(Module):
+class CenterLoss(nn.Module):
     """Code in Pytorch has been slightly modified from:
     https://github.com/KaiyangZhou/pytorch-center-loss/blob/master/center_loss.py
     Based on paper: Wen et al. A Discriminative Feature Learning Approach for Deep Face Recognition. ECCV 2016.
@@ -148,6 +148,7 @@ class CenterLoss(Module):
     """
 
     def __init__(self, c_out, logits_dim=None):
+        super().__init__()
         if logits_dim is None:
             logits_dim = c_out
         self.c_out, self.logits_dim = c_out, logits_dim
@@ -180,9 +181,10 @@ class CenterLoss(Module):
         return loss
 
 
-class CenterPlusLoss(Module):
+class CenterPlusLoss(nn.Module):
 
     def __init__(self, loss, c_out, λ=1e-2, logits_dim=None):
+        super().__init__()
         self.loss, self.c_out, self.λ = loss, c_out, λ
         self.centerloss = CenterLoss(c_out, logits_dim)
 
@@ -193,7 +195,7 @@ class CenterPlusLoss(Module):
         self): return f"CenterPlusLoss(loss={self.loss}, c_out={self.c_out}, λ={self.λ})"
 
 
-class FocalLoss(Module):
+class FocalLoss(nn.Module):
     """ Weighted, multiclass focal loss"""
 
     def __init__(
@@ -207,6 +209,7 @@ class FocalLoss(Module):
             gamma (float, optional): A constant, as described in the paper. Defaults to 2.
             reduction (str, optional): 'mean', 'sum' or 'none'. Defaults to 'mean'.
         """
+        super().__init__()
         self.alpha, self.gamma, self.reduction = alpha, gamma, reduction
         self.nll_loss = nn.NLLLoss(weight=alpha, reduction='none')
 
@@ -224,7 +227,7 @@ class FocalLoss(Module):
         return loss
 
 
-class TweedieLoss(Module):
+class TweedieLoss(nn.Module):
     def __init__(self, p=1.5, eps=1e-8):
         """
         Tweedie loss as calculated in LightGBM
@@ -232,6 +235,7 @@ class TweedieLoss(Module):
             p: tweedie variance power (1 < p < 2)
             eps: small number to avoid log(zero).
         """
+        super().__init__()
         assert 1 < p < 2, "make sure 1 < p < 2"
         self.p, self.eps = p, eps
 
@@ -246,7 +250,7 @@ class TweedieLoss(Module):
         return loss.mean()
 
 
-class SMAPELoss(Module):
+class SMAPELoss(nn.Module):
     def __init__(self):
         super().__init__()
 
@@ -255,7 +259,7 @@ class SMAPELoss(Module):
                                 (torch.abs(target) + torch.abs(input)) + 1e-8)
 
 
-class RMSELoss(Module):
+class RMSELoss(nn.Module):
     def __init__(self):
         super().__init__()
 
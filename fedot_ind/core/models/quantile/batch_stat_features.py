@@ -0,0 +1,264 @@
+"""Vectorized counterparts of the statistics from ``stat_features``.
+
+Every function takes an array of shape ``(..., length)`` and computes the statistic over the last axis in a single
+NumPy pass, so a whole ``(n_samples, n_channels, length)`` tensor or a whole stack of sliding windows is processed
+at once. The results match the per-series functions from ``stat_features`` up to floating point error.
+"""
+import warnings
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+
+def _zero_out_fperr(array: np.ndarray) -> np.ndarray:
+    return np.where(np.abs(array) < 1e-14, 0, array)
+
+
+def _pearson_corr(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    x = x - x.mean(axis=-1, keepdims=True)
+    y = y - y.mean(axis=-1, keepdims=True)
+    corr = np.sum(x * y, axis=-1) / np.sqrt(np.sum(x * x, axis=-1) * np.sum(y * y, axis=-1))
+    return np.clip(corr, -1, 1)
+
+
+def _batch_peaks(array: np.ndarray) -> np.ndarray:
+    """Boolean mask of local maxima along the last axis. Flat peaks are reduced to their middle sample,
+    the same way as in ``scipy.signal.find_peaks``.
+    """
+    length = array.shape[-1]
+    idx = np.arange(length)
+    is_start = np.ones(array.shape, dtype=bool)
+    is_start[..., 1:] = array[..., 1:] != array[..., :-1]
+    is_end = np.ones(array.shape, dtype=bool)
+    is_end[..., :-1] = is_start[..., 1:]
+
+    run_start = np.maximum.accumulate(np.where(is_start, idx, 0), axis=-1)
+    run_end = np.minimum.accumulate(np.where(is_end, idx, length - 1)[..., ::-1], axis=-1)[..., ::-1]
+
+    left = np.take_along_axis(array, np.clip(run_start - 1, 0, None), axis=-1)
+    right = np.take_along_axis(array, np.clip(run_end + 1, None, length - 1), axis=-1)
+    is_peak_run = (run_start >= 1) & (run_end <= length - 2) & (left < array) & (right < array)
+    return is_peak_run & (idx == (run_start + run_end) // 2)
+
+
+def batch_q5(array: np.ndarray) -> np.ndarray:
+    return np.quantile(array, 0.05, axis=-1)
+
+
+def batch_q25(array: np.ndarray) -> np.ndarray:
+    return np.quantile(array, 0.25, axis=-1)
+
+
+def batch_q75(array: np.ndarray) -> np.ndarray:
+    return np.quantile(array, 0.75, axis=-1)
+
+
+def batch_q95(array: np.ndarray) -> np.ndarray:
+    return np.quantile(array, 0.95, axis=-1)
+
+
+def batch_skewness(array: np.ndarray) -> np.ndarray:
+    """Unbiased skewness computed in the same way as ``pd.Series.skew``.
+    """
+    count = array.shape[-1]
+    adjusted = array - array.mean(axis=-1, keepdims=True)
+    m2 = _zero_out_fperr(np.sum(adjusted ** 2, axis=-1))
+    m3 = _zero_out_fperr(np.sum(adjusted ** 3, axis=-1))
+    if count < 3:
+        return np.full(m2.shape, np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+    return np.where(m2 == 0, 0, result)
+
+
+def batch_kurtosis(array: np.ndarray) -> np.ndarray:
+    """Unbiased excess kurtosis computed in the same way as ``pd.Series.kurtosis``.
+    """
+    count = array.shape[-1]
+    adjusted2 = (array - array.mean(axis=-1, keepdims=True)) ** 2
+    m2 = np.sum(adjusted2, axis=-1)
+    m4 = np.sum(adjusted2 ** 2, axis=-1)
+    if count < 4:
+        return np.full(m2.shape, np.nan)
+    adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+    numerator = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+    denominator = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = numerator / denominator - adj
+    return np.where(denominator == 0, 0, result)
+
+
+def batch_n_peaks(array: np.ndarray) -> np.ndarray:
+    return np.sum(_batch_peaks(array), axis=-1)
+
+
+def batch_mean_ptp_distance(array: np.ndarray) -> np.ndarray:
+    peaks = _batch_peaks(array)
+    n_peaks = np.sum(peaks, axis=-1)
+    first_peak = np.argmax(peaks, axis=-1)
+    last_peak = array.shape[-1] - 1 - np.argmax(peaks[..., ::-1], axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        distance = (last_peak - first_peak) / (n_peaks - 1)
+    return np.where(n_peaks > 1, distance, np.nan)
+
+
+def batch_slope(array: np.ndarray) -> np.ndarray:
+    time = np.arange(array.shape[-1]) - (array.shape[-1] - 1) / 2
+    centered = array - array.mean(axis=-1, keepdims=True)
+    return np.sum(centered * time, axis=-1) / np.sum(time ** 2)
+
+
+def batch_ben_corr(array: np.ndarray) -> np.ndarray:
+    """Correlation of the first digit distribution with the Newcomb-Benford's Law distribution,
+    see ``stat_features.ben_corr`` for details.
+    """
+    array = np.abs(np.nan_to_num(array))
+    nonzero = array > 0
+    safe_array = np.where(nonzero, array, 1)
+    exponent = np.floor(np.log10(safe_array))
+    mantissa = np.round(safe_array / 10 ** exponent, 12)
+    first_digit = np.where(mantissa >= 10, 1, np.clip(np.floor(mantissa), 1, 9))
+    first_digit = np.where(nonzero, first_digit, 0)
+
+    digits = np.arange(1, 10)
+    benford_distribution = np.log10(1 + 1 / digits)
+    data_distribution = np.mean(first_digit[..., None] == digits, axis=-2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _pearson_corr(np.broadcast_to(benford_distribution, data_distribution.shape), data_distribution)
+
+
+def batch_interquartile_range(array: np.ndarray) -> np.ndarray:
+    return batch_q75(array) - batch_q25(array)
+
+
+def batch_energy(array: np.ndarray) -> np.ndarray:
+    return np.sum(np.power(array, 2), axis=-1) / array.shape[-1]
+
+
+def batch_zero_crossing_rate(array: np.ndarray) -> np.ndarray:
+    """Rate of sign-changes of the series scaled to (-1, 1) in the same way as ``MinMaxScaler`` does.
+    """
+    data_min = np.min(array, axis=-1, keepdims=True)
+    data_range = np.max(array, axis=-1, keepdims=True) - data_min
+    scale = 2 / np.where(data_range == 0, 1, data_range)
+    scaled_array = array * scale + (-1 - data_min * scale)
+    signs = np.sign(scaled_array)
+    signs[signs == 0] = -1
+    return np.sum(signs[..., 1:] != signs[..., :-1], axis=-1) / array.shape[-1]
+
+
+def batch_autocorrelation(array: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _pearson_corr(array, np.roll(array, 1, axis=-1))
+
+
+def batch_shannon_entropy(array: np.ndarray) -> np.ndarray:
+    """Shannon entropy of the value distribution. Unique values of every series are found at once by sorting
+    the whole batch and counting runs of equal values.
+    """
+    length = array.shape[-1]
+    batch_shape = array.shape[:-1]
+    sorted_array = np.sort(array.reshape(-1, length), axis=-1)
+    is_new_value = np.ones(sorted_array.shape, dtype=bool)
+    is_new_value[:, 1:] = (sorted_array[:, 1:] != sorted_array[:, :-1]) & \
+        ~(np.isnan(sorted_array[:, 1:]) & np.isnan(sorted_array[:, :-1]))
+
+    run_id = np.cumsum(is_new_value.ravel()) - 1
+    probability = np.bincount(run_id) / length
+    run_row = np.repeat(np.arange(sorted_array.shape[0]), length)[is_new_value.ravel()]
+    entropy = -np.bincount(run_row, weights=probability * np.log2(probability),
+                           minlength=sorted_array.shape[0])
+    return entropy.reshape(batch_shape)
+
+
+def batch_ptp_amp(array: np.ndarray) -> np.ndarray:
+    return np.ptp(array, axis=-1)
+
+
+def batch_crest_factor(array: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.max(np.abs(array), axis=-1) / np.sqrt(np.mean(np.square(array), axis=-1))
+
+
+def _moving_span(length: int) -> int:
+    span = int(length / 10)
+    return 2 if span in [0, 1] else span
+
+
+def batch_mean_ema(array: np.ndarray) -> np.ndarray:
+    """Last value of the exponential moving average with ``adjust=True``, written as a weighted sum.
+    """
+    alpha = 2 / (_moving_span(array.shape[-1]) + 1)
+    weights = (1 - alpha) ** np.arange(array.shape[-1])[::-1]
+    is_observed = ~np.isnan(array)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.sum(np.where(is_observed, array, 0) * weights, axis=-1) / np.sum(is_observed * weights, axis=-1)
+
+
+def batch_mean_moving_median(array: np.ndarray) -> np.ndarray:
+    span = _moving_span(array.shape[-1])
+    if span > array.shape[-1]:
+        return np.full(array.shape[:-1], np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(array, span, axis=-1)
+    with warnings.catch_warnings():
+        # series without observed values give NaN with "Mean of empty slice" warning
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        return np.nanmean(np.median(windows, axis=-1), axis=-1)
+
+
+def batch_hjorth_mobility(array: np.ndarray) -> np.ndarray:
+    diff_sequence = np.diff(array, axis=-1)
+    m2 = np.sum(np.power(diff_sequence, 2), axis=-1) / diff_sequence.shape[-1]
+    tp = np.sum(np.power(array, 2), axis=-1) / array.shape[-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.sqrt(m2 / tp)
+
+
+def batch_hjorth_complexity(array: np.ndarray) -> np.ndarray:
+    diff_sequence = np.diff(array, axis=-1)
+    m2 = np.sum(np.power(diff_sequence, 2), axis=-1) / diff_sequence.shape[-1]
+    tp = np.sum(np.power(array, 2), axis=-1) / array.shape[-1]
+    m4 = np.sum(np.power(np.diff(diff_sequence, axis=-1), 2), axis=-1) / diff_sequence.shape[-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.sqrt((m4 * tp) / (m2 * m2))
+
+
+def batch_hurst_exponent(array: np.ndarray) -> np.ndarray:
+    """Hurst exponent of every series, see ``stat_features.hurst_exponent`` for details. The rescaled range
+    is accumulated over time steps, each step being computed for the whole batch at once. Range of the prefix
+    of deviations from a changing mean has no cumulative form, and computing all the steps at once needs
+    ``length x length`` deviations per series and is slower than this loop.
+    """
+    length = array.shape[-1]
+    time = np.arange(1, length + 1)
+    cumulative_sum = np.cumsum(array, axis=-1)
+    cumulative_mean = cumulative_sum / time
+
+    shifted = array - array[..., :1]
+    shifted_mean = np.cumsum(shifted, axis=-1) / time
+    std = np.sqrt(np.clip(np.cumsum(shifted ** 2, axis=-1) / time - shifted_mean ** 2, 0, None))
+
+    rescaled_range = np.empty(array.shape)
+    for i in range(length):
+        deviation = cumulative_sum[..., :i + 1] - time[:i + 1] * cumulative_mean[..., i:i + 1]
+        rescaled_range[..., i] = np.ptp(deviation, axis=-1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        log_rs = np.log(rescaled_range / std)[..., 1:]
+    log_time = np.log(time)[1:]
+    log_time = log_time - log_time.mean()
+    centered_rs = log_rs - log_rs.mean(axis=-1, keepdims=True)
+    return np.sum(centered_rs * log_time, axis=-1) / np.sum(log_time ** 2)
+
+
+def batch_pfd(array: np.ndarray) -> np.ndarray:
+    diff_sequence = np.diff(array, axis=-1)
+    n_delta = np.sum(diff_sequence[..., 1:] * diff_sequence[..., :-1] < 0, axis=-1)
+    n = array.shape[-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.log10(n) / (np.log10(n) + np.log10(n / n + 0.4 * n_delta))
+
+
+def apply_along_last_axis(method: callable, array: np.ndarray) -> np.ndarray:
+    """Fallback for statistics without a vectorized implementation.
+    """
+    return np.apply_along_axis(method, -1, array)
@@ -6,6 +6,7 @@ from typing import Optional
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.base_extractor import BaseExtractor
+from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 
 
 class QuantileExtractor(BaseExtractor):
@@ -15,6 +16,8 @@ class QuantileExtractor(BaseExtractor):
         window_size (int): size of window
         stride (int): stride for window
         var_threshold (float): threshold for variance
+        batch_mode (bool): if True, statistics are computed for the whole dataset at once instead of per sample
+        batch_size (int): number of samples processed together in batch mode, bounds the memory footprint
 
     Example:
         To use this class you need to import it and call needed methods::
@@ -40,9 +43,12 @@ class QuantileExtractor(BaseExtractor):
         super().__init__(params)
         self.window_size = params.get('window_size', 0)
         self.stride = params.get('stride', 1)
+        self.batch_mode = params.get('batch_mode', True)
+        self.batch_size = params.get('batch_size', 512)
         # self.var_threshold = 0.1
         self.logging_params.update({'Wsize': self.window_size,
                                     'Stride': self.stride,
+                                    'Batch': self.batch_mode,
                                     # 'VarTh': self.var_threshold
                                     }
                                    )
@@ -91,3 +97,56 @@ class QuantileExtractor(BaseExtractor):
                 self.extract_stats_features, ts)
 
         return aggregation_df
+
+    def _get_batch_windows(self, ts: np.array) -> tuple:
+        """Returns all windows of the series in ``ts`` as a view of shape ``(..., n_windows, window_length)``
+        arranged the same way as in ``apply_window_for_stat_feature``.
+        """
+        ts_length = ts.shape[-1]
+        window_size = max(round(ts_length * (self.window_size / 100)), 5)
+        if self.stride > 1:
+            window_length = HankelMatrix(time_series=ts.reshape(-1, ts_length)[0],
+                                         window_size=window_size,
+                                         strides=self.stride).window_length
+            windows = np.lib.stride_tricks.sliding_window_view(
+                ts, window_length, axis=-1)[..., ::self.stride, :]
+        else:
+            windows = np.lib.stride_tricks.sliding_window_view(
+                ts, window_size + 1, axis=-1)[..., :ts_length - window_size, :]
+        return windows, window_size
+
+    def extract_batch_stats_features(self, ts: np.array) -> tuple:
+        """Batch counterpart of ``extract_stats_features``, ``ts`` is an array of shape ``(..., length)``.
+        """
+        global_features, global_names = self.get_batch_statistical_features(
+            ts, add_global_features=True)
+        if self.window_size != 0:
+            windows, window_size = self._get_batch_windows(ts)
+            window_features, names = self.get_batch_statistical_features(windows)
+            window_features = window_features.reshape(*window_features.shape[:-2], -1)
+            window_names = [x + f'_on_interval: {i + 1} - {i + 1 + window_size}'
+                            for i in range(windows.shape[-2]) for x in names]
+        else:
+            window_features, window_names = self.get_batch_statistical_features(ts)
+
+        features = np.nan_to_num(np.concatenate([global_features, window_features], axis=-1))
+        return features, global_names + window_names
+
+    def _transform(self, input_data: InputData) -> np.array:
+        if not self.batch_mode:
+            return super()._transform(input_data)
+
+        # memory-mapped features are read chunk by chunk and never materialised as a whole
+        ts = np.asarray(input_data.features)
+        feature_chunks = []
+        for start in range(0, ts.shape[0], self.batch_size):
+            features, names = self.extract_batch_stats_features(
+                np.asarray(ts[start:start + self.batch_size], dtype=float))
+            feature_chunks.append(features)
+        self.predict = self._clean_predict(np.concatenate(feature_chunks, axis=0))
+
+        if len(ts.shape) > 2:
+            self.relevant_features = [f'component {index}' for index in range(ts.shape[1])]
+        else:
+            self.relevant_features = names
+        return self.predict
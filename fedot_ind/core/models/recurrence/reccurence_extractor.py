@@ -1,9 +1,12 @@
+import math
+from itertools import chain
 from typing import Optional
 
 import numpy as np
 from fedot.core.data.data import InputData
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
+from joblib import delayed, Parallel
 
 # from fedot_ind.core.metrics.metrics_implementation import *
 from fedot_ind.core.models.base_extractor import BaseExtractor
@@ -23,6 +26,7 @@ class RecurrenceExtractor(BaseExtractor):
         self.max_signal_ratio: float, the maximum signal ratio.
         self.rec_metric: str, the metric for calculating the recurrence matrix.
         self.window_size: int, the window size.
+        self.batch_size: int, the maximum number of samples whose recurrence matrices are analysed together.
 
     Example:
         To use this operation you can create pipeline as follows::
@@ -48,9 +52,61 @@ class RecurrenceExtractor(BaseExtractor):
         # TODO add threshold for other metrics
         self.rec_metric = params.get('rec_metric', 'cosine')
         self.image_mode = params.get('image_mode', False)
+        self.batch_size = params.get('batch_size', 16)
         self.transformer = TSTransformer
         self.extractor = RecurrenceFeatureExtractor
 
+    def _transform(self, input_data: InputData) -> np.array:
+        """
+        Method for feature generation for all series. Every worker processes a chunk of samples at once:
+        in window mode trajectory matrices of the chunk are built as a view over the features, and
+        recurrence quantification analysis runs over all recurrence matrices of the chunk together.
+        Chunks are at most ``batch_size`` samples long, so memory doesn't grow with the size of the dataset.
+        """
+        features = np.asarray(input_data.features)
+        self.ts_length = features.shape[-1]
+        chunk_size = max(min(self.batch_size, math.ceil(features.shape[0] / self.n_processes)), 1)
+        chunks = [features[start:start + chunk_size] for start in range(0, features.shape[0], chunk_size)]
+        parallel = Parallel(n_jobs=self.n_processes,
+                            verbose=0, pre_dispatch="2*n_jobs")
+        feature_matrix = parallel(delayed(self._generate_features_from_batch)(
+            chunk) for chunk in chunks)
+        return self._stack_feature_matrix(list(chain(*feature_matrix)))
+
+    def _generate_features_from_batch(self, batch: np.array) -> list:
+        if self.window_size != 0:
+            series = HankelMatrix.get_batch_trajectory_matrix(batch,
+                                                              window_size=self.window_size,
+                                                              strides=self.stride)
+        else:
+            series = batch[:, np.newaxis] if batch.ndim == 2 else batch
+        if self.image_mode:
+            if batch.ndim == 2:
+                return [self._generate_features_from_trajectory(sample[0]) for sample in series]
+            return [self._get_feature_matrix(self._generate_features_from_trajectory, sample)
+                    for sample in series]
+
+        n_samples, n_channels = series.shape[:2]
+        recurrence_matrices = np.stack([self.transformer(time_series=ts, rec_metric=self.rec_metric)
+                                        .ts_to_recurrence_matrix() for sample in series for ts in sample])
+        rqa_features = self.extractor.batch_quantification_analysis(recurrence_matrices)
+        feature_names = list(rqa_features.keys())
+        rqa_features = np.nan_to_num(np.stack(list(rqa_features.values()), axis=-1), posinf=0, neginf=0)
+        rqa_features = rqa_features.reshape(n_samples, n_channels, -1)
+        if batch.ndim == 2:
+            return [self._to_input_data(sample[0], feature_names) for sample in rqa_features]
+        channel_names = [f'component {index}' for index in range(n_channels)]
+        return [self._to_input_data(sample, channel_names) for sample in rqa_features]
+
+    @staticmethod
+    def _to_input_data(features: np.array, feature_names: list) -> InputData:
+        return InputData(idx=np.arange(len(features)),
+                         features=features,
+                         target='no_target',
+                         task='no_task',
+                         data_type=DataTypesEnum.table,
+                         supplementary_data={'feature_name': feature_names})
+
     def _generate_features_from_ts(self, ts: np.array):
         if self.window_size != 0:
             trajectory_transformer = HankelMatrix(time_series=ts,
@@ -58,7 +114,9 @@ class RecurrenceExtractor(BaseExtractor):
                                                   strides=self.stride)
             ts = trajectory_transformer.trajectory_matrix
             self.ts_length = trajectory_transformer.ts_length
+        return self._generate_features_from_trajectory(ts)
 
+    def _generate_features_from_trajectory(self, ts: np.array):
         specter = self.transformer(time_series=ts,
                                    rec_metric=self.rec_metric)
 
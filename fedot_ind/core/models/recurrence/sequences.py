@@ -3,6 +3,50 @@ from __future__ import division, print_function
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
 
+def line_length_histograms(lines: np.ndarray) -> tuple:
+    """Run-length engine for a batch of binary lines. Runs are found from the positions where the value
+    of a line changes, so every line is scanned once for both recurrent (black) and non-recurrent (white) runs.
+
+    Args:
+        lines: binary array of shape (n_matrices, n_lines, line_length).
+
+    Returns:
+        histograms of lengths of black and white runs, both of shape (n_matrices, line_length + 1).
+
+    """
+    lines = np.asarray(lines, dtype=bool)
+    n_matrices, n_lines, line_length = lines.shape
+    boundaries = np.ones((n_matrices, n_lines, line_length + 1), dtype=bool)
+    boundaries[..., 1:-1] = lines[..., 1:] != lines[..., :-1]
+    matrix_idx, line_idx, position = np.nonzero(boundaries)
+    # two consecutive boundaries of the same line are the start and the end of a run
+    same_line = (matrix_idx[1:] == matrix_idx[:-1]) & (line_idx[1:] == line_idx[:-1])
+    run_matrix, run_line = matrix_idx[:-1][same_line], line_idx[:-1][same_line]
+    run_start = position[:-1][same_line]
+    run_length = (position[1:] - position[:-1])[same_line]
+    run_value = lines[run_matrix, run_line, run_start]
+
+    histogram_bins = run_matrix * (line_length + 1) + run_length
+    n_bins = n_matrices * (line_length + 1)
+    black = np.bincount(histogram_bins[run_value], minlength=n_bins)
+    white = np.bincount(histogram_bins[~run_value], minlength=n_bins)
+    return (black.reshape(n_matrices, -1).astype(float),
+            white.reshape(n_matrices, -1).astype(float))
+
+
+def diagonal_lines(recurrence_matrices: np.ndarray) -> np.ndarray:
+    """Rearranges all diagonals of a batch of square matrices into rows of shape (n_matrices, 2 * n - 1, n).
+    Diagonals shorter than ``n`` are padded with zeros, which never extend a run.
+    """
+    n_vectors = recurrence_matrices.shape[-1]
+    offset = np.arange(-n_vectors + 1, n_vectors)[:, np.newaxis]
+    rows = np.arange(n_vectors)[np.newaxis, :]
+    columns = rows + offset
+    valid = (columns >= 0) & (columns < n_vectors)
+    diagonals = recurrence_matrices[:, rows, np.clip(columns, 0, n_vectors - 1)]
+    return diagonals & valid
+
+
 class RecurrenceFeatureExtractor:
     def __init__(self, recurrence_matrix: np.ndarray = None):
         self.recurrence_matrix = recurrence_matrix
@@ -12,151 +56,78 @@ class RecurrenceFeatureExtractor:
             MDL: int = 3,
             MVL: int = 3,
             MWVL: int = 2):
+        features = self.batch_quantification_analysis(
+            self.recurrence_matrix[np.newaxis], MDL, MVL, MWVL)
+        return {name: float(value[0]) for name, value in features.items()}
 
-        n_vectors = self.recurrence_matrix.shape[0]
-        recurrence_rate = float(
-            np.sum(self.recurrence_matrix)) / np.power(n_vectors, 2)
-
-        diagonal_frequency_dist = self.calculate_diagonal_frequency(
-            number_of_vectors=n_vectors)
-        vertical_frequency_dist = self.calculate_vertical_frequency(
-            number_of_vectors=n_vectors, not_white=1)
-        white_vertical_frequency_dist = self.calculate_vertical_frequency(
-            number_of_vectors=n_vectors, not_white=0)
-
-        determinism = self.laminarity_or_determinism(
-            MDL, n_vectors, diagonal_frequency_dist, lam=False)
-        laminarity = self.laminarity_or_determinism(
-            MVL, n_vectors, vertical_frequency_dist, lam=True)
-
-        average_diagonal_line_length = self.average_line_length(
-            MDL, n_vectors, diagonal_frequency_dist)
-        average_vertical_line_length = self.average_line_length(
-            MVL, n_vectors, vertical_frequency_dist)
-        average_white_vertical_line_length = self.average_line_length(
-            MWVL, n_vectors, white_vertical_frequency_dist)
-
-        longest_diagonal_line_length = self.longest_line_length(
-            diagonal_frequency_dist, n_vectors, diag=True)
-        longest_vertical_line_length = self.longest_line_length(
-            vertical_frequency_dist, n_vectors, diag=False)
-        longest_white_vertical_line_length = self.longest_line_length(
-            white_vertical_frequency_dist, n_vectors, diag=False)
-
-        entropy_diagonal_lines = self.entropy_lines(
-            MDL, n_vectors, diagonal_frequency_dist, diag=True)
-        entropy_vertical_lines = self.entropy_lines(
-            MVL, n_vectors, vertical_frequency_dist, diag=False)
-        entropy_white_vertical_lines = self.entropy_lines(
-            MWVL, n_vectors, white_vertical_frequency_dist, diag=False)
-
-        return {
-            'RR': recurrence_rate,
-            'DET': determinism,
-            'ADLL': average_diagonal_line_length,
-            'LDLL': longest_diagonal_line_length,
-            'DIV': 1. / longest_diagonal_line_length,
-            'EDL': entropy_diagonal_lines,
-            'LAM': laminarity,
-            'AVLL': average_vertical_line_length,
-            'LVLL': longest_vertical_line_length,
-            'EVL': entropy_vertical_lines,
-            'AWLL': average_white_vertical_line_length,
-            'LWLL': longest_white_vertical_line_length,
-            'EWLL': entropy_white_vertical_lines,
-            'RDRR': determinism / recurrence_rate,
-            'RLD': laminarity / determinism}
+    @staticmethod
+    def batch_quantification_analysis(
+            recurrence_matrices: np.ndarray,
+            MDL: int = 3,
+            MVL: int = 3,
+            MWVL: int = 2) -> dict:
+        """Recurrence quantification analysis of a batch of recurrence matrices of shape (n_matrices, n, n).
+        Line length histograms of the whole batch are computed at once with the vectorized run-length engine.
+
+        Returns:
+            dict with an array of shape (n_matrices,) for every feature.
+
+        """
+        recurrence_matrices = np.asarray(recurrence_matrices)
+        n_vectors = recurrence_matrices.shape[-1]
+        recurrence_rate = np.sum(recurrence_matrices, axis=(1, 2)) / np.power(n_vectors, 2)
+
+        diagonal_frequency_dist, _ = line_length_histograms(diagonal_lines(recurrence_matrices == 1))
+        vertical_frequency_dist, white_vertical_frequency_dist = line_length_histograms(
+            recurrence_matrices == 1)
+
+        lengths = np.arange(n_vectors + 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            determinism = _weighted_share(diagonal_frequency_dist, MDL, n_vectors - 1)
+            laminarity = _weighted_share(vertical_frequency_dist, MVL, n_vectors)
+            longest_diagonal_line_length = _longest_line_length(diagonal_frequency_dist, lengths)
+            features = {
+                'RR': recurrence_rate,
+                'DET': determinism,
+                'ADLL': _average_line_length(diagonal_frequency_dist, MDL, lengths),
+                'LDLL': longest_diagonal_line_length,
+                'DIV': 1. / longest_diagonal_line_length,
+                'EDL': _entropy_lines(diagonal_frequency_dist, MDL, n_vectors - 1),
+                'LAM': laminarity,
+                'AVLL': _average_line_length(vertical_frequency_dist, MVL, lengths),
+                'LVLL': _longest_line_length(vertical_frequency_dist, lengths),
+                'EVL': _entropy_lines(vertical_frequency_dist, MVL, n_vectors),
+                'AWLL': _average_line_length(white_vertical_frequency_dist, MWVL, lengths),
+                'LWLL': _longest_line_length(white_vertical_frequency_dist, lengths),
+                'EWLL': _entropy_lines(white_vertical_frequency_dist, MWVL, n_vectors),
+                'RDRR': determinism / recurrence_rate,
+                'RLD': laminarity / determinism}
+        return features
 
     def calculate_vertical_frequency(self, number_of_vectors, not_white: int):
-        vertical_frequency_distribution = np.zeros(number_of_vectors + 1)
-        for i in range(number_of_vectors):
-            vertical_line_length = 0
-            for j in range(number_of_vectors):
-                if self.recurrence_matrix[i, j] == not_white:
-                    vertical_line_length += 1
-                    if j == (number_of_vectors - 1):
-                        vertical_frequency_distribution[vertical_line_length] += 1.0
-                else:
-                    if vertical_line_length != 0:
-                        vertical_frequency_distribution[vertical_line_length] += 1.0
-                        vertical_line_length = 0
-        return vertical_frequency_distribution
+        black, white = line_length_histograms(self.recurrence_matrix[np.newaxis] == 1)
+        return black[0] if not_white else white[0]
 
     def calculate_diagonal_frequency(self, number_of_vectors):
-        diagonal_frequency_distribution = np.zeros(number_of_vectors + 1)
-        for i in range(number_of_vectors - 1, -1, -1):
-            diagonal_line_length = 0
-            for j in range(0, number_of_vectors - i):
-                if self.recurrence_matrix[i + j, j] == 1:
-                    diagonal_line_length += 1
-                    if j == (number_of_vectors - i - 1):
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                else:
-                    if diagonal_line_length != 0:
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                        diagonal_line_length = 0
-
-        for k in range(1, number_of_vectors):
-            diagonal_line_length = 0
-            for i in range(number_of_vectors - k):
-                j = i + k
-                if self.recurrence_matrix[i, j] == 1:
-                    diagonal_line_length += 1
-                    if j == (number_of_vectors - 1):
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                else:
-                    if diagonal_line_length != 0:
-                        diagonal_frequency_distribution[diagonal_line_length] += 1.0
-                        diagonal_line_length = 0
-        return diagonal_frequency_distribution
-
-    def entropy_lines(
-            self,
-            factor,
-            number_of_vectors,
-            distribution,
-            diag: bool):
-        if diag:
-            sum_frequency_distribution = float(np.sum(distribution[factor:-1]))
-        else:
-            number_of_vectors = number_of_vectors + 1
-            sum_frequency_distribution = float(np.sum(distribution[factor:]))
-
-        entropy_lines = 0
-        for i in range(factor, number_of_vectors):
-            if distribution[i] != 0:
-                entropy_lines += (distribution[i] / sum_frequency_distribution) * \
-                    np.log(distribution[i] / sum_frequency_distribution)
-        return -entropy_lines
-
-    def laminarity_or_determinism(
-            self,
-            factor,
-            number_of_vectors,
-            distribution,
-            lam: bool):
-        if lam:
-            number_of_vectors = number_of_vectors + 1
-        numerator = np.sum([i * distribution[i]
-                            for i in range(factor, number_of_vectors)])
-        denominator = np.sum([i * distribution[i]
-                              for i in range(1, number_of_vectors)])
-        return numerator / denominator
-
-    def longest_line_length(
-            self,
-            frequency_distribution,
-            number_of_vectors,
-            diag: bool):
-        longest_line_length = 1
-        for i in range(number_of_vectors, 0, -1):
-            if frequency_distribution[i] != 0:
-                return i
-        return longest_line_length
-
-    def average_line_length(self, factor, number_of_vectors, distribution):
-        numerator = np.sum([i * distribution[i]
-                            for i in range(factor, number_of_vectors + 1)])
-        denominator = np.sum([distribution[i]
-                              for i in range(factor, number_of_vectors + 1)])
-        return numerator / denominator
+        return line_length_histograms(diagonal_lines(self.recurrence_matrix[np.newaxis] == 1))[0][0]
+
+
+def _weighted_share(distribution, factor, max_length):
+    weighted = distribution * np.arange(distribution.shape[-1])
+    return np.sum(weighted[:, factor:max_length + 1], axis=1) / np.sum(weighted[:, 1:max_length + 1], axis=1)
+
+
+def _average_line_length(distribution, factor, lengths):
+    return np.sum(distribution[:, factor:] * lengths[factor:], axis=1) / np.sum(distribution[:, factor:], axis=1)
+
+
+def _longest_line_length(distribution, lengths):
+    longest_line_length = np.max(np.where(distribution[:, 1:] != 0, lengths[1:], 0), axis=1)
+    return np.maximum(longest_line_length, 1)
+
+
+def _entropy_lines(distribution, factor, max_length):
+    distribution = distribution[:, factor:max_length + 1]
+    probability = distribution / np.sum(distribution, axis=1, keepdims=True)
+    return -np.sum(np.where(distribution != 0, probability * np.log(np.where(probability > 0, probability, 1)), 0),
+                   axis=1)
@@ -1,9 +1,9 @@
+import hashlib
+import threading
 from abc import ABC
-from multiprocessing.dummy import Pool as ThreadPool
+from collections import OrderedDict
 
 import pandas as pd
-from gtda.diagrams import BettiCurve, Filtering, PersistenceEntropy, PersistenceLandscape, Scaler
-from gtda.homology import VietorisRipsPersistence
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 
@@ -23,6 +23,11 @@ class PersistenceDiagramFeatureExtractor(ABC):
 class PersistenceDiagramsExtractor:
     """Class to extract persistence diagrams from time series.
 
+    Persistence and scaling transformers are created on first use and reused. Diagrams are cached on class level
+    by hash of the point cloud and extraction parameters, so the same windows are not recomputed by
+    different pipelines (and copies of them) in one process. The cache is guarded by a lock, so
+    extractors can be used from thread backends of evaluation.
+
     Args:
         takens_embedding_dim: Dimension of the Takens embedding.
         takens_embedding_delay: Delay of the Takens embedding.
@@ -30,15 +35,20 @@ class PersistenceDiagramsExtractor:
         filtering: Whether to filter the persistence diagrams.
         filtering_dimensions: Homology dimensions to filter.
         parallel: Whether to parallelize the computation.
+        max_edge_length: Maximum radius of the Vietoris–Rips filtration.
 
     """
+    diagram_cache_ = OrderedDict()
+    cache_size_ = 10000
+    cache_lock_ = threading.RLock()
 
     def __init__(self, takens_embedding_dim: int,
                  takens_embedding_delay: int,
                  homology_dimensions: tuple,
                  filtering: bool = False,
                  filtering_dimensions: tuple = (1, 2),
-                 parallel: bool = False):
+                 parallel: bool = False,
+                 max_edge_length: float = np.inf):
         self.takens_embedding_dim_ = takens_embedding_dim
         self.takens_embedding_delay_ = takens_embedding_delay
         self.homology_dimensions_ = homology_dimensions
@@ -46,32 +56,93 @@ class PersistenceDiagramsExtractor:
         self.filtering_dimensions_ = filtering_dimensions
         self.parallel_ = parallel
         self.n_job = None
+        self.max_edge_length_ = max_edge_length
+        self.persistence_ = None
+        self.diagram_scaler_ = None
+        self.diagram_filter_ = None
+
+    def _init_transformers_(self):
+        # giotto-tda is heavy to import, extractors are created with constants on import of the repository
+        from gtda.diagrams import Filtering, Scaler
+        from gtda.homology import VietorisRipsPersistence
+
+        self.persistence_ = VietorisRipsPersistence(
+            metric='euclidean',
+            homology_dimensions=self.homology_dimensions_,
+            max_edge_length=self.max_edge_length_,
+            n_jobs=self.n_job)
+        self.diagram_scaler_ = Scaler(n_jobs=self.n_job)
+        self.diagram_filter_ = Filtering(
+            epsilon=0.1, homology_dimensions=self.filtering_dimensions_)
 
     def persistence_diagrams_(self, x_embeddings):
         if self.parallel_:
-            pool = ThreadPool()
-            x_transformed = pool.map(self.parallel_embed_, x_embeddings)
-            pool.close()
-            pool.join()
-            return x_transformed
+            return self.transform_batch(x_embeddings, n_jobs=-1)
         else:
             return self.parallel_embed_(x_embeddings)
 
     def parallel_embed_(self, embedding):
-        vr = VietorisRipsPersistence(
-            metric='euclidean',
-            homology_dimensions=self.homology_dimensions_,
-            n_jobs=self.n_job)
-        diagram_scaler = Scaler(n_jobs=self.n_job)
-        persistence_diagrams = diagram_scaler.fit_transform(
-            vr.fit_transform([embedding]))
+        return self.transform_batch([embedding])[0]
+
+    def transform_batch(self, x_embeddings, n_jobs: int = None) -> list:
+        """Computes persistence diagrams of a batch of point clouds. Clouds missing in cache are passed
+        to a single ``fit_transform`` call, which distributes them over ``n_jobs`` worker processes.
+
+        Args:
+            x_embeddings: list of point clouds.
+            n_jobs: number of processes, see ``joblib.Parallel``.
+
+        Returns:
+            list of diagrams, the same as separate computation of every diagram gives.
+
+        """
+        keys = [self._diagram_key(embedding) for embedding in x_embeddings]
+        # cached diagrams are taken before new ones are inserted, insertion may evict them
+        with self.cache_lock_:
+            diagrams = {key: self._get_cached_diagram(key) for key in keys if key in self.diagram_cache_}
+        missing = {key: embedding for key, embedding in zip(keys, x_embeddings) if key not in diagrams}
+        if missing:
+            if self.persistence_ is None:
+                self._init_transformers_()
+            self.persistence_.set_params(n_jobs=n_jobs)
+            computed = self.persistence_.fit_transform(list(missing.values()))
+            computed = {key: self._postprocess_diagram(diagram)
+                        for key, diagram in zip(missing, computed)}
+            with self.cache_lock_:
+                for key, diagram in computed.items():
+                    self._cache_diagram(key, diagram)
+            diagrams.update(computed)
+        return [diagrams[key] for key in keys]
+
+    def _postprocess_diagram(self, diagram):
+        # diagrams of a batch are padded to the same size, keep only points of this diagram
+        subdiagrams = []
+        for dim in sorted(self.homology_dimensions_):
+            subdiagram = diagram[diagram[:, 2] == dim]
+            subdiagram = subdiagram[subdiagram[:, 0] < subdiagram[:, 1]]
+            subdiagrams.append(subdiagram if len(subdiagram) else np.array([[0., 0., dim]]))
+        persistence_diagrams = self.diagram_scaler_.fit_transform(
+            np.concatenate(subdiagrams)[np.newaxis])
         if self.filtering_:
-            diagram_filter = Filtering(
-                epsilon=0.1, homology_dimensions=self.filtering_dimensions_)
-            persistence_diagrams = diagram_filter.fit_transform(
+            persistence_diagrams = self.diagram_filter_.fit_transform(
                 persistence_diagrams)
         return persistence_diagrams[0]
 
+    def _get_cached_diagram(self, key):
+        self.diagram_cache_.move_to_end(key)
+        return self.diagram_cache_[key]
+
+    def _cache_diagram(self, key, diagram):
+        self.diagram_cache_[key] = diagram
+        while len(self.diagram_cache_) > self.cache_size_:
+            self.diagram_cache_.popitem(last=False)
+
+    def _diagram_key(self, embedding) -> tuple:
+        embedding = np.ascontiguousarray(embedding)
+        return (tuple(self.homology_dimensions_), self.filtering_, tuple(self.filtering_dimensions_),
+                self.max_edge_length_, embedding.shape, embedding.dtype.str,
+                hashlib.sha1(embedding.tobytes()).hexdigest())
+
     def transform(self, x_embeddings):
         x_persistence_diagrams = self.persistence_diagrams_(x_embeddings)
         return x_persistence_diagrams
@@ -86,8 +157,9 @@ class TopologicalFeaturesExtractor:
         self.persistence_diagram_features_ = persistence_diagram_features
 
     def transform(self, x):
+        return self.transform_diagram(self.persistence_diagram_extractor_.transform(x))
 
-        x_pers_diag = self.persistence_diagram_extractor_.transform(x)
+    def transform_diagram(self, x_pers_diag):
         feature_list = []
         column_list = []
         for feature_name, feature_model in self.persistence_diagram_features_.items():
@@ -192,6 +264,8 @@ class PersistenceEntropyFeature(PersistenceDiagramFeatureExtractor):
         super(PersistenceEntropyFeature).__init__()
 
     def extract_feature_(self, persistence_diagram):
+        from gtda.diagrams import PersistenceEntropy
+
         persistence_entropy = PersistenceEntropy(n_jobs=-1)
         return persistence_entropy.fit_transform([persistence_diagram])[0]
 
@@ -247,6 +321,8 @@ class AveragePersistenceLandscapeFeature(PersistenceDiagramFeatureExtractor):
         super(AveragePersistenceLandscapeFeature).__init__()
 
     def extract_feature_(self, persistence_diagram):
+        from gtda.diagrams import PersistenceLandscape
+
         # As practice shows, only 1st layer of 1st homology dimension plays
         # role
         persistence_landscape = PersistenceLandscape(
@@ -260,6 +336,8 @@ class BettiNumbersSumFeature(PersistenceDiagramFeatureExtractor):
         super(BettiNumbersSumFeature).__init__()
 
     def extract_feature_(self, persistence_diagram):
+        from gtda.diagrams import BettiCurve
+
         betti_curve = BettiCurve(
             n_jobs=-1).fit_transform([persistence_diagram])[0]
         return np.array([np.sum(betti_curve[i, :])
@@ -271,6 +349,8 @@ class RadiusAtMaxBNFeature(PersistenceDiagramFeatureExtractor):
         super(RadiusAtMaxBNFeature).__init__()
 
     def extract_feature_(self, persistence_diagram, n_bins=100):
+        from gtda.diagrams import BettiCurve
+
         betti_curve = BettiCurve(
             n_jobs=-1, n_bins=n_bins).fit_transform([persistence_diagram])[0]
         max_dim = int(np.max(persistence_diagram[:, 2])) + 1
@@ -24,7 +24,10 @@ class TopologicalExtractor(BaseExtractor):
     """Class for extracting topological features from time series data.
 
     Args:
-        params: parameters for operation
+        params: parameters for operation. Approximate mode for long series is enabled by ``max_points``,
+            the maximum size of point cloud (larger clouds are replaced by maxmin landmarks), and
+            ``max_edge_length``, the maximum radius of the filtration. Summary of the approximation
+            is stored in ``approximation`` attribute and in metadata of generated features.
 
     Example:
         To use this operation you can create pipeline as follows::
@@ -49,10 +52,21 @@ class TopologicalExtractor(BaseExtractor):
         super().__init__(params)
         self.window_size = params.get('window_size', 10)
         self.stride = params.get('stride', 1)
+        self.max_points = params.get('max_points', None)
+        self.max_edge_length = params.get('max_edge_length', None)
+        if self.max_edge_length is None:
+            persistence_diagram_extractor = PERSISTENCE_DIAGRAM_EXTRACTOR
+        else:
+            persistence_diagram_extractor = PersistenceDiagramsExtractor(
+                takens_embedding_dim=1,
+                takens_embedding_delay=2,
+                homology_dimensions=(0, 1),
+                max_edge_length=self.max_edge_length)
         self.feature_extractor = TopologicalFeaturesExtractor(
-            persistence_diagram_extractor=PERSISTENCE_DIAGRAM_EXTRACTOR,
+            persistence_diagram_extractor=persistence_diagram_extractor,
             persistence_diagram_features=PERSISTENCE_DIAGRAM_FEATURES)
         self.data_transformer = None
+        self.approximation = None
 
     def __evaluate_persistence_params(self, ts_data: np.array):
         if self.feature_extractor is None:
@@ -72,16 +86,50 @@ class TopologicalExtractor(BaseExtractor):
                 persistence_diagram_extractor=persistence_diagram_extractor,
                 persistence_diagram_features=PERSISTENCE_DIAGRAM_FEATURES)
 
-    def _generate_features_from_ts(self, ts_data: np.array,
-                                   persistence_params: dict) -> InputData:
+    def _transform(self, input_data: InputData) -> np.array:
+        """
+        Method for feature generation for all series. Persistence diagrams of point clouds of all samples
+        and channels are computed at once on a pool of ``n_processes`` processes, then features of every
+        sample are generated from its diagrams.
+        """
+        features = np.asarray(input_data.features)
+        series = features.reshape(-1, features.shape[-1])
+        point_clouds, approximations = [], []
+        for ts_data in series:
+            point_clouds.append(self._get_point_cloud(ts_data))
+            approximations.append(self.data_transformer.approximation)
+        self.approximation = self._summarize_approximation(approximations)
+        diagrams = self.feature_extractor.persistence_diagram_extractor_.transform_batch(
+            point_clouds, n_jobs=self.n_processes)
+
+        channel_diagrams = list(zip(diagrams, approximations))
+        if features.ndim == 2:
+            feature_matrix = [self._generate_features_from_diagram(*diagram) for diagram in channel_diagrams]
+        else:
+            n_channels = features.shape[1]
+            feature_matrix = [self._get_feature_matrix(lambda diagram: self._generate_features_from_diagram(*diagram),
+                                                       channel_diagrams[start:start + n_channels])
+                              for start in range(0, len(channel_diagrams), n_channels)]
+        return self._stack_feature_matrix(feature_matrix)
+
+    def _get_point_cloud(self, ts_data: np.array, persistence_params: dict = None) -> np.array:
         if self.data_transformer is None:
             self.data_transformer = TopologicalTransformation(
                 persistence_params=persistence_params, window_length=round(
-                    ts_data.shape[0] * 0.01 * self.window_size))
-
-        point_cloud = self.data_transformer.time_series_to_point_cloud(
+                    ts_data.shape[0] * 0.01 * self.window_size),
+                max_points=self.max_points,
+                max_edge_length=self.max_edge_length)
+        return self.data_transformer.time_series_to_point_cloud(
             input_data=ts_data)
-        topological_features = self.feature_extractor.transform(point_cloud)
+
+    def _generate_features_from_ts(self, ts_data: np.array,
+                                   persistence_params: dict) -> InputData:
+        point_cloud = self._get_point_cloud(ts_data, persistence_params)
+        diagram = self.feature_extractor.persistence_diagram_extractor_.transform(point_cloud)
+        return self._generate_features_from_diagram(diagram, self.data_transformer.approximation)
+
+    def _generate_features_from_diagram(self, diagram: np.array, approximation: dict = None) -> InputData:
+        topological_features = self.feature_extractor.transform_diagram(diagram)
         topological_features = InputData(
             idx=np.arange(
                 len(
@@ -91,9 +139,21 @@ class TopologicalExtractor(BaseExtractor):
             task='no_task',
             data_type=DataTypesEnum.table,
             supplementary_data={
-                'feature_name': topological_features.columns})
+                'feature_name': topological_features.columns,
+                'approximation': self._summarize_approximation([approximation])})
         return topological_features
 
+    def _summarize_approximation(self, approximations: list) -> Optional[dict]:
+        approximations = [approximation for approximation in approximations if approximation is not None]
+        if not approximations and self.max_edge_length is None:
+            return None
+        return {'n_approximated_clouds': len(approximations),
+                'max_n_points': max([approximation['n_points'] for approximation in approximations], default=None),
+                'n_landmarks': self.max_points,
+                'max_covering_radius': max([approximation['covering_radius'] for approximation in approximations],
+                                           default=0.),
+                'max_edge_length': self.max_edge_length}
+
     def generate_topological_features(
             self,
             ts: np.array,
@@ -1,18 +1,20 @@
-from copy import deepcopy
 from typing import Optional
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import ModelImplementation
 from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from fedot.core.repository.dataset_types import DataTypesEnum
 from golem.core.tuning.simultaneous import SimultaneousTuner
 from pymonad.either import Either
 
 from fedot_ind.core.architecture.preprocessing.data_convertor import FedotConverter
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.operation.decomposition.matrix_decomposition.incremental_svd import svd_append_column
 from fedot_ind.core.operation.transformation.basis.eigen_basis import EigenBasisImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
-from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis
+from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis, \
+    sv_to_explained_variance_ratio
 from fedot_ind.core.repository.constanst_repository import FEDOT_TUNING_METRICS
 from fedot_ind.core.repository.industrial_implementations.abstract import build_tuner
 
@@ -22,7 +24,9 @@ class SSAForecasterImplementation(ModelImplementation):
     For given time series ``T`` we construct trajectory matrix (hankel matrix) ``X``, where
     ``X = U x S x V_t``. After decomposition, we forecast ``V_t`` rows separately, and after
     that reconstruct basis. Note that we use only few components to reconstruct basis. Other
-    components considered as error (we just sample them).
+    components considered as error (we just sample them). Decomposition and tuned models of component
+    dynamics are obtained once in ``fit``; new observations passed to ``predict`` update the decomposition
+    with rank-one SVD updates.
 
     Attributes:
         window_size_method: str, method for estimating window size for SSA forecaster
@@ -78,10 +82,7 @@ class SSAForecasterImplementation(ModelImplementation):
                                                       self.tuning_params,
                                                       component,
                                                       'head')
-        component_model.fit(component)
-        reconstructed_forecast = component_model.predict(
-            component).predict[-self.horizon:]
-        return reconstructed_forecast, component_model
+        return component_model
 
     def _combine_trajectory(self, U, VT, n_components):
         if len(self._rank_thr) > 2:
@@ -98,38 +99,95 @@ class SSAForecasterImplementation(ModelImplementation):
 
         return current_dynamics
 
-    def predict(self, input_data: InputData) -> OutputData:
+    def _init_decomposer(self):
+        if self._decomposer is None:
+            self._decomposer = EigenBasisImplementation(
+                {'low_rank_approximation': self.low_rank_approximation,
+                 'rank_regularization': 'explained_dispersion'})
+
+    def _get_history(self, input_data: InputData) -> np.ndarray:
+        time_series = np.asarray(input_data.features).squeeze()
+        return time_series[-self.history_lookback:] if time_series.shape[0] > self.history_lookback else time_series
+
+    def _component_data(self, input_data: InputData, component: np.ndarray) -> InputData:
+        return InputData(idx=np.arange(component.shape[0]),
+                         features=component,
+                         target=component,
+                         task=input_data.task,
+                         data_type=DataTypesEnum.ts)
+
+    def _decompose(self, time_series: np.ndarray):
         hankel_matrix = HankelMatrix(
-            time_series=input_data.features,
+            time_series=time_series,
             window_size=self._decomposer.window_size).trajectory_matrix
-        U, s, VT = np.linalg.svd(hankel_matrix)
+        self._window_length = hankel_matrix.shape[0]
+        self._U, self._s, self._VT = np.linalg.svd(hankel_matrix, full_matrices=False)
+        self._history = time_series
+
+    def _update_decomposition(self, time_series: np.ndarray):
+        """Brings decomposition in line with the history given at predict time. Observations appended after the
+        fitted history are added to the trajectory matrix column by column with rank-one SVD updates. Unknown
+        history or history which became twice longer than ``history_lookback`` is decomposed from scratch.
+        """
+        history_start = self._history_end - self._history.shape[0]
+        is_continuation = time_series.shape[0] >= self._history_end and np.array_equal(
+            time_series[history_start:self._history_end], self._history)
+        if not is_continuation or time_series.shape[0] - history_start > 2 * self.history_lookback:
+            self._decompose(time_series[-self.history_lookback:])
+        else:
+            for end in range(self._history_end + 1, time_series.shape[0] + 1):
+                self._U, self._s, self._VT = svd_append_column(self._U, self._s, self._VT,
+                                                               time_series[end - self._window_length:end])
+            self._history = time_series[history_start:]
+        self._history_end = time_series.shape[0]
+
+    def fit(self, input_data: InputData):
+        """Decomposes the history and tunes models of component dynamics. Tuned models are stored, so predict
+        only extends component dynamics by the forecast horizon.
+        """
+        self.horizon = input_data.task.task_params.forecast_length
+        self._init_decomposer()
+        full_series = np.asarray(input_data.features).squeeze()
+        self._history_end = full_series.shape[0]
+        self._decompose(self._get_history(input_data))
+        self._rank_thr = list(range(max(sv_to_explained_variance_ratio(self._s, 3)[1], 2) - 1))
         n_components = max(2, len(self._rank_thr))
-        current_dynamics = self._combine_trajectory(U, VT, n_components)
+        current_dynamics = self._combine_trajectory(self._U, self._VT, n_components)
 
         if self.mode == 'one_dimensional':
-            comp = deepcopy(input_data)
-            basis = reconstruct_basis(U=self.PCT,
-                                      Sigma=s[:self.PCT.shape[1]],
-                                      VT=current_dynamics,
-                                      ts_length=input_data.features.shape[0])
-            comp.features, comp.idx = np.array(basis).sum(
-                axis=1), np.arange(np.array(basis).sum(axis=1).shape[0])
-
-            reconstructed_forecast, self.model_by_channel = self._tune_component_model(
-                self.trend_model.build(), comp)
+            self.model_by_channel = self._tune_component_model(
+                self.trend_model.build(), self._component_data(input_data, self._reconstruct(current_dynamics)))
         elif self.mode == 'channel_independent':
-            forecast_by_channel, self.model_by_channel = self._predict_channel(
-                input_data, current_dynamics, self.horizon)
+            self.model_by_channel = {}
+            for index, component in enumerate(current_dynamics):
+                model_to_tune = self.component_model.build() if index != 0 else self.trend_model.build()
+                self.model_by_channel[f'{index}_channel'] = self._tune_component_model(
+                    model_to_tune, self._component_data(input_data, component))
+        return self
+
+    def _reconstruct(self, dynamics: np.ndarray) -> np.ndarray:
+        basis = reconstruct_basis(U=self.PCT,
+                                  Sigma=self._s[:self.PCT.shape[1]],
+                                  VT=dynamics,
+                                  ts_length=self._window_length + dynamics.shape[1] - 1)
+        return np.array(basis).sum(axis=1)
 
-            self.forecasted_dynamics = np.concatenate(
-                [current_dynamics, np.vstack(list(forecast_by_channel.values()))], axis=1)
-            basis = reconstruct_basis(U=self.PCT,
-                                      Sigma=s[:self.PCT.shape[1]],
-                                      VT=self.forecasted_dynamics,
-                                      ts_length=input_data.features.shape[0] + self.horizon)
+    def predict(self, input_data: InputData) -> OutputData:
+        self._update_decomposition(np.asarray(input_data.features).squeeze())
+        n_components = max(2, len(self._rank_thr))
+        current_dynamics = self._combine_trajectory(self._U, self._VT, n_components)
 
-            summed_basis = np.array(basis).sum(axis=1)
-            reconstructed_forecast = summed_basis[-self.horizon:]
+        if self.mode == 'one_dimensional':
+            component = self._component_data(input_data, self._reconstruct(current_dynamics))
+            reconstructed_forecast = self.model_by_channel.predict(component).predict[-self.horizon:]
+        elif self.mode == 'channel_independent':
+            forecast_by_channel = [
+                self.model_by_channel[f'{index}_channel'].predict(
+                    self._component_data(input_data, component)).predict[-self.horizon:]
+                for index, component in enumerate(current_dynamics)]
+            self.forecasted_dynamics = np.concatenate(
+                [current_dynamics, np.vstack(forecast_by_channel)], axis=1)
+            reconstructed_forecast = self._reconstruct(self.forecasted_dynamics)[-self.horizon:]
 
         prediction = reconstructed_forecast
         predict_data = FedotConverter(input_data).convert_to_output_data(
@@ -138,15 +196,12 @@ class SSAForecasterImplementation(ModelImplementation):
             output_data_type=input_data.data_type)
         return predict_data
 
-    def fit(self, input_data: InputData):
-        pass
-
     def __predict_for_fit(self, ts):
         basis = self._decomposer.transform(ts)
-        self._rank_thr = list(range(basis.predict.shape[0] - 1))
-        if len(self._rank_thr) > 2:
+        rank_thr = list(range(basis.predict.shape[0] - 1))
+        if len(rank_thr) > 2:
             components_correlation = np.concatenate([basis.predict[0, :].reshape(1, -1), np.array([np.sum(
-                [basis.predict[i, :], basis.predict[i + 1, :]], axis=0) for i in self._rank_thr
+                [basis.predict[i, :], basis.predict[i + 1, :]], axis=0) for i in rank_thr
                 if i != 0 and i % 2 != 0])])
         else:
             components_correlation = basis.predict
@@ -157,42 +212,11 @@ class SSAForecasterImplementation(ModelImplementation):
     def predict_for_fit(self, input_data: InputData) -> OutputData:
         if self.horizon is None:
             self.horizon = input_data.task.task_params.forecast_length
-        if input_data.features.shape[0] > self.history_lookback:
-            self.history_lookback = round(input_data.features.shape[0] * 0.2) \
-                if self.history_lookback == 0 else self.history_lookback
-            input_data.features = input_data.features[-self.history_lookback:].squeeze(
-            )
-        else:
-            self.history_lookback = None
-        self._decomposer = EigenBasisImplementation(
-            {
-                'low_rank_approximation': self.low_rank_approximation,
-                'rank_regularization': 'explained_dispersion'})
+        input_data.features = self._get_history(input_data)
+        self._init_decomposer()
         predict = self.__predict_for_fit(input_data)
         return predict
 
-    def _predict_channel(
-            self,
-            input_data: InputData,
-            component_dynamics,
-            forecast_length: int):
-        comp = deepcopy(input_data)
-        comp.features, comp.target, comp.idx = component_dynamics, component_dynamics, \
-            np.arange(component_dynamics.shape[1])
-        forecast_by_channel, model_by_channel = {}, {}
-        for index, ts_comp in enumerate(comp.features):
-            comp.features = ts_comp
-            comp.target = ts_comp
-            model_to_tune = self.component_model.build(
-            ) if index != 0 else self.trend_model.build()
-            reconstructed_forecast, component_model = self._tune_component_model(
-                model_to_tune, comp)
-            forecast_by_channel.update(
-                {f'{index}_channel': reconstructed_forecast})
-            model_by_channel.update({f'{index}_channel': component_model})
-
-        return forecast_by_channel, model_by_channel
-
     def reconstruct_basis(self, U, s, VT):
         return Either.insert([U, s, VT]).then(
             self._decomposer.data_driven_basis).value[0]
@@ -10,6 +10,7 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot_ind.api.utils.path_lib import PROJECT_PATH
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.operation.caching import DataCacher
+from fedot_ind.core.repository.constanst_repository import CACHE_SIZE_LIMIT
 
 
 class IndustrialCachableOperationImplementation(DataOperationImplementation):
@@ -18,7 +19,9 @@ class IndustrialCachableOperationImplementation(DataOperationImplementation):
         cache_folder = os.path.join(PROJECT_PATH, 'cache')
         os.makedirs(cache_folder, exist_ok=True)
         self.cacher = DataCacher(data_type_prefix='Features of basis',
-                                 cache_folder=cache_folder)
+                                 cache_folder=cache_folder,
+                                 max_cache_size=self.params.get('cache_size_limit', CACHE_SIZE_LIMIT),
+                                 mmap_mode=self.params.get('cache_mmap_mode', None))
 
         self.data_type = DataTypesEnum.image
 
@@ -81,7 +84,8 @@ class IndustrialCachableOperationImplementation(DataOperationImplementation):
                     'n_processes',
                     'logging_params',
                     'logger',
-                    'relevant_features']}
+                    'relevant_features',
+                    'predict']}
 
             hashed_info = self.cacher.hash_info(
                 data=input_data.features,
@@ -90,6 +94,8 @@ class IndustrialCachableOperationImplementation(DataOperationImplementation):
                 predict = self.try_load_from_cache(hashed_info)
             except FileNotFoundError:
                 predict = self._transform(input_data)
+                if isinstance(predict, OutputData):
+                    predict = predict.predict
                 self.cacher.cache_data(hashed_info, predict)
 
             predict = self._convert_to_output(
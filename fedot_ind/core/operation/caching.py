@@ -1,6 +1,10 @@
 import hashlib
 import os
+import pickle
+import sqlite3
+import time
 import timeit
+from typing import Optional
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 import pandas as pd
@@ -10,27 +14,58 @@ from fedot_ind.api.utils.path_lib import PROJECT_PATH
 
 
 class DataCacher:
-    """Class responsible for caching data of ``pd.DataFrame`` type in pickle format.
+    """Class responsible for caching arrays and ``pd.DataFrame`` data as ``.npy`` files.
+
+    Cache keys are built from the content of the data (raw array buffer together with its shape and dtype), so
+    different arrays never share a key. Every cached file is registered in an sqlite index with its size and
+    last access time. Files which are not in the index yet (e.g. written before the index existed) are registered
+    with their modification time when the folder is opened for the first time. When ``max_cache_size`` is set,
+    the least recently used files are evicted as soon as the cache exceeds the budget. Files are written atomically
+    and the index is guarded by sqlite locks, so several processes can share one cache folder.
+
+    With ``mmap_mode`` set, cached arrays are returned as read-only memory maps of the ``.npy`` files instead of
+    being loaded into RAM, so a cache hit costs almost nothing and consumers can stream over samples of tensors
+    larger than memory.
+
     Args:
         data_type_prefix: a string prefix related to the data to be cached. For example, if data is related to
         modelling results, then the prefix can be 'ModellingResults'. Default prefix is 'Data'.
         cache_folder: path to the folder where data is going to be cached.
+        max_cache_size: cache budget in bytes. If ``None``, the cache is unbounded.
+        mmap_mode: if not ``None``, cached arrays are opened with ``np.load(..., mmap_mode=mmap_mode)``.
     Examples:
         >>> your_data = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]})
         >>> data_cacher = DataCacher(data_type_prefix='data', cache_folder='your_path')
         >>> hashed_info = data_cacher.hash_info(dict(name='data', data=your_data))
         >>> data_cacher.cache_data(hashed_info, your_data)
         >>> data_cacher.load_data_from_cache(hashed_info)
+        >>> data_cacher.cache_info()
     """
 
+    index_name = 'cache_index.sqlite'
+    _indexed_folders = set()
+
     def __init__(
             self,
             data_type_prefix: str = 'Data',
-            cache_folder: str = None):
+            cache_folder: str = None,
+            max_cache_size: Optional[int] = None,
+            mmap_mode: Optional[str] = None):
         self.data_type = data_type_prefix
         self.cache_folder = self._init_cache_folder(cache_folder)
+        self.max_cache_size = max_cache_size
+        self.mmap_mode = mmap_mode
+        self.index_path = os.path.join(self.cache_folder, self.index_name)
+        self.stats = {'hits': 0,
+                      'misses': 0,
+                      'bytes_read': 0,
+                      'bytes_written': 0,
+                      'evictions': 0}
 
         self.logger = logging.getLogger('DataCacher')
+        if self.cache_folder not in DataCacher._indexed_folders:
+            self._index_untracked_files()
+            DataCacher._indexed_folders.add(self.cache_folder)
 
     def _init_cache_folder(self, cache_folder):
         if cache_folder is None:
@@ -41,26 +76,63 @@ class DataCacher:
         os.makedirs(cache_folder, exist_ok=True)
         return cache_folder
 
+    def _connect_to_index(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.index_path, timeout=60, isolation_level=None)
+        connection.execute('CREATE TABLE IF NOT EXISTS entries '
+                           '(key TEXT PRIMARY KEY, size INTEGER, last_access REAL)')
+        return connection
+
+    def _index_untracked_files(self):
+        """Registers ``.npy`` files of the cache folder missing in the index, so they count toward
+        ``max_cache_size`` and can be evicted. Their last access is their modification time.
+        """
+        connection = self._connect_to_index()
+        try:
+            indexed_keys = {key for key, in connection.execute('SELECT key FROM entries')}
+            untracked_entries = []
+            for file_name in os.listdir(self.cache_folder):
+                key, extension = os.path.splitext(file_name)
+                if extension != '.npy' or key in indexed_keys or key.endswith('.tmp'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_folder, file_name))
+                except FileNotFoundError:
+                    continue
+                untracked_entries.append((key, stat.st_size, stat.st_mtime))
+            connection.executemany('INSERT OR IGNORE INTO entries VALUES (?, ?, ?)', untracked_entries)
+        finally:
+            connection.close()
+        if untracked_entries and self.max_cache_size is not None:
+            self._evict()
+
+    @staticmethod
+    def _update_hash(hasher, data):
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            labels = data.columns if isinstance(data, pd.DataFrame) else data.name
+            hasher.update(repr(labels).encode('utf8'))
+            data = pd.util.hash_pandas_object(data, index=True).values
+        if isinstance(data, np.ndarray) and data.dtype != object:
+            hasher.update(repr((data.shape, data.dtype.str)).encode('utf8'))
+            hasher.update(np.ascontiguousarray(data).view(np.uint8).data)
+        elif isinstance(data, np.ndarray):
+            hasher.update(pickle.dumps(data, protocol=4))
+        else:
+            hasher.update(repr(data).encode('utf8'))
+
     def hash_info(self, data, **kwargs) -> str:
         """Method responsible for hashing distinct information about the data that is going to be cached.
-        It utilizes md5 hashing algorithm.
+        It hashes the raw buffer of the data together with its shape and dtype, so the key depends on every
+        element of the data and not on its printed representation.
         Args:
+            data: data to be hashed. NumPy arrays and pandas objects are hashed by content.
             kwargs: a set of keyword arguments to be used as distinct info about data.
         Returns:
             Hashed string.
         """
-        # key = ''.join([repr(arg) for arg in kwargs.values()]).encode('utf8')
-        # key += data.__str__().encode('utf8')
-        # hsh = hashlib.md5(key).hexdigest()[:10]
-
-        key_info = ''.join([repr(arg)
-                            for arg in kwargs.values()]).encode('utf8')
-        key_data = data.__str__()
-
-        key = key_info + key_data.encode('utf8')
-        hsh = hashlib.md5(key).hexdigest()[:20]
-
-        return hsh
+        hasher = hashlib.blake2b(digest_size=10)
+        hasher.update(''.join([repr(arg) for arg in kwargs.values()]).encode('utf8'))
+        self._update_hash(hasher, data)
+        return hasher.hexdigest()
 
     def load_data_from_cache(self, hashed_info: str):
         """Method responsible for loading cached data.
@@ -72,26 +144,103 @@ class DataCacher:
         start = timeit.default_timer()
         file_path = os.path.join(self.cache_folder, hashed_info + '.npy')
         try:
-            data = np.load(file_path)
+            data = self._load_array(file_path)
         except FileNotFoundError:
             self.logger.info('Cache not found')
+            self.stats['misses'] += 1
             raise FileNotFoundError(f'File {file_path} was not found')
+        self.stats['hits'] += 1
+        self.stats['bytes_read'] += data.nbytes
+        self._touch(hashed_info, os.path.getsize(file_path))
         elapsed_time = round(timeit.default_timer() - start, 5)
-        print(
-            f'{self.data_type} of {type(data)} type is loaded from cache in {elapsed_time} sec')
+        self.logger.info(f'{self.data_type} of {type(data)} type is loaded from cache in {elapsed_time} sec')
         return data
 
+    def _load_array(self, file_path: str) -> np.ndarray:
+        if self.mmap_mode is None:
+            return np.load(file_path)
+        try:
+            return np.load(file_path, mmap_mode=self.mmap_mode)
+        except ValueError:
+            # arrays of python objects are pickled and can't be memory-mapped
+            return np.load(file_path)
+
     def cache_data(self, hashed_info: str, data: pd.DataFrame):
-        """Method responsible for saving cached data. It utilizes pickle format for saving data.
+        """Method responsible for saving cached data. Data is saved to ``.npy`` file with ``np.save``.
+        Data is written to a temporary file first and then moved in place, so concurrent readers never see
+        a partially written file.
         Args:
             hashed_info: hashed string.
             data: pd.DataFrame.
         """
         self.logger.info('Caching features')
-        cache_file = os.path.join(self.cache_folder, hashed_info)
+        cache_file = os.path.join(self.cache_folder, hashed_info + '.npy')
+        tmp_file = os.path.join(self.cache_folder, f'{hashed_info}.{os.getpid()}.tmp.npy')
 
         try:
-            np.save(cache_file, data)
-
+            np.save(tmp_file, np.asarray(data))
+            os.replace(tmp_file, cache_file)
         except Exception as ex:
             print(f'Data was not cached due to error { ex }')
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return
+
+        size = os.path.getsize(cache_file)
+        self.stats['bytes_written'] += size
+        self._touch(hashed_info, size)
+        if self.max_cache_size is not None:
+            self._evict(keep=hashed_info)
+
+    def _touch(self, hashed_info: str, size: int):
+        connection = self._connect_to_index()
+        try:
+            connection.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?)',
+                               (hashed_info, size, time.time()))
+        finally:
+            connection.close()
+
+    def _evict(self, keep: str = None):
+        """Removes the least recently used entries until the cache fits into ``max_cache_size``.
+        """
+        connection = self._connect_to_index()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            total_size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+            if total_size > self.max_cache_size:
+                entries = connection.execute('SELECT key, size FROM entries WHERE key != ? ORDER BY last_access',
+                                             (keep,)).fetchall()
+                for key, size in entries:
+                    if total_size <= self.max_cache_size:
+                        break
+                    try:
+                        os.remove(os.path.join(self.cache_folder, key + '.npy'))
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        continue
+                    connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+                    total_size -= size
+                    self.stats['evictions'] += 1
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        finally:
+            connection.close()
+
+    def cache_info(self) -> dict:
+        """Returns hit/miss/byte statistics of this cacher together with the current state of the cache folder.
+        """
+        connection = self._connect_to_index()
+        try:
+            n_entries, size = connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        finally:
+            connection.close()
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {**self.stats,
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+                'entries': n_entries,
+                'cache_size': size,
+                'max_cache_size': self.max_cache_size}
@@ -1,6 +1,7 @@
 from typing import Tuple
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.operation.transformation.regularization.spectrum import hankelize_components
 
 
 class CURDecomposition:
@@ -44,12 +45,7 @@ class CURDecomposition:
         # else:
         rank = U.shape[1]
         TS_comps = np.zeros((ts_length, rank))
-        for i in range(rank):
-            X_elem = np.outer(C @ U[:, i], R[i, :])
-            X_rev = X_elem[::-1]
-            eigenvector = [X_rev.diagonal(
-                j).mean() for j in range(-X_rev.shape[0] + 1, X_rev.shape[1])]
-            TS_comps[:, i] = eigenvector
+        TS_comps[:] = hankelize_components(C @ U, np.ones(rank), R[:rank, :])
         return TS_comps
 
     def select_rows_cols(
@@ -0,0 +1,54 @@
+from typing import Optional
+
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+
+
+def svd_append_column(U: np.ndarray,
+                      S: np.ndarray,
+                      VT: np.ndarray,
+                      column: np.ndarray,
+                      rank: Optional[int] = None) -> tuple:
+    """Rank-one update of thin SVD ``A = U @ diag(S) @ VT`` after appending ``column`` to ``A`` (Brand's method).
+    Only the small (r + 1) x (r + 1) core matrix is decomposed, so the update costs O((m + n) r^2) instead of
+    decomposition of the whole matrix from scratch.
+
+    Args:
+        U: left singular vectors of shape (m, r)
+        S: singular values of shape (r,)
+        VT: right singular vectors of shape (r, n)
+        column: new column of shape (m,)
+        rank: number of components to keep. If None, the decomposition stays exact.
+
+    Returns:
+        u, s, vt: decomposition of the matrix with appended column. Signs of singular vectors are aligned
+        with the initial decomposition.
+
+    """
+    n_components = S.shape[0]
+    projection = U.T @ column
+    residual = column - U @ projection
+    residual_norm = np.linalg.norm(residual)
+    residual_direction = residual / residual_norm if residual_norm > 1e-12 else np.zeros_like(residual)
+
+    core = np.zeros((n_components + 1, n_components + 1))
+    core[:n_components, :n_components] = np.diag(S)
+    core[:n_components, -1] = projection
+    core[-1, -1] = residual_norm
+    core_U, core_S, core_VT = np.linalg.svd(core)
+
+    extended_VT = np.zeros((n_components + 1, VT.shape[1] + 1))
+    extended_VT[:n_components, :-1] = VT
+    extended_VT[-1, -1] = 1
+    new_U = np.column_stack([U, residual_direction]) @ core_U
+    new_VT = core_VT @ extended_VT
+
+    if rank is None:
+        rank = min(U.shape[0], VT.shape[1] + 1)
+    new_U, core_S, new_VT = new_U[:, :rank], core_S[:rank], new_VT[:rank]
+    # svd of the core matrix defines vectors up to sign, keep orientation of existing components
+    n_aligned = min(rank, n_components)
+    signs = np.sign(np.sum(new_U[:, :n_aligned] * U[:, :n_aligned], axis=0))
+    signs[signs == 0] = 1
+    new_U[:, :n_aligned] *= signs
+    new_VT[:n_aligned] *= signs[:, np.newaxis]
+    return new_U, core_S, new_VT
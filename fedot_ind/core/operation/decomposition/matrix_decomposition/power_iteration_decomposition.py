@@ -49,14 +49,18 @@ class RSVDDecomposition:
                                             reconstr_m, 'fro') /
                              np.linalg.norm(tensor) *
                              100) for reconstr_m in reconstr_matrix]
-            regularized_rank = _detect_knee_point(
-                values=fro_norms, indices=list(range(len(fro_norms))))
-            regularized_rank = len(regularized_rank)
+            regularized_rank = self._knee_point_rank(fro_norms)
             # deriviate_of_error = abs(np.diff(fro_norms))
             # regularized_rank = len(
             #     deriviate_of_error[deriviate_of_error > 1]) + 1
         return regularized_rank
 
+    @staticmethod
+    def _knee_point_rank(fro_norms: list) -> int:
+        regularized_rank = _detect_knee_point(
+            values=fro_norms, indices=list(range(len(fro_norms))))
+        return len(regularized_rank)
+
     def rsvd(self,
              tensor: np.array,
              approximation: bool = False,
@@ -122,3 +126,48 @@ class RSVDDecomposition:
             U_, S_, V_ = np.linalg.svd(reconstr_tensor, full_matrices=False)
 
             return [U_, S_, V_]
+
+    def batch_rsvd(self,
+                   tensor: np.array,
+                   approximation: bool = False,
+                   reg_type: str = 'hard_thresholding') -> list:
+        """Batched version of ``rsvd`` for a stack of matrices of shape (n_matrices, n_rows, n_cols).
+        All matrices are decomposed at once with batched ``np.linalg.svd``. Besides the decomposition, the rank
+        which ``rsvd`` would select for every matrix is estimated from the same spectrum, so rank selection and
+        basis extraction don't need separate decompositions.
+
+        Args:
+            tensor: stack of matrices to decompose
+            approximation: if True, randomized decomposition with power iterations is used
+            reg_type: type of regularization. 'hard_thresholding' or 'explained_dispersion'
+
+        Returns:
+            u, s, vt, ranks: decomposition sorted by singular values and rank of every matrix
+
+        """
+        if not approximation:
+            Ut, St, Vt = np.linalg.svd(tensor, full_matrices=False)
+            ranks = [self._spectrum_regularization(spectrum, reg_type=reg_type) for spectrum in St]
+            return [Ut, St, Vt, np.array(ranks)]
+
+        # Same steps as in rsvd, but Gram matrices of all matrices are processed at once with one random projection
+        self._init_random_params(tensor[0])
+        AAT = tensor @ np.swapaxes(tensor, -1, -2)
+        sampled_tensor = np.linalg.matrix_power(
+            AAT, self.poly_deg) @ tensor @ self.random_projection
+        sampled_tensor_orto, _ = np.linalg.qr(sampled_tensor, mode='reduced')
+        M = np.swapaxes(sampled_tensor_orto, -1, -2) @ AAT @ sampled_tensor_orto
+        Ut, St, _ = np.linalg.svd(M, full_matrices=False)
+        # Projection of the matrix on the first r columns of sampled_tensor_orto @ Ut keeps exactly first r
+        # eigenvalues of M, so relative approximation errors for every rank are obtained without reconstruction
+        tensor_norm = np.sum(tensor ** 2, axis=(-2, -1))[:, np.newaxis]
+        tensor_norm = np.where(tensor_norm == 0, 1, tensor_norm)
+        fro_norms = np.sqrt(np.clip(1 - np.cumsum(St, axis=1) / tensor_norm, 0, None)) * 100
+        ranks = []
+        for spectrum, errors in zip(St, fro_norms):
+            low_rank = self._spectrum_regularization(spectrum, reg_type=reg_type)
+            ranks.append(self._knee_point_rank(list(errors[:low_rank])))
+        U_ = sampled_tensor_orto @ Ut
+        S_ = np.sqrt(np.clip(St, 0, None))
+        V_ = np.swapaxes(U_, -1, -2) @ tensor / np.where(S_ == 0, 1, S_)[..., np.newaxis]
+        return [U_, S_, V_, np.array(ranks)]
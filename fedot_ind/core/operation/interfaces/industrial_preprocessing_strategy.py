@@ -1,7 +1,7 @@
 import warnings
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from inspect import signature
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 from fedot.core.data.data import InputData, OutputData
@@ -11,24 +11,58 @@ from fedot.core.operations.operation_parameters import OperationParameters
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.operation_types_repository import get_operation_type_from_id, OperationTypesRepository
 from fedot.utilities.random import ImplementationRandomStateHandler
+from joblib.externals.loky import get_reusable_executor
 
+from fedot_ind.core.architecture.abstraction.decorators import DaskServer
 from fedot_ind.core.architecture.preprocessing.data_convertor import ConditionConverter, FedotConverter, NumpyConverter
 from fedot_ind.core.repository.IndustrialOperationParameters import IndustrialOperationParameters
 from fedot_ind.core.repository.model_repository import FEDOT_PREPROC_MODEL, FORECASTING_PREPROC, \
     INDUSTRIAL_CLF_PREPROC_MODEL, INDUSTRIAL_PREPROC_MODEL
 
 
+# parameters of channel-independent processing, they are not passed to the operation itself
+CHANNEL_EXECUTOR_PARAMS = ('channel_executor', 'channel_n_jobs')
+
+
+def _call_channel_method(operation, data, method_name: str):
+    # operation is returned as well, so state of operations fitted in another process is not lost
+    return operation, getattr(operation, method_name)(data)
+
+
 class MultiDimPreprocessingStrategy(EvaluationStrategy):
+    """Strategy which applies operation to multidimensional data.
+
+    Args:
+        operation_impl: implementation of the operation
+        operation_type: name of the operation
+        params: parameters of the operation
+        mode: ``'one_dimensional'``, ``'channel_independent'`` or ``'multi_dimensional'``
+        executor: executor for per-channel work in ``'channel_independent'`` mode. One of ``'thread'``,
+            ``'process'``, ``'dask'`` or any object with ``submit`` method. If None, channels are processed serially.
+            ``channel_executor`` operation parameter is used when not passed.
+        n_jobs: number of workers for ``'thread'`` and ``'process'`` executors, ``channel_n_jobs`` operation
+            parameter is used when not passed.
+    """
+
     def __init__(self, operation_impl,
                  operation_type: str,
                  params: Optional[OperationParameters] = None,
-                 mode: str = 'one_dimensional'
+                 mode: str = 'one_dimensional',
+                 executor: Union[str, object, None] = None,
+                 n_jobs: Optional[int] = None
                  ):
         self.operation_impl = operation_impl
+        if params is not None:
+            executor = executor if executor is not None else params.get('channel_executor')
+            n_jobs = n_jobs if n_jobs is not None else params.get('channel_n_jobs')
+            params = params.__class__(**{key: value for key, value in params.to_dict().items()
+                                         if key not in CHANNEL_EXECUTOR_PARAMS})
         super().__init__(operation_type, params)
         self.output_mode = 'labels'
         self.concat_func = np.hstack
         self.mode = mode
+        self.executor = executor
+        self.n_jobs = n_jobs if n_jobs is not None else 1
 
     @property
     def implementation_info(self) -> str:
@@ -79,6 +113,52 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
                 output_mode, n_classes)
             return prediction
 
+    def _get_executor(self):
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(max_workers=self.n_jobs)
+        elif self.executor == 'process':
+            return get_reusable_executor(max_workers=self.n_jobs)
+        elif self.executor == 'dask':
+            return DaskServer().client
+        elif hasattr(self.executor, 'submit'):
+            return self.executor
+        else:
+            raise ValueError(
+                f'Unknown channel executor {self.executor}. Use one of "thread", "process", "dask" or executor object')
+
+    def _apply_per_channel(self, method_name: str, operations: list, channel_data: list) -> tuple:
+        """Calls method of every channel operation with data of the channel. Channels are processed concurrently
+        with the chosen executor.
+
+        Returns:
+            operations (fitted copies in case of process executor) and results of the method calls
+
+        """
+        tasks = list(zip(operations, channel_data))
+        if self.executor is None or len(tasks) == 1:
+            results = [_call_channel_method(operation, data, method_name) for operation, data in tasks]
+        else:
+            executor = self._get_executor()
+            # dask tries to hash arguments of pure tasks, operation fit is never pure
+            backend_kwargs = {'pure': False} if self.executor == 'dask' else {}
+            try:
+                futures = [executor.submit(_call_channel_method, operation, data, method_name, **backend_kwargs)
+                           for operation, data in tasks]
+                results = [future.result() for future in futures]
+            finally:
+                # only the thread pool is owned here, process and dask workers are reused
+                if self.executor == 'thread':
+                    executor.shutdown(wait=True, cancel_futures=True)
+        if len(results) == 0:
+            return [], []
+        operations, outputs = zip(*results)
+        return list(operations), list(outputs)
+
+    def _clone_operation(self, operation_implementation, n_channels: int) -> list:
+        # unfitted operation has no state except parameters, so new instances are created
+        # instead of deep copies of the existing one
+        return [operation_implementation] + [self._init_impl(self.params_for_fit) for _ in range(n_channels - 1)]
+
     def _convert_input_data(self, train_data, mode: str = None):
         return FedotConverter(train_data).convert_to_industrial_composing_format(
             mode if mode is not None else self.mode)
@@ -88,7 +168,7 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
             predict_data, trained_operation[0], self.mode)
 
         # create list of InputData, where each InputData correspond to each
-        # channel
+        # channel. Features of channels are views of the initial array
         test_data = predict_data if isinstance(predict_data, list) else \
             [InputData(idx=predict_data.idx,
                        features=features,
@@ -102,9 +182,7 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
 
         if self.operation_condition_for_channel_independent.have_transform_method:
             if self.operation_condition_for_channel_independent.is_transform_input_fedot:
-                prediction = list(
-                    operation.transform(data) for operation, data in zip(
-                        trained_operation, test_data))
+                _, prediction = self._apply_per_channel('transform', trained_operation, test_data)
                 if self.operation_type == 'lagged' or self.operation_type == 'sparse_lagged':
                     prediction = prediction
                 else:
@@ -112,16 +190,10 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
                         pred.predict if not isinstance(
                             pred, np.ndarray) else pred for pred in prediction]
             else:
-                prediction = list(
-                    operation.transform(
-                        data.features) for operation, data in zip(
-                        trained_operation, test_data))
+                _, prediction = self._apply_per_channel(
+                    'transform', trained_operation, [data.features for data in test_data])
         elif self.operation_condition_for_channel_independent.have_predict_method:
-            prediction = list(
-                operation.predict(data) for operation,
-                data in zip(
-                    trained_operation,
-                    test_data))
+            _, prediction = self._apply_per_channel('predict', trained_operation, test_data)
 
             prediction = [
                 pred.predict for pred in prediction if not isinstance(
@@ -192,18 +264,18 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
             if self.operation_condition.is_operation_is_list_container:
                 trained_operation = operation_implementation
             else:
-                trained_operation = [deepcopy(operation_implementation) if self.operation_condition.is_list_container
-                                     else deepcopy(operation_implementation) for i in range(len(train_data))]
+                n_channels = len(train_data) if self.operation_condition.is_list_container else 1
+                trained_operation = self._clone_operation(operation_implementation, n_channels)
 
             train_data = train_data if self.operation_condition.is_list_container else [
                 train_data]
 
             # Check if model have both or just one method (fit and transform_for_fit). For some model one of this method
             # could be not finished to use right now.
+            fit_method_is_not_implemented = False
             if self.operation_condition.have_fit_method:
-                operation_implementation = [
-                    operation.fit(data) for operation, data in zip(
-                        trained_operation, train_data)]
+                trained_operation, operation_implementation = self._apply_per_channel(
+                    'fit', trained_operation, train_data)
 
                 if not isinstance(
                     operation_implementation[0], type(
@@ -211,14 +283,12 @@ class MultiDimPreprocessingStrategy(EvaluationStrategy):
                     operation_implementation = trained_operation
                 fit_method_is_not_implemented = operation_implementation[0] is None
             elif self.operation_condition.have_transform_method:
-                operation_implementation = [
-                    operation.transform_for_fit(data) for operation, data in zip(
-                        trained_operation, train_data)]
+                trained_operation, operation_implementation = self._apply_per_channel(
+                    'transform_for_fit', trained_operation, train_data)
 
             if fit_method_is_not_implemented:
-                operation_implementation = [
-                    operation.transform_for_fit(data) for operation, data in zip(
-                        trained_operation, train_data)]
+                trained_operation, operation_implementation = self._apply_per_channel(
+                    'transform_for_fit', trained_operation, train_data)
 
             return operation_implementation
         else:
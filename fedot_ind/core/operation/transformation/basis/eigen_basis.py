@@ -14,8 +14,8 @@ from fedot_ind.core.architecture.settings.computational import backend_methods a
 from fedot_ind.core.operation.decomposition.matrix_decomposition.power_iteration_decomposition import RSVDDecomposition
 from fedot_ind.core.operation.transformation.basis.abstract_basis import BasisDecompositionImplementation
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
-from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis, \
-    singular_value_hard_threshold
+from fedot_ind.core.operation.transformation.regularization.spectrum import hankelize_components, \
+    reconstruct_basis, singular_value_hard_threshold
 
 class_type = TypeVar("T", bound="DataDrivenBasis")
 
@@ -37,6 +37,8 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
         self.low_rank_approximation = params.get(
             'low_rank_approximation', True)
         self.tensor_approximation = params.get('tensor_approximation', False)
+        self.batch_mode = params.get('batch_mode', True)
+        self.chunk_size = params.get('chunk_size', 256)
         self.rank_regularization = params.get(
             'rank_regularization', 'hard_thresholding')
         self.logging_params.update({'WS': self.window_size})
@@ -50,23 +52,79 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
     def _channel_decompose(self, features):
         number_of_dim = list(range(features.shape[1]))
         predict = []
+        # trajectory matrices of all samples and channels are built once as a view over features
+        trajectory = HankelMatrix.get_batch_trajectory_matrix(features, self.window_size)
+        self.ts_length = features.shape[2]
+        if self.batch_mode:
+            return self._batch_channel_decompose(trajectory)
         if self.SV_threshold is None:
-            self.SV_threshold = max(self.get_threshold(data=features), 2)
+            self.SV_threshold = max(self.get_threshold(data=features, trajectory=trajectory), 2)
             self.logging_params.update({'SV_thr': self.SV_threshold})
 
         if len(number_of_dim) == 1:
-            predict = [self._transform_one_sample(
-                signal) for signal in features[:, 0, :]]
+            predict = [self._decompose_trajectory(
+                matrix) for matrix in trajectory[:, 0]]
             predict = [[np.array(v) if len(v) > 1 else v[0] for v in predict]]
         else:
             for dimension in number_of_dim:
                 parallel = Parallel(n_jobs=self.n_processes,
                                     verbose=0, pre_dispatch="2*n_jobs")
-                v = parallel(delayed(self._transform_one_sample)(sample)
-                             for sample in features[:, dimension, :])
+                v = parallel(delayed(self._decompose_trajectory)(matrix)
+                             for matrix in trajectory[:, dimension])
                 predict.append(np.array(v) if len(v) > 1 else v[0])
         return predict
 
+    def _batch_channel_decompose(self, trajectory):
+        """Decomposes trajectory matrices of all samples and channels with batched SVD. Matrices are processed
+        in chunks of ``chunk_size``, so only one chunk of the trajectory view is materialized at once. If rank
+        threshold is not set yet, it is obtained from spectra of all chunks first. Factors of every chunk are
+        kept for reuse cut to the largest rank found so far, so memory is bounded by the rank and a chunk is
+        decomposed again only if the threshold turns out to be larger than its kept factors.
+        """
+        n_samples, n_channels = trajectory.shape[:2]
+        # samples and channels are merged without a copy of the view over features
+        stacked_trajectory = trajectory.reshape(-1, *trajectory.shape[2:])
+        chunks = [stacked_trajectory[start:start + self.chunk_size]
+                  for start in range(0, stacked_trajectory.shape[0], self.chunk_size)]
+        decompositions = [None] * len(chunks)
+        if self.SV_threshold is None:
+            ranks, max_rank = [], 2
+            for idx, chunk in enumerate(chunks):
+                U, S, VT, chunk_ranks = self._decompose_chunk(chunk)
+                chunk_ranks = [self._explained_spectrum_rank(spectrum[:rank])
+                               for spectrum, rank in zip(S, chunk_ranks)]
+                ranks.extend(chunk_ranks)
+                max_rank = max(max_rank, *chunk_ranks)
+                # threshold is the mode of ranks and never exceeds the largest of them
+                is_complete = S.shape[-1] <= max_rank
+                decompositions[idx] = (U[..., :max_rank].copy(), S[..., :max_rank].copy(),
+                                       VT[..., :max_rank, :].copy(), is_complete)
+            ranks = np.array(ranks).reshape(n_samples, n_channels)
+
+            def mode_func(x):
+                return max(set(x), key=x.count)
+
+            channel_ranks = [mode_func(list(ranks[:, dimension])) for dimension in range(n_channels)]
+            self.SV_threshold = max(mode_func(channel_ranks), 2)
+            self.logging_params.update({'SV_thr': self.SV_threshold})
+
+        rank = self.SV_threshold
+        basis = []
+        for chunk, decomposition in zip(chunks, decompositions):
+            if decomposition is None or (not decomposition[3] and decomposition[1].shape[-1] < rank):
+                decomposition = self._decompose_chunk(chunk)
+            U, S, VT = decomposition[:3]
+            basis.append(hankelize_components(U[..., :rank], S[..., :rank], VT[..., :rank, :]))
+        basis = np.swapaxes(np.concatenate(basis), -1, -2).reshape(n_samples, n_channels, -1, self.ts_length)
+        if n_channels == 1:
+            return [list(basis[:, 0])]
+        return [basis[:, dimension] if n_samples > 1 else basis[0, dimension] for dimension in range(n_channels)]
+
+    def _decompose_chunk(self, chunk):
+        return self.svd_estimator.batch_rsvd(tensor=np.asarray(chunk, dtype=float),
+                                             approximation=self.low_rank_approximation,
+                                             reg_type=self.rank_regularization)
+
     def _convert_basis_to_predict(self, basis, input_data):
 
         if input_data.features.shape[0] == 1 and len(
@@ -150,32 +208,37 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
 
         return basis
 
-    def get_threshold(self, data) -> int:
+    def get_threshold(self, data, trajectory=None) -> int:
         svd_numbers = []
 
         def mode_func(x):
             return max(set(x), key=x.count)
 
+        if trajectory is None:
+            trajectory = HankelMatrix.get_batch_trajectory_matrix(data, self.window_size)
+            self.ts_length = data.shape[2]
         number_of_dim = list(range(data.shape[1]))
         if len(number_of_dim) == 1:
-            svd_numbers = [self._transform_one_sample(
-                signal, svd_flag=True) for signal in data[:, 0, :]]
+            svd_numbers = [self._decompose_trajectory(
+                matrix, svd_flag=True) for matrix in trajectory[:, 0]]
             if len(svd_numbers) == 0:
                 raise ValueError('Error in spectrum calculation')
         else:
             for dimension in number_of_dim:
                 dimension_rank = []
-                for signal in data[:, dimension, :]:
+                for matrix in trajectory[:, dimension]:
                     dimension_rank.append(
-                        self._transform_one_sample(signal, svd_flag=True))
+                        self._decompose_trajectory(matrix, svd_flag=True))
             svd_numbers.append(mode_func(dimension_rank))
         return mode_func(svd_numbers)
 
     def _transform_one_sample(self, series: np.array, svd_flag: bool = False):
         trajectory_transformer = HankelMatrix(
             time_series=series, window_size=self.window_size)
-        data = trajectory_transformer.trajectory_matrix
         self.ts_length = trajectory_transformer.ts_length
+        return self._decompose_trajectory(trajectory_transformer.trajectory_matrix, svd_flag)
+
+    def _decompose_trajectory(self, data: np.array, svd_flag: bool = False):
         rank = self.estimate_singular_values(data)
         if svd_flag:
             return rank
@@ -192,7 +255,10 @@ class EigenBasisImplementation(BasisDecompositionImplementation):
                 reg_type=reg_type))
 
         basis = Either.insert(data).then(svd).value[0]
-        spectrum = [s_val for s_val in basis[1] if s_val > 0.001]
+        return self._explained_spectrum_rank(basis[1])
+
+    def _explained_spectrum_rank(self, singular_values) -> int:
+        spectrum = [s_val for s_val in singular_values if s_val > 0.001]
         rank = len(spectrum)
         self.explained_dispersion.append(
             [round(x / sum(spectrum) * 100) for x in spectrum])
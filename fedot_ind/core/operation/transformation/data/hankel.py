@@ -2,7 +2,28 @@ from typing import Union
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 import pandas as pd
-from fedot_ind.core.architecture.settings.computational import backend_scipy
+
+
+def get_batch_trajectory_matrix(time_series: np.ndarray, window_length: int, strides: int = 1) -> np.ndarray:
+    """Builds trajectory matrices of a batch of series as a read-only strided view over the original buffer,
+    so no data is copied.
+
+    Args:
+        time_series: array of shape (n_samples, n_channels, ts_length). 1D array is treated as a single
+            one-channel sample, 2D array as a set of one-channel samples.
+        window_length: number of rows of every trajectory matrix.
+        strides: step between two consecutive columns of trajectory matrix.
+
+    Returns:
+        Array of shape (n_samples, n_channels, window_length, n_columns).
+    """
+    time_series = np.asarray(time_series)
+    if time_series.ndim == 1:
+        time_series = time_series[np.newaxis, np.newaxis, :]
+    elif time_series.ndim == 2:
+        time_series = time_series[:, np.newaxis, :]
+    windows = np.lib.stride_tricks.sliding_window_view(time_series, window_length, axis=-1)
+    return np.swapaxes(windows[..., ::strides, :], -1, -2)
 
 
 class HankelMatrix:
@@ -25,21 +46,33 @@ class HankelMatrix:
         else:
             self.__ts_length = self.__time_series.size
 
-        if window_size is None:
-            self.__window_length = round(self.__ts_length * 0.35)
-        else:
-            self.__window_length = round(window_size - 1)
+        self.__window_length = self.get_window_length(self.__ts_length, window_size)
         self.__subseq_length = self.__ts_length - self.__window_length + 1
 
-        self.__check_windows_length()
         if len(self.__time_series.shape) > 1:
             self.__trajectory_matrix = self.__get_2d_trajectory_matrix()
         else:
             self.__trajectory_matrix = self.__get_1d_trajectory_matrix()
 
-    def __check_windows_length(self):
-        if not 2 <= self.__window_length <= self.__ts_length / 2:
-            self.__window_length = int(self.__ts_length / 3)
+    @staticmethod
+    def get_window_length(ts_length: int, window_size: int = None) -> int:
+        if window_size is None:
+            window_length = round(ts_length * 0.35)
+        else:
+            window_length = round(window_size - 1)
+        if not 2 <= window_length <= ts_length / 2:
+            window_length = int(ts_length / 3)
+        return window_length
+
+    @staticmethod
+    def get_batch_trajectory_matrix(time_series: np.ndarray, window_size: int = None, strides: int = 1):
+        """Trajectory matrices of all samples and channels of ``time_series`` of shape
+        (n_samples, n_channels, ts_length) built at once as a read-only view. Window is chosen
+        the same way as for a single series, so every matrix equals ``HankelMatrix(series).trajectory_matrix``.
+        """
+        window_length = HankelMatrix.get_window_length(np.shape(time_series)[-1], window_size)
+        rows = window_length + 1 if strides == 1 else window_length
+        return get_batch_trajectory_matrix(time_series, rows, strides)
 
     def __convert_ts_to_array(self):
         if isinstance(self.__time_series, pd.DataFrame):
@@ -50,28 +83,14 @@ class HankelMatrix:
             self.__time_series = self.__time_series
 
     def __get_1d_trajectory_matrix(self):
-
-        if self.__strides > 1:
-            return self.__strided_trajectory_matrix(self.__time_series)
-        else:
-            return backend_scipy.hankel(self.__time_series[:self.__window_length + 1],
-                                        self.__time_series[self.__window_length:])
+        return self.__get_trajectory_view(self.__time_series)[0, 0]
 
     def __get_2d_trajectory_matrix(self):
-        if self.__strides > 1:
-            return [self.__strided_trajectory_matrix(
-                time_series) for time_series in self.__time_series]
-        else:
-            return [backend_scipy.hankel(time_series[:self.__window_length + 1],
-                                         time_series[self.__window_length:]) for time_series in self.__time_series]
-
-    def __strided_trajectory_matrix(self, time_series):
-        shape = (time_series.shape[0] -
-                 self.__window_length + 1, self.__window_length)
-        strides = (time_series.strides[0],) + time_series.strides
-        rolled = np.lib.stride_tricks.as_strided(
-            time_series, shape=shape, strides=strides)
-        return rolled[np.arange(0, shape[0], self.__strides)].T
+        return list(self.__get_trajectory_view(self.__time_series)[:, 0])
+
+    def __get_trajectory_view(self, time_series):
+        rows = self.__window_length + 1 if self.__strides == 1 else self.__window_length
+        return get_batch_trajectory_matrix(time_series, rows, self.__strides)
 
     @property
     def window_length(self):
@@ -16,9 +16,13 @@ class TopologicalTransformation:
         epsilon: Maximum distance between two points to be considered connected by an edge in the Rips filtration.
         persistence_params: ...
         window_length: Length of the window to be used in the rolling window function.
+        max_points: If set, point clouds with more points are approximated by this number of maxmin landmarks.
+        max_edge_length: If set, bounds the radius of the Rips filtration.
 
     Attributes:
         epsilon_range (np.ndarray): Range of epsilon values to be used in the Rips filtration.
+        approximation (dict): Size of the last point cloud, number of landmarks and covering radius,
+            i.e. the largest distance from a point to its nearest landmark. None if the cloud wasn't approximated.
 
     """
 
@@ -28,9 +32,14 @@ class TopologicalTransformation:
                  epsilon: int = 10,
                  persistence_params: dict = None,
                  window_length: int = None,
-                 stride: int = 1):
+                 stride: int = 1,
+                 max_points: int = None,
+                 max_edge_length: float = None):
         self.time_series = time_series
         self.stride = stride
+        self.max_points = max_points
+        self.max_edge_length = max_edge_length
+        self.approximation = None
         self.max_simplex_dim = max_simplex_dim
         self.epsilon_range = self.__create_epsilon_range(epsilon)
         self.persistence_params = persistence_params
@@ -40,6 +49,8 @@ class TopologicalTransformation:
                 'coeff': 2,
                 'do_cocycles': False,
                 'verbose': False}
+        if self.max_edge_length is not None:
+            self.persistence_params['thresh'] = self.max_edge_length
 
         self.__window_length = window_length
 
@@ -95,7 +106,42 @@ class TopologicalTransformation:
         trajectory_transformer = HankelMatrix(time_series=input_data,
                                               window_size=self.__window_length,
                                               strides=self.stride)
-        return trajectory_transformer.trajectory_matrix
+        point_cloud = trajectory_transformer.trajectory_matrix
+        self.approximation = None
+        if self.max_points is not None and point_cloud.shape[0] > self.max_points:
+            landmarks, covering_radius = self.maxmin_landmarks(point_cloud, self.max_points)
+            self.approximation = {'n_points': point_cloud.shape[0],
+                                  'n_landmarks': self.max_points,
+                                  'covering_radius': covering_radius}
+            point_cloud = point_cloud[landmarks]
+        return point_cloud
+
+    @staticmethod
+    def maxmin_landmarks(point_cloud: np.array, n_landmarks: int) -> tuple:
+        """Greedy maxmin selection of landmarks: every next landmark is the point farthest from the chosen ones.
+        Persistence diagram of landmarks differs from the diagram of the whole cloud by at most twice
+        the covering radius in bottleneck distance.
+
+        Args:
+            point_cloud: Array of points of shape (n_points, dimension).
+            n_landmarks: Number of landmarks to select.
+
+        Returns:
+            Sorted indices of landmarks and covering radius.
+
+        """
+        squared_norms = np.einsum('ij,ij->i', point_cloud, point_cloud)
+
+        def squared_distances_to(index):
+            return squared_norms - 2 * point_cloud @ point_cloud[index] + squared_norms[index]
+
+        squared_distances = squared_distances_to(0)
+        landmarks = [0]
+        for _ in range(n_landmarks - 1):
+            landmark = int(np.argmax(squared_distances))
+            landmarks.append(landmark)
+            squared_distances = np.minimum(squared_distances, squared_distances_to(landmark))
+        return np.sort(landmarks), float(np.sqrt(max(squared_distances.max(), 0)))
 
     def point_cloud_to_persistent_cohomology_ripser(
             self, point_cloud: np.array = None, max_simplex_dim: int = 1):
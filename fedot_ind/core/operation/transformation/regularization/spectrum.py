@@ -1,3 +1,5 @@
+from scipy.fft import next_fast_len
+
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.repository.constanst_repository import SINGULAR_VALUE_BETA_THR, SINGULAR_VALUE_MEDIAN_THR
 
@@ -59,6 +61,31 @@ def singular_value_hard_threshold(singular_values,
         return singular_values[:adjusted_rank]
 
 
+def hankelize_components(U, Sigma, VT):
+    """Diagonal averaging of rank one components ``Sigma[i] * outer(U[:, i], VT[i, :])`` without materialising them.
+    Sum over an anti-diagonal of an outer product is a convolution of its factors, so all components
+    (and all samples along leading axes) are reconstructed at once with FFT.
+
+    Args:
+        U (array-like, shape (..., n_rows, rank)): Left singular vectors.
+        Sigma (array-like, shape (..., rank)): Singular values.
+        VT (array-like, shape (..., rank, n_cols)): Right singular vectors.
+
+    Returns:
+        components (array-like, shape (..., n_rows + n_cols - 1, rank)): Reconstructed components.
+
+    """
+    n_rows, n_cols = U.shape[-2], VT.shape[-1]
+    ts_length = n_rows + n_cols - 1
+    n_fft = next_fast_len(ts_length, real=True)
+    left = np.fft.rfft(U * Sigma[..., np.newaxis, :], n=n_fft, axis=-2)
+    right = np.fft.rfft(np.swapaxes(VT, -1, -2), n=n_fft, axis=-2)
+    diagonal_sums = np.fft.irfft(left * right, n=n_fft, axis=-2)[..., :ts_length, :]
+    diagonal_lengths = np.minimum(np.minimum(np.arange(1, ts_length + 1), np.arange(ts_length, 0, -1)),
+                                  min(n_rows, n_cols))
+    return diagonal_sums / diagonal_lengths[:, np.newaxis]
+
+
 def reconstruct_basis(U, Sigma, VT, ts_length):
     if len(Sigma.shape) > 1:
         def multi_reconstruction(x):
@@ -68,10 +95,5 @@ def reconstruct_basis(U, Sigma, VT, ts_length):
     else:
         rank = Sigma.shape[0]
         TS_comps = np.zeros((ts_length, rank))
-        for i in range(rank):
-            X_elem = Sigma[i] * np.outer(U[:, i], VT[i, :])
-            X_rev = X_elem[::-1]
-            eigenvector = [X_rev.diagonal(
-                j).mean() for j in range(-X_rev.shape[0] + 1, X_rev.shape[1])]
-            TS_comps[:, i] = eigenvector
+        TS_comps[:] = hankelize_components(U[:, :rank], Sigma, VT[:rank, :])
     return TS_comps
@@ -17,7 +17,8 @@ class IndustrialEvoOptimizer(EvoGraphOptimizer):
                  initial_graphs: Sequence[OptGraph],
                  requirements: GraphRequirements,
                  graph_generation_params: GraphGenerationParams,
-                 graph_optimizer_params: GPAlgorithmParameters):
+                 graph_optimizer_params: GPAlgorithmParameters,
+                 evaluation_backend: str = 'dask'):
 
         # graph_optimizer_params.mutation_types.remove(MutationTypesEnum.single_drop)
         # graph_generation_params.verifier._rules.append(has_no_data_flow_conflicts_in_industrial_pipeline)
@@ -26,8 +27,12 @@ class IndustrialEvoOptimizer(EvoGraphOptimizer):
         super().__init__(objective, initial_graphs, requirements,
                          graph_generation_params, graph_optimizer_params)
         self.operators.remove(self.crossover)
+        individual_timeout = requirements.max_graph_fit_time.total_seconds() \
+            if requirements.max_graph_fit_time else None
         self.eval_dispatcher = IndustrialDispatcher(
             adapter=graph_generation_params.adapter,
             n_jobs=requirements.n_jobs,
             graph_cleanup_fn=_try_unfit_graph,
-            delegate_evaluator=graph_generation_params.remote_evaluator)
+            delegate_evaluator=graph_generation_params.remote_evaluator,
+            evaluation_backend=evaluation_backend,
+            individual_timeout=individual_timeout)
@@ -1,12 +1,17 @@
 from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher
 
+from fedot_ind.core.architecture.abstraction.decorators import DaskServer
 from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
 
+import asyncio
 import logging
 import pathlib
+import time
 import timeit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional, Tuple
+from multiprocessing import Manager
+from typing import List, Optional, Tuple
 from golem.core.log import Log
 from golem.core.optimisers.genetic.operators.operator import EvaluationOperator, PopulationT
 from golem.core.optimisers.graph import OptGraph
@@ -15,10 +20,46 @@ from golem.core.optimisers.opt_history_objects.individual import GraphEvalResult
 from golem.core.optimisers.timer import Timer
 from golem.utilities.memory import MemoryAnalytics
 from golem.utilities.utilities import determine_n_jobs
-from joblib import wrap_non_picklable_objects, Parallel, parallel_backend
+from joblib import wrap_non_picklable_objects
+from joblib.externals.loky import get_reusable_executor
+
+# how often to check whether submitted individuals have already started their evaluation
+START_POLL_INTERVAL = 0.1
 
 
 class IndustrialDispatcher(MultiprocessingDispatcher):
+    """Evaluates population of graphs concurrently. Individuals are submitted to the chosen executor
+    at once and results are collected as they finish.
+
+    Args:
+        adapter: adapter for graphs
+        n_jobs: number of workers or 1 for evaluation in the current process.
+        graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
+        delegate_evaluator: delegate graph fitter (e.g. for remote graph fitting before evaluation)
+        evaluation_backend: ``'process'`` for a local process pool, ``'thread'`` for a thread pool or
+            ``'dask'`` for the ``DaskServer`` cluster.
+        individual_timeout: time in seconds to wait for evaluation of one individual. Individuals that were not
+            evaluated in time are skipped.
+
+    At most as many individuals as there are workers are submitted at once. Timeout of an individual is counted
+    from the moment its worker really starts the evaluation, so start-up of process workers and setup of the
+    industrial repository are not charged to it (dask workers are already running, so their individuals are
+    timed from submission). An
+    individual that timed out keeps its worker busy until it really stops (fit itself is bounded by
+    ``max_graph_fit_time`` of the objective), so it never competes with new evaluations for CPU. Thread pool
+    is shut down after every generation, process workers are killed if some individual timed out.
+    """
+
+    def __init__(self,
+                 adapter,
+                 n_jobs: int = 1,
+                 graph_cleanup_fn=None,
+                 delegate_evaluator=None,
+                 evaluation_backend: str = 'dask',
+                 individual_timeout: Optional[float] = None):
+        super().__init__(adapter, n_jobs, graph_cleanup_fn, delegate_evaluator)
+        self.evaluation_backend = evaluation_backend
+        self.individual_timeout = individual_timeout
 
     def dispatch(self, objective: ObjectiveFunction,
                  timer: Optional[Timer] = None) -> EvaluationOperator:
@@ -27,50 +68,130 @@ class IndustrialDispatcher(MultiprocessingDispatcher):
         super().dispatch(objective, timer)
         return self.evaluate_with_cache
 
+    def _get_executor(self, n_jobs: int):
+        if self.evaluation_backend == 'dask':
+            return DaskServer().client
+        elif self.evaluation_backend == 'thread':
+            return ThreadPoolExecutor(max_workers=n_jobs)
+        elif self.evaluation_backend == 'process':
+            return get_reusable_executor(max_workers=n_jobs)
+        else:
+            raise ValueError(
+                f'Unknown evaluation backend {self.evaluation_backend}. Use one of "process", "thread", "dask"')
+
+    def _wait_first(self, futures: list, timeout: Optional[float]) -> set:
+        if self.evaluation_backend == 'dask':
+            from distributed import wait as dask_wait
+            try:
+                return set(dask_wait(futures, timeout=timeout, return_when='FIRST_COMPLETED').done)
+            except (TimeoutError, asyncio.TimeoutError):
+                return set()
+        return wait(futures, timeout=timeout, return_when=FIRST_COMPLETED).done
+
+    def _release_executor(self, executor, timed_out: list):
+        if isinstance(executor, ThreadPoolExecutor):
+            executor.shutdown(wait=True, cancel_futures=True)
+        elif self.evaluation_backend == 'process' and timed_out:
+            executor.shutdown(wait=True, kill_workers=True)
+        elif self.evaluation_backend == 'dask' and timed_out:
+            executor.cancel(timed_out)
+
+    def _submit(self, executor, individual, logs_initializer, start_times):
+        if self.evaluation_backend == 'dask':
+            # dask tries to hash arguments of pure tasks, evaluation of a graph is never pure
+            backend_kwargs = {'pure': False}
+            start_times[individual.uid] = time.time()
+        else:
+            backend_kwargs = {'start_times': start_times if self.individual_timeout is not None else None}
+        return executor.submit(self.industrial_evaluate_single,
+                               self,
+                               graph=individual.graph,
+                               uid_of_individual=individual.uid,
+                               cache_key=individual.uid,
+                               logs_initializer=logs_initializer,
+                               **backend_kwargs)
+
+    def _evaluate_in_parallel(self, individuals: PopulationT, n_jobs: int) -> List[Optional[GraphEvalResult]]:
+        if n_jobs == 1:
+            return [self.industrial_evaluate_single(self,
+                                                    graph=ind.graph,
+                                                    uid_of_individual=ind.uid,
+                                                    cache_key=ind.uid) for ind in individuals]
+
+        executor = self._get_executor(n_jobs)
+        logs_initializer = Log().get_parameters()
+        # dask cluster may have a different number of workers than requested
+        n_workers = sum(executor.nthreads().values()) if self.evaluation_backend == 'dask' else n_jobs
+        n_workers = max(n_workers, 1)
+        evaluation_results = [None] * len(individuals)
+        queue = list(enumerate(individuals))[::-1]
+        running, timed_out = {}, []
+        manager = Manager() if self.evaluation_backend == 'process' and self.individual_timeout is not None else None
+        # process workers report the start of evaluation through the manager, threads share a plain dict
+        start_times = manager.dict() if manager is not None else {}
+        try:
+            while queue or running:
+                # individuals that timed out still hold their workers
+                while queue and len(running) + len(timed_out) < n_workers:
+                    idx, individual = queue.pop()
+                    running[self._submit(executor, individual, logs_initializer, start_times)] = (idx, individual.uid)
+                wait_time, deadlines = None, {}
+                if self.individual_timeout is not None:
+                    started = start_times.copy()
+                    deadlines = {future: started[uid] + self.individual_timeout
+                                 for future, (_, uid) in running.items() if uid in started}
+                    if deadlines:
+                        wait_time = max(min(deadlines.values()) - time.time(), 0)
+                    if len(deadlines) < len(running):
+                        wait_time = START_POLL_INTERVAL if wait_time is None else min(wait_time, START_POLL_INTERVAL)
+                done = self._wait_first(list(running) + timed_out, wait_time)
+                timed_out = [future for future in timed_out if future not in done]
+                now = time.time()
+                for future, (idx, _) in list(running.items()):
+                    if future in done:
+                        evaluation_results[idx] = future.result()
+                        del running[future]
+                    elif future in deadlines and now >= deadlines[future]:
+                        self.logger.warning(
+                            f'Individual was not evaluated in {self.individual_timeout} sec and is skipped')
+                        timed_out.append(future)
+                        del running[future]
+        finally:
+            self._release_executor(executor, timed_out)
+            if manager is not None:
+                manager.shutdown()
+        return evaluation_results
+
     def evaluate_population(self, individuals: PopulationT) -> PopulationT:
         individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(
             individuals)
 
         # Evaluate individuals without valid fitness in parallel.
         n_jobs = determine_n_jobs(self._n_jobs, self.logger)
-        parallel = Parallel(n_jobs=n_jobs, verbose=0,
-                            pre_dispatch='2 * n_jobs')
-
-        with parallel_backend(backend='dask',
-                              n_jobs=n_jobs
-                              # ,scatter=[individuals_to_evaluate]
-                              ):
-            evaluation_results = []
-            for ind in individuals_to_evaluate:
-                y = self.industrial_evaluate_single(
-                    self,
-                    graph=ind.graph,
-                    uid_of_individual=ind.uid,
-                    logs_initializer=Log().get_parameters())
-                evaluation_results.append(y)
-            individuals_evaluated = self.apply_evaluation_results(
-                individuals_to_evaluate, evaluation_results)
-            # If there were no successful evals then try once again getting at least one,
-            # even if time limit was reached
-            successful_evals = individuals_evaluated + individuals_to_skip
-            self.population_evaluation_info(
-                evaluated_pop_size=len(successful_evals),
-                pop_size=len(individuals))
-            if not successful_evals:
-                for single_ind in individuals:
-                    try:
-                        evaluation_result = self.industrial_evaluate_single(
-                            self, graph=ind.graph, uid_of_individual=ind.uid, with_time_limit=False)
-                        successful_evals = self.apply_evaluation_results(
-                            [single_ind], [evaluation_result])
-                        if successful_evals:
-                            break
-                    except Exception:
-                        _ = 1
-            MemoryAnalytics.log(
-                self.logger,
-                additional_info='parallel evaluation of population',
-                logging_level=logging.INFO)
+        evaluation_results = self._evaluate_in_parallel(individuals_to_evaluate, n_jobs)
+        individuals_evaluated = self.apply_evaluation_results(
+            individuals_to_evaluate, evaluation_results)
+        # If there were no successful evals then try once again getting at least one,
+        # even if time limit was reached
+        successful_evals = individuals_evaluated + individuals_to_skip
+        self.population_evaluation_info(
+            evaluated_pop_size=len(successful_evals),
+            pop_size=len(individuals))
+        if not successful_evals:
+            for single_ind in individuals:
+                try:
+                    evaluation_result = self.industrial_evaluate_single(
+                        self, graph=single_ind.graph, uid_of_individual=single_ind.uid, with_time_limit=False)
+                    successful_evals = self.apply_evaluation_results(
+                        [single_ind], [evaluation_result])
+                    if successful_evals:
+                        break
+                except Exception:
+                    _ = 1
+        MemoryAnalytics.log(
+            self.logger,
+            additional_info='parallel evaluation of population',
+            logging_level=logging.INFO)
         return successful_evals
 
     # @delayed
@@ -81,9 +202,13 @@ class IndustrialDispatcher(MultiprocessingDispatcher):
                                    with_time_limit: bool = True,
                                    cache_key: Optional[str] = None,
                                    logs_initializer: Optional[Tuple[int,
-                                                                    pathlib.Path]] = None) -> GraphEvalResult:
+                                                                    pathlib.Path]] = None,
+                                   start_times: Optional[dict] = None) -> GraphEvalResult:
         if self._n_jobs != 1:
             IndustrialModels().setup_repository()
+        if start_times is not None:
+            # timeout of the individual is counted from here by the dispatcher
+            start_times[uid_of_individual] = time.time()
 
         graph = self.evaluation_cache.get(cache_key, graph)
 
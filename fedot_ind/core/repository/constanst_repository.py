@@ -4,7 +4,6 @@ from multiprocessing import cpu_count
 
 import numpy as np
 import pywt
-from MKLpy.algorithms import FHeuristic, RMKL, MEMO, CKA, PWMK
 from fedot.core.pipelines.pipeline_builder import PipelineBuilder
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.metrics_repository import ClassificationMetricsEnum, RegressionMetricsEnum
@@ -18,6 +17,11 @@ from fedot_ind.core.metrics.metrics_implementation import calculate_classificati
     calculate_forecasting_metric
 from fedot_ind.core.models.nn.network_modules.losses import CenterLoss, CenterPlusLoss, ExpWeightedLoss, FocalLoss, \
     HuberLoss, LogCoshLoss, MaskedLossWrapper, RMSELoss, SMAPELoss, TweedieLoss
+from fedot_ind.core.models.quantile.batch_stat_features import batch_autocorrelation, batch_ben_corr, \
+    batch_crest_factor, batch_energy, batch_hjorth_complexity, batch_hjorth_mobility, batch_hurst_exponent, \
+    batch_interquartile_range, batch_kurtosis, batch_mean_ema, batch_mean_moving_median, batch_mean_ptp_distance, \
+    batch_n_peaks, batch_pfd, batch_ptp_amp, batch_q25, batch_q5, batch_q75, batch_q95, batch_shannon_entropy, \
+    batch_skewness, batch_slope, batch_zero_crossing_rate
 from fedot_ind.core.models.quantile.stat_features import autocorrelation, ben_corr, crest_factor, energy, \
     hjorth_complexity, hjorth_mobility, hurst_exponent, interquartile_range, kurtosis, mean_ema, mean_moving_median, \
     mean_ptp_distance, n_peaks, pfd, ptp_amp, q25, q5, q75, q95, shannon_entropy, skewness, slope, zero_crossing_rate
@@ -46,15 +50,22 @@ class ComputationalConstant(Enum):
     FEDOT_WORKER_NUM = 5
     FEDOT_WORKER_TIMEOUT_PARTITION = 4
     PATIENCE_FOR_EARLY_STOP = 15
+    CACHE_SIZE_LIMIT = 10 * 1024 ** 3
+    DASK_CLUSTER_PARAMS = {'address': None,
+                           'n_workers': None,
+                           'threads_per_worker': None,
+                           'memory_limit': 'auto',
+                           'processes': False}
 
 
 class KernelsConstant(Enum):
+    # names of ``MKLpy.algorithms`` classes, MKLpy is imported by the kernel ensemble itself
     KERNEL_ALGO = {
-        'one_step_heur': FHeuristic,
-        'two_step_rmkl': RMKL,
-        'two_step_memo': MEMO,
-        'one_step_cka': CKA,
-        'one_step_pwmk': PWMK,
+        'one_step_heur': 'FHeuristic',
+        'two_step_rmkl': 'RMKL',
+        'two_step_memo': 'MEMO',
+        'one_step_cka': 'CKA',
+        'one_step_pwmk': 'PWMK',
     }
     KERNEL_BASELINE_FEATURE_GENERATORS = {
         # 'minirocket_extractor': PipelineBuilder().add_node('minirocket_extractor'),
@@ -113,6 +124,40 @@ class FeatureConstant(Enum):
         'petrosian_fractal_dimension_': pfd
     }
 
+    BATCH_STAT_METHODS = {
+        'mean_': lambda array: np.mean(array, axis=-1),
+        'median_': lambda array: np.median(array, axis=-1),
+        'std_': lambda array: np.std(array, axis=-1),
+        'max_': lambda array: np.max(array, axis=-1),
+        'min_': lambda array: np.min(array, axis=-1),
+        'q5_': batch_q5,
+        'q25_': batch_q25,
+        'q75_': batch_q75,
+        'q95_': batch_q95
+    }
+
+    BATCH_STAT_METHODS_GLOBAL = {
+        'skewness_': batch_skewness,
+        'kurtosis_': batch_kurtosis,
+        'n_peaks_': batch_n_peaks,
+        'slope_': batch_slope,
+        'ben_corr_': batch_ben_corr,
+        'interquartile_range_': batch_interquartile_range,
+        'energy_': batch_energy,
+        'cross_rate_': batch_zero_crossing_rate,
+        'autocorrelation_': batch_autocorrelation,
+        'shannon_entropy_': batch_shannon_entropy,
+        'ptp_amplitude_': batch_ptp_amp,
+        'mean_ptp_distance_': batch_mean_ptp_distance,
+        'crest_factor_': batch_crest_factor,
+        'mean_ema_': batch_mean_ema,
+        'mean_moving_median_': batch_mean_moving_median,
+        'hjorth_mobility_': batch_hjorth_mobility,
+        'hjorth_complexity_': batch_hjorth_complexity,
+        'hurst_exponent_': batch_hurst_exponent,
+        'petrosian_fractal_dimension_': batch_pfd
+    }
+
     METRICS_DICT = {'euclidean': euclidean,
                     'cosine': cosine,
                     'cityblock': cityblock,
@@ -122,6 +167,16 @@ class FeatureConstant(Enum):
                     # 'mahalanobis': mahalanobis,
                     'minkowski': minkowski
                     }
+    STREAMING_DETECTOR_PARAMS = {'SST': {'n_components': 2,
+                                         'window_length': 32,
+                                         'trajectory_window_length': 10,
+                                         'dynamic_mode': True,
+                                         'delay_lag': None},
+                                 'FunctionalPCA': {'n_components': 2,
+                                                   'regularization': None,
+                                                   'basis_function': None,
+                                                   'window_length': 32},
+                                 'Kalman': {}}
 
     PERSISTENCE_DIAGRAM_FEATURES = {
         'HolesNumberFeature': HolesNumberFeature(),
@@ -223,6 +278,7 @@ class FedotOperationConstant(Enum):
         'classification': ClassificationMetricsEnum.accuracy,
         'ts_forecasting': RegressionMetricsEnum.RMSE,
         'regression': RegressionMetricsEnum.RMSE}
+    PROBABILITY_METRICS = ('roc_auc', 'logloss')
     FEDOT_TUNER_STRATEGY = {
         'optuna': OptunaTuner
     }
@@ -644,6 +700,8 @@ class UnitTestConstant(Enum):
 
 STAT_METHODS = FeatureConstant.STAT_METHODS.value
 STAT_METHODS_GLOBAL = FeatureConstant.STAT_METHODS_GLOBAL.value
+BATCH_STAT_METHODS = FeatureConstant.BATCH_STAT_METHODS.value
+BATCH_STAT_METHODS_GLOBAL = FeatureConstant.BATCH_STAT_METHODS_GLOBAL.value
 PERSISTENCE_DIAGRAM_FEATURES = FeatureConstant.PERSISTENCE_DIAGRAM_FEATURES.value
 PERSISTENCE_DIAGRAM_EXTRACTOR = FeatureConstant.PERSISTENCE_DIAGRAM_EXTRACTOR.value
 DISCRETE_WAVELETS = FeatureConstant.DISCRETE_WAVELETS.value
@@ -652,6 +710,7 @@ WAVELET_SCALES = FeatureConstant.WAVELET_SCALES.value
 SINGULAR_VALUE_MEDIAN_THR = FeatureConstant.SINGULAR_VALUE_MEDIAN_THR.value
 SINGULAR_VALUE_BETA_THR = FeatureConstant.SINGULAR_VALUE_BETA_THR
 DISTANCE_METRICS = FeatureConstant.METRICS_DICT.value
+STREAMING_DETECTOR_PARAMS = FeatureConstant.STREAMING_DETECTOR_PARAMS.value
 
 KERNEL_ALGO = KernelsConstant.KERNEL_ALGO.value
 KERNEL_BASELINE_FEATURE_GENERATORS = KernelsConstant.KERNEL_BASELINE_FEATURE_GENERATORS.value
@@ -666,6 +725,7 @@ FEDOT_TASK = FedotOperationConstant.FEDOT_TASK.value
 FEDOT_ATOMIZE_OPERATION = FedotOperationConstant.FEDOT_ATOMIZE_OPERATION.value
 FEDOT_GET_METRICS = FedotOperationConstant.FEDOT_GET_METRICS.value
 FEDOT_TUNING_METRICS = FedotOperationConstant.FEDOT_TUNING_METRICS.value
+PROBABILITY_METRICS = FedotOperationConstant.PROBABILITY_METRICS.value
 FEDOT_ASSUMPTIONS = FedotOperationConstant.FEDOT_ASSUMPTIONS.value
 FEDOT_API_PARAMS = FedotOperationConstant.FEDOT_API_PARAMS.value
 FEDOT_ENSEMBLE_ASSUMPTIONS = FedotOperationConstant.FEDOT_ENSEMBLE_ASSUMPTIONS.value
@@ -677,6 +737,8 @@ BATCH_SIZE_FOR_FEDOT_WORKER = ComputationalConstant.BATCH_SIZE_FOR_FEDOT_WORKER.
 FEDOT_WORKER_NUM = ComputationalConstant.FEDOT_WORKER_NUM.value
 FEDOT_WORKER_TIMEOUT_PARTITION = ComputationalConstant.FEDOT_WORKER_TIMEOUT_PARTITION.value
 PATIENCE_FOR_EARLY_STOP = ComputationalConstant.PATIENCE_FOR_EARLY_STOP.value
+CACHE_SIZE_LIMIT = ComputationalConstant.CACHE_SIZE_LIMIT.value
+DASK_CLUSTER_PARAMS = ComputationalConstant.DASK_CLUSTER_PARAMS.value
 
 MULTI_ARRAY = DataTypeConstant.MULTI_ARRAY.value
 MATRIX = DataTypeConstant.MATRIX.value
@@ -23,6 +23,26 @@ from fedot_ind.core.repository.industrial_implementations.optimisation import _g
     has_no_data_flow_conflicts_in_industrial_pipeline
 from fedot_ind.core.tuning.search_space import get_industrial_search_space
 
+_MISSING = object()
+# attributes of fedot replaced by industrial implementations, restored when industrial models are switched off
+_ORIGINAL_ATTRIBUTES = {}
+
+
+def _patch(owner, name: str, value):
+    _ORIGINAL_ATTRIBUTES.setdefault((owner, name), vars(owner).get(name, _MISSING))
+    setattr(owner, name, value)
+
+
+def _restore_patches():
+    for (owner, name), original in _ORIGINAL_ATTRIBUTES.items():
+        if original is _MISSING:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+    _ORIGINAL_ATTRIBUTES.clear()
+    if has_no_data_flow_conflicts_in_industrial_pipeline in class_rules:
+        class_rules.remove(has_no_data_flow_conflicts_in_industrial_pipeline)
+
 
 class IndustrialModels:
     def __init__(self):
@@ -61,42 +81,43 @@ class IndustrialModels:
         OperationTypesRepository.assign_repo(
             'model', self.industrial_model_path)
         # replace mutations
-        setattr(PipelineSearchSpace, "get_parameters_dict",
-                get_industrial_search_space)
-        setattr(ApiParamsRepository, "_get_default_mutations",
-                _get_default_industrial_mutations)
+        _patch(PipelineSearchSpace, "get_parameters_dict",
+               get_industrial_search_space)
+        _patch(ApiParamsRepository, "_get_default_mutations",
+               _get_default_industrial_mutations)
         # setattr(Crossover, '_crossover_by_type', _crossover_by_type)
         # replace data merger
-        setattr(ImageDataMerger, "preprocess_predicts", preprocess_predicts)
-        setattr(ImageDataMerger, "merge_predicts", merge_predicts)
-        setattr(TSDataMerger, "merge_predicts", merge_predicts)
-        setattr(TSDataMerger, "merge_targets", merge_targets)
-        setattr(TSDataMerger, 'postprocess_predicts', postprocess_predicts)
+        _patch(ImageDataMerger, "preprocess_predicts", preprocess_predicts)
+        _patch(ImageDataMerger, "merge_predicts", merge_predicts)
+        _patch(TSDataMerger, "merge_predicts", merge_predicts)
+        _patch(TSDataMerger, "merge_targets", merge_targets)
+        _patch(TSDataMerger, 'postprocess_predicts', postprocess_predicts)
         # replace data split
-        setattr(DataSourceSplitter, "build", _build)
-        setattr(fedot_data_split, "_split_any", split_any)
-        setattr(fedot_data_split, "_split_time_series", split_time_series)
+        _patch(DataSourceSplitter, "build", _build)
+        _patch(fedot_data_split, "_split_any", split_any)
+        _patch(fedot_data_split, "_split_time_series", split_time_series)
         # setattr(TSDataMerger, 'postprocess_predicts', postprocess_predicts)
         # replace predict operations
-        setattr(Operation, "_predict", predict_operation)
-        setattr(Operation, "predict", predict)
-        setattr(Operation, "predict_for_fit", predict_for_fit)
+        _patch(Operation, "_predict", predict_operation)
+        _patch(Operation, "predict", predict)
+        _patch(Operation, "predict_for_fit", predict_for_fit)
         # replace ts forecasting operations
-        setattr(LaggedImplementation,
-                '_update_column_types', update_column_types)
-        setattr(LaggedImplementation, 'transform', transform_lagged)
-        setattr(TopologicalFeaturesImplementation, 'fit', fit_topo_extractor)
-        setattr(
+        _patch(LaggedImplementation,
+               '_update_column_types', update_column_types)
+        _patch(LaggedImplementation, 'transform', transform_lagged)
+        _patch(TopologicalFeaturesImplementation, 'fit', fit_topo_extractor)
+        _patch(
             TopologicalFeaturesImplementation,
             'transform',
             transform_topo_extractor)
-        setattr(LaggedImplementation, 'transform_for_fit',
-                transform_lagged_for_fit)
-        setattr(LaggedImplementation, '_check_and_correct_window_size',
-                _check_and_correct_window_size)
-        setattr(TsSmoothingImplementation, 'transform', transform_smoothing)
+        _patch(LaggedImplementation, 'transform_for_fit',
+               transform_lagged_for_fit)
+        _patch(LaggedImplementation, '_check_and_correct_window_size',
+               _check_and_correct_window_size)
+        _patch(TsSmoothingImplementation, 'transform', transform_smoothing)
 
-        class_rules.append(has_no_data_flow_conflicts_in_industrial_pipeline)
+        if has_no_data_flow_conflicts_in_industrial_pipeline not in class_rules:
+            class_rules.append(has_no_data_flow_conflicts_in_industrial_pipeline)
         return OperationTypesRepository
 
     def __enter__(self):
@@ -118,15 +139,16 @@ class IndustrialModels:
         OperationTypesRepository.assign_repo(
             'model', self.industrial_model_path)
 
-        setattr(PipelineSearchSpace, "get_parameters_dict",
-                get_industrial_search_space)
-        setattr(ApiComposer, "_get_default_mutations",
-                _get_default_industrial_mutations)
+        _patch(PipelineSearchSpace, "get_parameters_dict",
+               get_industrial_search_space)
+        _patch(ApiComposer, "_get_default_mutations",
+               _get_default_industrial_mutations)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Switching to fedot models.
+        Switching to fedot models, implementations replaced by ``setup_repository`` are restored as well.
         """
+        _restore_patches()
         OperationTypesRepository.__repository_dict__.update(
             {'data_operation': {'file': self.base_data_operation_path,
                                 'initialized_repo': None,
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 import os
 import shutil
@@ -24,19 +26,30 @@ class DataLoader:
     """Class for reading data files and downloading from UCR archive if not found locally.
     At the moment supports ``.ts``, ``.txt``, ``.tsv``, and ``.arff`` formats.
 
+    Parsed datasets are converted once into a binary cache: features of train and test subsets are stored as
+    ``.npy`` files and labels together with metadata as ``.npz`` file. Next loads memory-map the features
+    instead of parsing the source files again. The cache is rebuilt as soon as size or modification time of
+    a source file changes.
+
     Args:
         dataset_name: name of dataset
         folder: path to folder with data
+        use_cache: whether to read and write the binary cache.
+        cache_folder: path to the folder with the binary cache. Default is ``cache/datasets`` in the project.
 
     Examples:
         >>> data_loader = DataLoader('ItalyPowerDemand')
         >>> train_data, test_data = data_loader.load_data()
     """
 
-    def __init__(self, dataset_name: str, folder: str = None):
+    binary_cache_version = 1
+
+    def __init__(self, dataset_name: str, folder: str = None, use_cache: bool = True, cache_folder: str = None):
         self.logger = logging.getLogger('DataLoader')
         self.dataset_name = dataset_name
         self.folder = folder
+        self.use_cache = use_cache
+        self.cache_folder = os.path.join(PROJECT_PATH, 'cache', 'datasets') if cache_folder is None else cache_folder
         self.forecast_data_source = {'M3': M3.load,
                                      # 'M4': M4.load,
                                      'M4': self.local_m4_load,
@@ -111,74 +124,145 @@ class DataLoader:
             # return train_data, test_data
         self.logger.info('Data read successfully from local folder')
 
-        if isinstance(train_data[0].iloc[0, 0], pd.Series):
-            def convert(arr):
-                """Transform pd.Series values to np.ndarray"""
-                return np.array([d.values for d in arr])
-
-            train_data = (np.apply_along_axis(
-                convert, 1, train_data[0]), train_data[1])
-            test_data = (np.apply_along_axis(
-                convert, 1, test_data[0]), test_data[1])
+        if is_series_frame(train_data[0]):
+            train_data = (series_frame_to_array(train_data[0]), train_data[1])
+            test_data = (series_frame_to_array(test_data[0]), test_data[1])
 
         return train_data, test_data
 
-    def read_train_test_files(self, data_path, dataset_name, shuffle=True):
-
+    def read_train_test_files(self, data_path, dataset_name, shuffle=True, use_cache=None):
+        use_cache = self.use_cache if use_cache is None else use_cache
         file_path = data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN'
+        source_format = next((extension for extension in ('tsv', 'txt', 'ts', 'arff', 'csv')
+                              if os.path.isfile(f'{file_path}.{extension}')), None)
+        if source_format is None:
+            self.logger.error(
+                f'Data not found in {data_path + "/" + dataset_name}')
+            return None, None, None
+
+        self.logger.info(
+            f'Reading data from {data_path + "/" + dataset_name}')
+        source_files = [f'{data_path}/{dataset_name}/{dataset_name}_{subset}.{source_format}'
+                        for subset in ('TRAIN', 'TEST')]
+        cache_path = self._binary_cache_path(data_path, dataset_name)
+        cached_data = self._load_binary_cache(cache_path, source_files) if use_cache else None
+        if cached_data is not None:
+            is_multi, x_train, y_train, x_test, y_test = cached_data
+        else:
+            is_multi, x_train, y_train, x_test, y_test = self._read_source_files(
+                data_path, dataset_name, source_format)
+            if use_cache:
+                self._save_binary_cache(cache_path, source_files, source_format,
+                                        is_multi, x_train, y_train, x_test, y_test)
+
+        y_train, y_test = convert_type(y_train, y_test)
+
+        if shuffle:
+            shuffled_idx = np.arange(x_train.shape[0])
+            np.random.shuffle(shuffled_idx)
+            if isinstance(x_train, pd.DataFrame):
+                x_train = x_train.iloc[shuffled_idx, :]
+            else:
+                x_train = x_train[shuffled_idx, :]
+            y_train = y_train[shuffled_idx]
+        return is_multi, (x_train, y_train), (x_test, y_test)
+
+    def _read_source_files(self, data_path, dataset_name, source_format):
         # If data unpacked as .tsv file
-        if os.path.isfile(file_path + '.tsv'):
-            self.logger.info(
-                f'Reading data from {data_path + "/" + dataset_name}')
+        if source_format == 'tsv':
             x_train, y_train, x_test, y_test = self.read_tsv(
                 dataset_name, data_path)
             is_multi = False
 
         # If data unpacked as .txt file
-        elif os.path.isfile(file_path + '.txt'):
-            self.logger.info(
-                f'Reading data from {data_path + "/" + dataset_name}')
+        elif source_format == 'txt':
             x_train, y_train, x_test, y_test = self.read_txt_files(
                 dataset_name, data_path)
             is_multi = False
 
         # If data unpacked as .ts file
-        elif os.path.isfile(file_path + '.ts'):
-            self.logger.info(
-                f'Reading data from {data_path + "/" + dataset_name}')
+        elif source_format == 'ts':
             x_train, y_train, x_test, y_test = self.read_ts_files(
                 dataset_name, data_path)
             is_multi = True
 
         # If data unpacked as .arff file
-        elif os.path.isfile(file_path + '.arff'):
-            self.logger.info(
-                f'Reading data from {data_path + "/" + dataset_name}')
+        elif source_format == 'arff':
             x_train, y_train, x_test, y_test = self.read_arff_files(
                 dataset_name, data_path)
             is_multi = True
 
-        elif os.path.isfile(file_path + '.csv'):
-            self.logger.info(
-                f'Reading data from {data_path + "/" + dataset_name}')
-            pd.read_csv(file_path + '.csv')
-
         else:
-            self.logger.error(
-                f'Data not found in {data_path + "/" + dataset_name}')
-            return None, None, None
+            pd.read_csv(data_path + '/' + dataset_name + f'/{dataset_name}_TRAIN.csv')
+        return is_multi, x_train, y_train, x_test, y_test
 
-        y_train, y_test = convert_type(y_train, y_test)
+    def _binary_cache_path(self, data_path, dataset_name) -> str:
+        # datasets with the same name from different folders get their own caches
+        source_folder = os.path.abspath(os.path.join(data_path, dataset_name))
+        folder_hash = hashlib.blake2b(source_folder.encode('utf8'), digest_size=6).hexdigest()
+        return os.path.join(self.cache_folder, f'{dataset_name}_{folder_hash}')
 
-        if shuffle:
-            shuffled_idx = np.arange(x_train.shape[0])
-            np.random.shuffle(shuffled_idx)
-            if isinstance(x_train, pd.DataFrame):
-                x_train = x_train.iloc[shuffled_idx, :]
-            else:
-                x_train = x_train[shuffled_idx, :]
-            y_train = y_train[shuffled_idx]
-        return is_multi, (x_train, y_train), (x_test, y_test)
+    @staticmethod
+    def _source_signature(source_files) -> list:
+        signature = []
+        for source_file in source_files:
+            stat = os.stat(source_file)
+            signature.append([os.path.basename(source_file), stat.st_size, stat.st_mtime_ns])
+        return signature
+
+    def _load_binary_cache(self, cache_path, source_files):
+        """Loads dataset from the binary cache. Features are memory-mapped in copy-on-write mode, so in-place
+        changes stay in memory and never reach the cache.
+
+        Returns:
+            tuple of ``is_multi`` flag, train and test features and labels or None if the cache is missing or stale.
+
+        """
+        try:
+            with np.load(os.path.join(cache_path, 'labels.npz')) as labels:
+                meta = json.loads(str(labels['meta']))
+                y_train, y_test = labels['y_train'], labels['y_test']
+            if meta['version'] != self.binary_cache_version or \
+                    meta['source'] != self._source_signature(source_files):
+                self.logger.info('Binary cache is outdated')
+                return None
+            x_train, x_test = [np.load(os.path.join(cache_path, f'{subset}.npy'), mmap_mode='c')
+                               for subset in ('TRAIN', 'TEST')]
+        except (OSError, KeyError, ValueError):
+            return None
+        if meta['shapes'] != [list(x_train.shape), list(x_test.shape)]:
+            return None
+
+        if meta['format'] == 'tsv':
+            # tsv reader returns features as DataFrame with the label column cut off
+            x_train, x_test = [pd.DataFrame(x, columns=range(1, x.shape[1] + 1)) for x in (x_train, x_test)]
+        self.logger.info(f'Data read from binary cache {cache_path}')
+        return meta['is_multi'], x_train, y_train, x_test, y_test
+
+    def _save_binary_cache(self, cache_path, source_files, source_format, is_multi, x_train, y_train, x_test, y_test):
+        """Saves parsed dataset to the binary cache. Every file is written to a temporary file first and then
+        moved in place, labels with metadata are written last, so concurrent loaders never see a partial cache.
+        Datasets with series of unequal length are not cached.
+
+        """
+        features = [to_numeric_array(x) for x in (x_train, x_test)]
+        if any(x is None for x in features):
+            return
+        labels = {name: y.astype(str) if y.dtype == object else y
+                  for name, y in (('y_train', np.asarray(y_train)), ('y_test', np.asarray(y_test)))}
+        try:
+            meta = {'version': self.binary_cache_version,
+                    'format': source_format,
+                    'is_multi': is_multi,
+                    'source': self._source_signature(source_files),
+                    'shapes': [list(x.shape) for x in features]}
+            os.makedirs(cache_path, exist_ok=True)
+            for subset, x in zip(('TRAIN', 'TEST'), features):
+                _atomic_write(os.path.join(cache_path, f'{subset}.npy'), np.save, x)
+            _atomic_write(os.path.join(cache_path, 'labels.npz'), np.savez,
+                          meta=np.array(json.dumps(meta)), **labels)
+        except OSError as ex:
+            self.logger.warning(f'Binary cache was not saved due to error {ex}')
 
     def predict_encoding(self, file_path: Path, n_lines: int = 20) -> str:
         with Path(file_path).open('rb') as f:
@@ -917,7 +1001,7 @@ class DataLoader:
         """
         try:
             is_multi, (x_train, y_train), (x_test, y_test) = self.read_train_test_files(
-                data_path, dataset_name)
+                data_path, dataset_name, use_cache=False)
 
         except Exception as e:
             self.logger.error(f'Error while unpacking data: {e}')
@@ -957,6 +1041,45 @@ class DataLoader:
                     y_train), (pd.DataFrame(x_test), y_test)
 
 
+def is_series_frame(features) -> bool:
+    """Checks if features are DataFrame with a ``pd.Series`` in every cell as ``.ts`` reader returns them"""
+    return isinstance(features, pd.DataFrame) and features.shape[0] > 0 and \
+        isinstance(features.iloc[0, 0], pd.Series)
+
+
+def series_frame_to_array(features: pd.DataFrame) -> np.ndarray:
+    """Transforms DataFrame of ``pd.Series`` to array of shape (n_samples, n_channels, series_length)"""
+
+    def convert(arr):
+        """Transform pd.Series values to np.ndarray"""
+        return np.array([d.values for d in arr])
+
+    return np.apply_along_axis(convert, 1, features)
+
+
+def to_numeric_array(features):
+    """Returns features as numeric array or None if they can't be stored as one, e.g. series of unequal length"""
+    if is_series_frame(features):
+        try:
+            features = series_frame_to_array(features)
+        except ValueError:
+            return None
+    features = np.asarray(features)
+    return None if features.dtype == object else features
+
+
+def _atomic_write(file_path: str, save, *args, **kwargs):
+    """Writes file with ``save(file, *args, **kwargs)`` to a temporary file and moves it in place"""
+    tmp_file = f'{file_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_file, 'wb') as file:
+            save(file, *args, **kwargs)
+        os.replace(tmp_file, file_path)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
 def convert_type(y_train, y_test):
     # Conversion of target values to int or str
     try:
@@ -165,3 +165,25 @@ def test_plot_methods(fedot_industrial_classification):
     plt.switch_backend("Agg")
     warnings.filterwarnings("ignore", "Matplotlib is currently using agg")
     fedot_industrial_classification.explain()
+
+
+def test_get_metrics_predicts_only_missing_probabilities(fedot_industrial_classification, monkeypatch):
+    target = np.array([0, 1, 1, 0])
+    industrial = fedot_industrial_classification
+    industrial.predict_data = 'last predict data'
+    industrial.predicted_labels = target.copy()
+    calls = []
+
+    def predict_proba(predict_data, *args, **kwargs):
+        calls.append(predict_data)
+        industrial.predicted_probs = np.array([0.1, 0.9, 0.8, 0.3])
+        return industrial.predicted_probs
+
+    monkeypatch.setattr(industrial, 'predict_proba', predict_proba)
+    monkeypatch.setattr(industrial, 'predict_all', lambda *args, **kwargs: pytest.fail('labels are predicted again'))
+
+    industrial.get_metrics(target=target, metric_names=('f1', 'accuracy'))
+    assert calls == []
+    metrics = industrial.get_metrics(target=target, metric_names=('f1', 'logloss'))
+    assert calls == ['last predict data']
+    assert 'logloss' in metrics
@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+
+LAZY_MODULES = ['torchvision',
+                'distributed',
+                'gtda',
+                'MKLpy',
+                'fastai',
+                'fedot_ind.api.utils.industrial_strategy',
+                'fedot_ind.core.repository.model_repository',
+                'fedot_ind.core.models.nn.network_impl.resnet',
+                'fedot_ind.tools.explain.explain',
+                'fedot_ind.tools.synthetic.anomaly_generator',
+                'fedot_ind.tools.synthetic.ts_generator']
+
+STARTUP_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import fedot.api.main
+fedot_time = time.perf_counter() - start
+start = time.perf_counter()
+import fedot_ind.api.main
+api_time = time.perf_counter() - start
+print(json.dumps({{'fedot_time': fedot_time,
+                  'api_time': api_time,
+                  'loaded': [m for m in {LAZY_MODULES} if m in sys.modules]}}))
+"""
+
+
+def test_api_main_startup_is_import_light():
+    output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT],
+                            capture_output=True, text=True, check=True).stdout
+    startup = json.loads(output.strip().splitlines()[-1])
+
+    assert startup['loaded'] == []
+    # both timings are taken on the same machine, the API should not cost more than fedot it is built on
+    assert startup['api_time'] < startup['fedot_time']
@@ -33,3 +33,14 @@ def test_DataCheck(input_data):
         features, target), task='classification')
     clean_data = data_check.check_input_data()
     assert clean_data is not None
+
+
+def test_DataCheck_does_not_copy_or_change_input():
+    features = np.random.rand(10, 3, 20)
+    target = np.random.choice([-1, 1], 10)
+    initial_target = target.copy()
+    clean_data = DataCheck(input_data=(features, target), task='classification').check_input_data()
+
+    assert np.shares_memory(clean_data.features, features)
+    assert np.array_equal(target, initial_target)
+    assert not np.any(clean_data.target == -1)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+
+from fedot_ind.api.utils.checkers_collections import DataCheck
+from fedot_ind.api.utils.pipeline_predictions import reuse_node_predictions
+from fedot_ind.core.models.quantile.quantile_extractor import QuantileExtractor
+from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+
+
+@pytest.fixture
+def input_data():
+    features = np.random.rand(30, 1, 40)
+    target = np.random.randint(0, 3, 30)
+    return DataCheck(input_data=(features, target), task='classification').check_input_data()
+
+
+@pytest.fixture
+def pipeline(input_data):
+    with IndustrialModels():
+        pipeline = PipelineBuilder().add_node('quantile_extractor').add_node('rf').build()
+        pipeline.fit(input_data)
+        yield pipeline
+
+
+def test_reuse_node_predictions(pipeline, input_data, monkeypatch):
+    labels = pipeline.predict(input_data, 'labels').predict
+    probs = pipeline.predict(input_data, 'probs').predict
+    transform = QuantileExtractor._transform
+    calls = []
+    monkeypatch.setattr(QuantileExtractor, '_transform',
+                        lambda self, data: calls.append(data) or transform(self, data))
+
+    with reuse_node_predictions(pipeline) as features:
+        assert np.array_equal(pipeline.predict(input_data, 'labels').predict, labels)
+        assert np.allclose(pipeline.predict(input_data, 'probs').predict, probs)
+
+    assert len(calls) == 1
+    assert list(features) == ['quantile_extractor']
+    assert all('predict' not in vars(node) for node in pipeline.nodes)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from fedot_ind.core.architecture.pipelines.anomaly_detection import StreamingAnomalyDetection
+
+MODEL_HYPERPARAMS = {'SST': {'n_components': 2,
+                             'window_length': 40,
+                             'trajectory_window_length': 10,
+                             'dynamic_mode': True,
+                             'delay_lag': None},
+                     'FunctionalPCA': {'n_components': 3,
+                                       'regularization': None,
+                                       'basis_function': None,
+                                       'window_length': 32},
+                     'Kalman': {}}
+
+
+@pytest.fixture
+def time_series():
+    time_series = np.sin(np.arange(4000) / 8) + np.random.normal(scale=0.05, size=4000)
+    time_series[3000:3040] += 3
+    return time_series
+
+
+@pytest.mark.parametrize('pipeline_type', list(MODEL_HYPERPARAMS))
+def test_streaming_scores_do_not_depend_on_chunks(time_series, pipeline_type, tmp_path):
+    scores = []
+    np.save(tmp_path / 'recording.npy', time_series[1000:])
+    for source, chunk_size in [(time_series[1000:], 3000), (str(tmp_path / 'recording.npy'), 257)]:
+        # randomized PCA solver is used for functional PCA basis
+        np.random.seed(0)
+        detector = StreamingAnomalyDetection(pipeline_type, MODEL_HYPERPARAMS[pipeline_type], chunk_size)
+        detector.fit(time_series[:1000])
+        scores.append(np.concatenate(list(detector.score(source))))
+    assert np.allclose(scores[0], scores[1])
+    # anomaly starts at 2000th sample of the stream, functional PCA scores windows of 32 samples
+    samples_per_score = 32 if pipeline_type == 'FunctionalPCA' else 1
+    assert 1900 < np.argmax(np.abs(scores[0])) * samples_per_score < 2100
+
+
+@pytest.mark.parametrize('pipeline_type', list(MODEL_HYPERPARAMS))
+def test_streaming_detector_with_default_hyperparams(time_series, pipeline_type):
+    detector = StreamingAnomalyDetection(pipeline_type).fit(time_series[:1000])
+    scores = np.concatenate(list(detector.score(time_series[1000:])))
+    assert scores.size > 0
+    assert np.isfinite(scores).all()
+
+
+def test_unknown_streaming_pipeline():
+    with pytest.raises(ValueError):
+        StreamingAnomalyDetection('VectorAngle')
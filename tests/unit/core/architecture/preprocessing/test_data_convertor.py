@@ -1,7 +1,12 @@
+import numpy as np
+import pandas as pd
 import pytest
+import torch
 from fedot.core.data.data import InputData
 
-from fedot_ind.core.architecture.preprocessing.data_convertor import FedotConverter
+from fedot_ind.api.utils.data import init_input_data
+from fedot_ind.core.architecture.preprocessing.data_convertor import CustomDatasetCLF, FedotConverter, \
+    MemmapDatasetCLF
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -17,3 +22,28 @@ def test_fedot_converter(data):
     converter = FedotConverter(data=train_data)
 
     assert isinstance(converter.input_data, InputData)
+
+
+def test_lazy_datasets_match_eager():
+    features = pd.DataFrame(np.random.rand(20, 10))
+    target = np.random.choice(['a', 'b', 'c'], 20)
+    eager = CustomDatasetCLF(init_input_data(X=features, y=target, task='classification'))
+    lazy = CustomDatasetCLF(init_input_data(X=features, y=target, task='classification'), lazy=True)
+    memmap = MemmapDatasetCLF(init_input_data(X=features, y=target, task='classification'))
+
+    assert isinstance(memmap.x, np.memmap)
+    for dataset in (lazy, memmap):
+        assert len(dataset) == len(eager)
+        assert dataset.classes == eager.classes
+        x, y = next(iter(torch.utils.data.DataLoader(dataset, batch_size=len(dataset))))
+        assert torch.allclose(x, eager.x.cpu())
+        assert torch.equal(y, eager.y.cpu())
+
+
+def test_memmap_dataset_is_written_in_chunks(tmp_path):
+    features = np.random.rand(23, 2, 10)
+    target = np.random.choice(['a', 'b'], 23)
+    memmap = MemmapDatasetCLF(init_input_data(X=features, y=target, task='classification'),
+                              path=str(tmp_path / 'features.npy'), chunk_size=5)
+    assert memmap.x.dtype == np.float32
+    assert np.allclose(memmap.x, features)
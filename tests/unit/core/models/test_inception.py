@@ -1,6 +1,10 @@
+import os
+import tempfile
+
 import numpy as np
 import pandas as pd
 import pytest
+import torch
 
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.models.nn.network_impl.inception import InceptionTimeModel
@@ -18,3 +22,48 @@ def test_inception_time_model(ts):
     loss_fn, optimizer = inception._init_model(ts=ts)
     assert loss_fn is not None
     assert optimizer is not None
+
+
+def test_batch_inference(ts):
+    inception = InceptionTimeModel({'inference_batch_size': 7, 'inference_threads': 1})
+    inception._init_model(ts=ts)
+    inception.model.eval()
+    x_test = np.random.rand(30, 1, 100)
+    with torch.no_grad():
+        expected = inception.model(torch.as_tensor(x_test, dtype=torch.float32))
+    pred = inception._batch_inference(x_test)
+    assert not pred.requires_grad
+    assert torch.allclose(pred, expected, atol=1e-5)
+
+
+def test_batch_inference_of_empty_array(ts):
+    inception = InceptionTimeModel()
+    inception._init_model(ts=ts)
+    with pytest.raises(ValueError):
+        inception._batch_inference(np.empty((0, 1, 100)))
+
+
+def test_fit_saves_checkpoint_to_folder(tmp_path):
+    features = np.random.rand(20, 1, 30)
+    target = np.random.choice([0, 1], 20)
+    inception = InceptionTimeModel({'epochs': 1, 'checkpoint_folder': tmp_path})
+    inception.fit(init_input_data(X=features, y=target, task='classification'))
+    assert (tmp_path / 'checkpoint.pth').exists()
+
+
+def test_fit_removes_default_checkpoint_folder(tmp_path, monkeypatch):
+    folders = []
+    make_folder = tempfile.mkdtemp
+
+    def record_folder(*args, **kwargs):
+        folders.append(make_folder(*args, **kwargs))
+        return folders[-1]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, 'mkdtemp', record_folder)
+    features = np.random.rand(20, 1, 30)
+    target = np.random.choice([0, 1], 20)
+    inception = InceptionTimeModel({'epochs': 1})
+    inception.fit(init_input_data(X=features, y=target, task='classification'))
+    assert not (tmp_path / 'checkpoint.pth').exists()
+    assert folders and not any(os.path.exists(folder) for folder in folders)
@@ -0,0 +1,78 @@
+import gc
+import pickle
+
+import pytest
+import torch
+from fedot.core.operations.operation_parameters import OperationParameters
+
+from fedot_ind.api.utils.data import init_input_data
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.models.nn.network_impl.mini_rocket import MiniRocketExtractor, MiniRocketFeatures, \
+    get_minirocket_features
+from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
+
+
+@pytest.fixture
+def input_data():
+    (X_train, y_train), (X_test, y_test) = TimeSeriesDatasetsGenerator(
+        num_samples=40, max_ts_len=50, binary=True, test_size=0.5).generate_data()
+    return init_input_data(X_train, y_train), init_input_data(X_test, y_test)
+
+
+@pytest.fixture
+def extractor():
+    return MiniRocketExtractor(OperationParameters(num_features=840))
+
+
+def test_transform_reuses_fitted_kernels(extractor, input_data):
+    train_data, test_data = input_data
+    extractor.fit(train_data)
+    fitted_generators = extractor.feature_generators
+    train_features = extractor.transform(train_data).predict
+    first_test_features = extractor.transform(test_data).predict
+    second_test_features = extractor.transform(test_data).predict
+
+    assert extractor.feature_generators is fitted_generators
+    assert train_features.shape[0] == train_data.features.shape[0]
+    assert np.allclose(first_test_features, second_test_features)
+
+
+def test_fitted_extractor_is_serializable(extractor, input_data):
+    train_data, test_data = input_data
+    extractor.fit(train_data)
+    features = extractor.transform(test_data).predict
+    restored_extractor = pickle.loads(pickle.dumps(extractor))
+    assert np.allclose(features, restored_extractor.transform(test_data).predict)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_chunked_features_match_full_batch(n_jobs):
+    ts = np.random.randn(50, 2, 60).astype(np.float32)
+    model = MiniRocketFeatures(input_dim=2, seq_len=60, num_features=840, random_state=0).fit(ts)
+    full_batch_features = model(torch.from_numpy(ts)).numpy()
+    chunked_features = get_minirocket_features(ts, model, chunksize=7, n_jobs=n_jobs)
+    assert np.allclose(full_batch_features, chunked_features[:, :, 0])
+
+
+def test_features_as_tensor():
+    ts = np.random.randn(20, 2, 60).astype(np.float32)
+    model = MiniRocketFeatures(input_dim=2, seq_len=60, num_features=840, random_state=0).fit(ts)
+    tensor_features = get_minirocket_features(ts, model, chunksize=7, use_cuda=False, convert_to_numpy=False)
+    assert isinstance(tensor_features, torch.Tensor)
+    assert np.allclose(get_minirocket_features(ts, model, chunksize=7), tensor_features.detach().numpy())
+
+
+def test_transform_to_memmap(input_data, tmp_path):
+    train_data, _ = input_data
+    extractor = MiniRocketExtractor(OperationParameters(num_features=840, chunk_size=8,
+                                                        memmap_folder=str(tmp_path)))
+    extractor.fit(train_data)
+    features = extractor.transform(train_data).predict
+    assert isinstance(features, np.memmap)
+    assert len(list(tmp_path.glob('*.npy'))) == 1
+    extractor.transform(train_data)
+    gc.collect()
+    assert len(list(tmp_path.glob('*.npy'))) == 1
+    del features
+    gc.collect()
+    assert list(tmp_path.glob('*.npy')) == []
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+
+from fedot_ind.core.models.nn.network_impl.nbeats import NBeatsModel
+
+HORIZON = 10
+
+
+@pytest.fixture
+def time_series():
+    return np.sin(np.arange(300) / 10) + 0.1 * np.random.rand(300)
+
+
+@pytest.fixture
+def nbeats(time_series):
+    task = Task(TaskTypesEnum.ts_forecasting,
+                TsForecastingParams(forecast_length=HORIZON))
+    model = NBeatsModel({'epochs': 1})
+    model.fit(InputData(idx=np.arange(len(time_series)),
+                        features=time_series.copy(),
+                        target=time_series.copy(),
+                        task=task,
+                        data_type=DataTypesEnum.ts))
+    return model
+
+
+def test_forecast_last_windows(nbeats, time_series):
+    series_batch = [time_series, time_series[:200], time_series[50:]]
+    forecast = nbeats.forecast_last_windows(series_batch)
+
+    assert forecast.shape == (3, HORIZON)
+    assert np.allclose(forecast[0], nbeats._predict_model(time_series), atol=1e-6)
+    assert np.allclose(forecast[1], nbeats._predict_model(time_series[:200]), atol=1e-6)
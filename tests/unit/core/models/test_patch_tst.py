@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+
+from fedot_ind.core.models.nn.network_impl.patch_tst import PatchTSTModel
+
+HORIZON = 16
+
+
+def ts_input_data(time_series):
+    task = Task(TaskTypesEnum.ts_forecasting,
+                TsForecastingParams(forecast_length=HORIZON))
+    return InputData(idx=np.arange(len(time_series)),
+                     features=time_series.copy(),
+                     target=time_series.copy(),
+                     task=task,
+                     data_type=DataTypesEnum.ts)
+
+
+@pytest.fixture
+def time_series():
+    return np.sin(np.arange(400) / 10) + 0.1 * np.random.rand(400)
+
+
+def test_forecast_depends_on_last_window_only(time_series):
+    model = PatchTSTModel({'epochs': 1, 'forecast_length': HORIZON})
+    model.fit(ts_input_data(time_series))
+
+    forecast = model.predict(ts_input_data(time_series)).predict
+    long_history = np.concatenate([np.random.rand(1000), time_series])
+    long_history_forecast = model.predict(ts_input_data(long_history)).predict
+
+    assert forecast.shape == (1, HORIZON)
+    assert np.allclose(forecast, long_history_forecast)
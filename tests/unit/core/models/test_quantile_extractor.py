@@ -59,3 +59,26 @@ def test_extract_features(quantile_extractor):
     assert train_features is not None
     assert isinstance(train_features, pd.DataFrame)
     assert len(FEATURES) == train_features.shape[1]
+
+
+@pytest.mark.parametrize('params', [{'window_size': 0},
+                                    {'window_size': 20},
+                                    {'window_size': 20, 'stride': 3}])
+def test_batch_mode_matches_per_sample(params, input_data):
+    batch_extractor = QuantileExtractor({**params, 'batch_mode': True})
+    sample_extractor = QuantileExtractor({**params, 'batch_mode': False})
+    batch_features = batch_extractor.transform(input_data=input_data).predict
+    sample_features = sample_extractor.transform(input_data=input_data).predict
+    assert batch_features.shape == sample_features.shape
+    assert np.allclose(batch_features, sample_features, rtol=1e-6, atol=1e-8)
+    assert batch_extractor.relevant_features == sample_extractor.relevant_features
+
+
+def test_batch_mode_multichannel():
+    (X_train, y_train), _ = TimeSeriesDatasetsGenerator(num_samples=10, max_ts_len=40, binary=True,
+                                                        test_size=0.5, multivariate=True).generate_data()
+    input_train_data = init_input_data(X_train, y_train)
+    batch_features = QuantileExtractor({'window_size': 0, 'batch_mode': True}).transform(input_train_data).predict
+    sample_features = QuantileExtractor({'window_size': 0, 'batch_mode': False}).transform(input_train_data).predict
+    assert batch_features.shape == sample_features.shape
+    assert np.allclose(batch_features, sample_features, rtol=1e-6, atol=1e-8)
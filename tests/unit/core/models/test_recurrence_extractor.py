@@ -5,6 +5,7 @@ from fedot.core.data.data import InputData, OutputData
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.recurrence.reccurence_extractor import RecurrenceExtractor
+from fedot_ind.core.models.recurrence.sequences import RecurrenceFeatureExtractor
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -59,3 +60,49 @@ def test_extract_features(recurrence_extractor):
     train_features = recurrence_extractor.extract_features(X, y)
     assert train_features is not None
     assert isinstance(train_features, pd.DataFrame)
+
+
+def test_batch_quantification_matches_single_matrix(recurrence_extractor, input_data):
+    matrices = np.stack([recurrence_extractor.transformer(time_series=ts, rec_metric='cosine')
+                         .ts_to_recurrence_matrix() for ts in input_data.features[:4]])
+    batch_features = RecurrenceFeatureExtractor.batch_quantification_analysis(matrices)
+    single_features = RecurrenceFeatureExtractor(matrices[2]).quantification_analysis()
+    assert set(batch_features) == set(single_features)
+    for name, value in single_features.items():
+        assert np.isclose(batch_features[name][2], value, equal_nan=True)
+
+
+def test_quantification_matches_baseline_values():
+    time_series = np.sin(np.linspace(0, 6 * np.pi, 40)) + 0.3 * np.cos(np.linspace(0, 17, 40))
+    matrix = RecurrenceExtractor({}).transformer(time_series=time_series,
+                                                 rec_metric='cosine').ts_to_recurrence_matrix()
+    # values of the per-matrix implementation before vectorization
+    baseline = {'RR': 0.475, 'DET': 0.8578947368421053, 'ADLL': 4.794117647058823, 'LDLL': 19,
+                'DIV': 0.05263157894736842, 'EDL': 1.5363176621294163, 'LAM': 0.9526315789473684,
+                'AVLL': 5.838709677419355, 'LVLL': 7, 'EVL': 1.4015074160645349, 'AWLL': 6.75, 'LWLL': 8,
+                'EWLL': 0.8178161788405072, 'RDRR': 1.8060941828254848, 'RLD': 1.1104294478527608}
+    single_features = RecurrenceFeatureExtractor(matrix).quantification_analysis()
+    batch_features = RecurrenceFeatureExtractor.batch_quantification_analysis(
+        np.stack([np.zeros_like(matrix), matrix]))
+    for name, value in baseline.items():
+        assert np.isclose(single_features[name], value)
+        assert np.isclose(batch_features[name][1], value)
+
+
+def test_transform_is_chunked_by_batch_size(input_data):
+    extractor = RecurrenceExtractor({'window_size': 10, 'stride': 1, 'batch_size': 3})
+    batch_sizes = []
+    generate_features_from_batch = extractor._generate_features_from_batch
+
+    def count_batch(batch):
+        batch_sizes.append(len(batch))
+        return generate_features_from_batch(batch)
+
+    extractor._generate_features_from_batch = count_batch
+    extractor.n_processes = 1
+    features = extractor._transform(input_data)
+    assert max(batch_sizes) == 3
+    assert sum(batch_sizes) == input_data.features.shape[0]
+    expected = RecurrenceExtractor({'window_size': 10, 'stride': 1, 'batch_size': 1000})
+    expected.n_processes = 1
+    assert np.allclose(features, expected._transform(input_data))
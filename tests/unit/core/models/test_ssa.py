@@ -1,18 +1,36 @@
+import numpy as np
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+from golem.core.tuning.simultaneous import SimultaneousTuner
+
+from fedot_ind.core.models.ts_forecasting.ssa_forecaster import SSAForecasterImplementation
+from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
+
+
+def ts_input_data(time_series):
+    task = Task(TaskTypesEnum.ts_forecasting,
+                TsForecastingParams(forecast_length=5))
+    return InputData(idx=np.arange(time_series.shape[0]),
+                     features=time_series,
+                     target=time_series,
+                     task=task,
+                     data_type=DataTypesEnum.ts)
 
 
 def test_ssa():
-    pass
-    # time_series = np.random.normal(size=30)
-    # task = Task(TaskTypesEnum.ts_forecasting,
-    #             TsForecastingParams(forecast_length=1))
-    # train_input = InputData(idx=np.arange(time_series.shape[0]),
-    #                         features=time_series,
-    #                         target=time_series,
-    #                         task=task,
-    #                         data_type=DataTypesEnum.ts)
-    # train_data, test_data = train_test_data_setup(train_input)
-    #
-    # with IndustrialModels():
-    #     pipeline = PipelineBuilder().add_node('ssa_forecaster').build()
-    #     pipeline.fit(train_data)
-    # assert pipeline is not None
+    time_series = np.sin(np.arange(200) / 5) + np.random.normal(scale=0.1, size=200)
+    model = SSAForecasterImplementation({'component_model': 'ar',
+                                         'tuning_params': {'tuning_iterations': 2,
+                                                           'tuning_timeout': 0.1,
+                                                           'tuner': SimultaneousTuner}})
+    model.fit(ts_input_data(time_series[:150]))
+    fitted_models = model.model_by_channel
+
+    for history_end in [150, 160]:
+        prediction = model.predict(ts_input_data(time_series[:history_end]))
+        assert prediction.predict.shape[0] == 5
+    assert model.model_by_channel is fitted_models
+    # decomposition was updated with new observations instead of recomputing
+    trajectory = HankelMatrix(time_series=model._history, window_size=model._decomposer.window_size).trajectory_matrix
+    assert np.allclose(model._s, np.linalg.svd(trajectory, compute_uv=False))
@@ -0,0 +1,56 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from fedot_ind.core.models.detection.subspaces.sst import SingularSpectrumTransformation
+
+
+@pytest.fixture
+def time_series():
+    return np.concatenate([np.sin(np.arange(300) / 10), 2 * np.sin(np.arange(300) / 4)]) + \
+        np.random.normal(scale=0.1, size=600)
+
+
+@pytest.mark.parametrize('dynamic_mode, delay_lag', [(True, None), (False, 30)])
+def test_score_stream_matches_offline(time_series, dynamic_mode, delay_lag):
+    sst = SingularSpectrumTransformation({'n_components': 2,
+                                          'window_length': 40,
+                                          'trajectory_window_length': 10,
+                                          'dynamic_mode': dynamic_mode,
+                                          'delay_lag': delay_lag})
+    offline_score = sst.predict(*sst.fit(time_series))
+    online_score = np.concatenate(list(sst.score_stream(np.array_split(time_series, 13))))
+    assert online_score.shape == offline_score.shape
+    assert np.allclose(online_score, offline_score)
+
+
+@pytest.mark.parametrize('window_length, delay_lag', [(40, 0), (1, None)])
+def test_zero_delay_lag(window_length, delay_lag):
+    with pytest.raises(ValueError):
+        SingularSpectrumTransformation({'n_components': 2,
+                                        'window_length': window_length,
+                                        'trajectory_window_length': 10,
+                                        'dynamic_mode': True,
+                                        'delay_lag': delay_lag})
+
+
+@pytest.mark.parametrize('dynamic_mode, delay_lag', [(True, None), (False, 30)])
+def test_offline_score_is_computed_in_chunks(dynamic_mode, delay_lag):
+    time_series = np.sin(np.arange(20000) / 10) + np.random.normal(scale=0.1, size=20000)
+    scores, peak_memory = [], []
+    for chunk_size in [256, 20000]:
+        sst = SingularSpectrumTransformation({'n_components': 2,
+                                              'window_length': 40,
+                                              'trajectory_window_length': 10,
+                                              'dynamic_mode': dynamic_mode,
+                                              'delay_lag': delay_lag,
+                                              'chunk_size': chunk_size})
+        history, test = sst.fit(time_series)
+        tracemalloc.start()
+        scores.append(sst.predict(history, test))
+        peak_memory.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert np.allclose(scores[0], scores[1])
+    # trajectory matrices of all windows take tens of megabytes
+    assert peak_memory[0] < 5 * 1024 ** 2 < peak_memory[1]
@@ -1,9 +1,14 @@
+from collections import OrderedDict
+
 import pytest
 from fedot.core.data.data import InputData, OutputData
+from gtda.diagrams import Scaler
+from gtda.homology import VietorisRipsPersistence
 from fedot_ind.api.utils.data import init_input_data
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.models.topological.topological_extractor import TopologicalExtractor
+from fedot_ind.core.models.topological.topofeatures import PersistenceDiagramsExtractor
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
 
@@ -39,3 +44,41 @@ def test_generate_topological_features(topological_extractor, input_data):
     assert train_features is not None
     assert isinstance(train_features, InputData)
     assert train_features.features.shape[0] == 1
+
+
+def test_transform_batch_matches_single_diagrams():
+    extractor = PersistenceDiagramsExtractor(takens_embedding_dim=1,
+                                             takens_embedding_delay=2,
+                                             homology_dimensions=(0, 1))
+    point_clouds = [np.random.rand(20, 3) for _ in range(5)]
+    diagrams = extractor.transform_batch(point_clouds)
+
+    for point_cloud, diagram in zip(point_clouds, diagrams):
+        expected = Scaler().fit_transform(
+            VietorisRipsPersistence(homology_dimensions=(0, 1)).fit_transform([point_cloud]))[0]
+        assert np.allclose(diagram, expected)
+    assert all(extractor._diagram_key(point_cloud) in extractor.diagram_cache_ for point_cloud in point_clouds)
+    assert extractor.transform_batch(point_clouds[:1])[0] is diagrams[0]
+
+
+def test_transform_batch_with_eviction_of_cached_diagrams(monkeypatch):
+    monkeypatch.setattr(PersistenceDiagramsExtractor, 'cache_size_', 5)
+    monkeypatch.setattr(PersistenceDiagramsExtractor, 'diagram_cache_', OrderedDict())
+    extractor = PersistenceDiagramsExtractor(takens_embedding_dim=1,
+                                             takens_embedding_delay=2,
+                                             homology_dimensions=(0, 1))
+    point_clouds = [np.random.rand(20, 3) for _ in range(6)]
+    cached_diagram = extractor.transform_batch(point_clouds[:1])[0]
+
+    diagrams = extractor.transform_batch(point_clouds)
+    assert len(diagrams) == 6
+    assert diagrams[0] is cached_diagram
+    assert len(extractor.diagram_cache_) == 5
+
+
+def test_approximate_transform(input_data):
+    extractor = TopologicalExtractor({'window_size': 50, 'max_points': 10, 'max_edge_length': 5.})
+    train_features = extractor.transform(input_data=input_data)
+    assert isinstance(train_features, OutputData)
+    assert extractor.approximation['n_landmarks'] == 10
+    assert extractor.approximation['max_edge_length'] == 5.
@@ -0,0 +1,22 @@
+import numpy as np
+
+from fedot_ind.core.operation.decomposition.matrix_decomposition.incremental_svd import svd_append_column
+
+
+def test_svd_append_column():
+    matrix = np.random.rand(10, 30)
+    U, S, VT = np.linalg.svd(matrix[:, :25], full_matrices=False)
+    for column in range(25, 30):
+        U, S, VT = svd_append_column(U, S, VT, matrix[:, column])
+    assert VT.shape == (10, 30)
+    assert np.allclose(S, np.linalg.svd(matrix, compute_uv=False))
+    assert np.allclose(U @ np.diag(S) @ VT, matrix)
+
+
+def test_svd_append_column_truncated():
+    matrix = np.random.rand(10, 30)
+    U, S, VT = np.linalg.svd(matrix[:, :29], full_matrices=False)
+    U, S, VT = svd_append_column(U[:, :3], S[:3], VT[:3], matrix[:, -1], rank=3)
+    assert U.shape == (10, 3)
+    assert S.shape == (3,)
+    assert VT.shape == (3, 30)
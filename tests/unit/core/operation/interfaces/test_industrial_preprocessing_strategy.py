@@ -0,0 +1,51 @@
+import threading
+
+import numpy as np
+import pytest
+from fedot.core.operations.operation_parameters import OperationParameters
+
+from fedot_ind.api.utils.data import init_input_data
+from fedot_ind.core.operation.interfaces import industrial_preprocessing_strategy
+from fedot_ind.core.operation.interfaces.industrial_preprocessing_strategy import \
+    IndustrialCustomPreprocessingStrategy
+
+
+@pytest.fixture()
+def multichannel_data():
+    features = np.random.rand(20, 4, 50)
+    target = np.random.randint(2, size=20)
+    return init_input_data(features, target)
+
+
+def failing_channel_method(operation, data, method_name: str):
+    raise RuntimeError('channel failed')
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_channel_independent_executor(multichannel_data, executor):
+    predictions = []
+    for channel_executor in [None, executor]:
+        params = OperationParameters(channel_executor=channel_executor, channel_n_jobs=2)
+        strategy = IndustrialCustomPreprocessingStrategy('scaling', params)
+        assert strategy.multi_dim_dispatcher.executor == channel_executor
+        assert 'channel_executor' not in strategy.multi_dim_dispatcher.params_for_fit.keys()
+        trained_operation = strategy.fit(multichannel_data)
+        assert len(trained_operation) == multichannel_data.features.shape[1]
+        predictions.append(strategy.predict(trained_operation, multichannel_data).predict)
+    assert np.allclose(predictions[0], predictions[1])
+
+
+def test_unknown_channel_executor(multichannel_data):
+    strategy = IndustrialCustomPreprocessingStrategy('scaling', OperationParameters(channel_executor='unknown'))
+    with pytest.raises(ValueError):
+        strategy.fit(multichannel_data)
+
+
+def test_thread_executor_is_shut_down_after_failure(multichannel_data, monkeypatch):
+    monkeypatch.setattr(industrial_preprocessing_strategy, '_call_channel_method', failing_channel_method)
+    n_threads = threading.active_count()
+    strategy = IndustrialCustomPreprocessingStrategy('scaling', OperationParameters(channel_executor='thread',
+                                                                                    channel_n_jobs=2))
+    with pytest.raises(RuntimeError):
+        strategy.fit(multichannel_data)
+    assert threading.active_count() == n_threads
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
@@ -38,3 +39,66 @@ class TestDataCacher(unittest.TestCase):
 
         self.assertIsInstance(loaded_data, np.ndarray)
         self.assertTrue((self.data.values == loaded_data).all())
+
+    def test_hash_info_depends_on_content(self):
+        first = np.zeros(10000)
+        second = first.copy()
+        second[5000] = 1
+        self.assertEqual(repr(first), repr(second))
+        self.assertNotEqual(self.data_cacher.hash_info(data=first),
+                            self.data_cacher.hash_info(data=second))
+        self.assertNotEqual(self.data_cacher.hash_info(data=first),
+                            self.data_cacher.hash_info(data=first.astype(np.float32)))
+        self.assertNotEqual(self.data_cacher.hash_info(data=first),
+                            self.data_cacher.hash_info(data=first.reshape(100, 100)))
+        self.assertEqual(self.data_cacher.hash_info(data=first),
+                         self.data_cacher.hash_info(data=first.copy()))
+
+    def test_lru_eviction(self):
+        with tempfile.TemporaryDirectory() as cache_folder:
+            item = np.random.rand(1000)
+            cacher = DataCacher(cache_folder=cache_folder, max_cache_size=int(item.nbytes * 2.5))
+            keys = [cacher.hash_info(data=item + i) for i in range(3)]
+            cacher.cache_data(keys[0], item)
+            cacher.cache_data(keys[1], item + 1)
+            cacher.load_data_from_cache(keys[0])
+            cacher.cache_data(keys[2], item + 2)
+
+            cacher.load_data_from_cache(keys[0])
+            cacher.load_data_from_cache(keys[2])
+            with self.assertRaises(FileNotFoundError):
+                cacher.load_data_from_cache(keys[1])
+
+            info = cacher.cache_info()
+            self.assertEqual(info['hits'], 3)
+            self.assertEqual(info['misses'], 1)
+            self.assertEqual(info['evictions'], 1)
+            self.assertEqual(info['entries'], 2)
+            self.assertLessEqual(info['cache_size'], cacher.max_cache_size)
+
+    def test_load_data_from_cache_mmap(self):
+        with tempfile.TemporaryDirectory() as cache_folder:
+            cacher = DataCacher(cache_folder=cache_folder, mmap_mode='r')
+            data = np.random.rand(10, 3, 50)
+            hashed_info = cacher.hash_info(data=data)
+            cacher.cache_data(hashed_info, data)
+            loaded_data = cacher.load_data_from_cache(hashed_info)
+
+            self.assertIsInstance(loaded_data, np.memmap)
+            self.assertFalse(loaded_data.flags.writeable)
+            self.assertTrue((data == loaded_data).all())
+            del loaded_data
+
+    def test_files_cached_before_index_are_evicted(self):
+        with tempfile.TemporaryDirectory() as cache_folder:
+            item = np.random.rand(1000)
+            for i, key in enumerate(['old_first', 'old_second']):
+                np.save(os.path.join(cache_folder, key + '.npy'), item)
+                os.utime(os.path.join(cache_folder, key + '.npy'), (i, i))
+            cacher = DataCacher(cache_folder=cache_folder, max_cache_size=int(item.nbytes * 2.5))
+            self.assertEqual(cacher.cache_info()['entries'], 2)
+
+            cacher.cache_data(cacher.hash_info(data=item), item)
+            self.assertFalse(os.path.exists(os.path.join(cache_folder, 'old_first.npy')))
+            self.assertTrue(os.path.exists(os.path.join(cache_folder, 'old_second.npy')))
+            self.assertEqual(cacher.cache_info()['evictions'], 1)
@@ -1,6 +1,12 @@
 
+import math
+
+import pytest
+
 from fedot_ind.api.utils.data import init_input_data
 from fedot_ind.core.architecture.settings.computational import backend_methods as np
+from fedot_ind.core.operation.decomposition.matrix_decomposition.power_iteration_decomposition import \
+    RSVDDecomposition
 from fedot_ind.core.operation.transformation.basis.eigen_basis import EigenBasisImplementation
 from fedot_ind.tools.synthetic.ts_datasets_generator import TimeSeriesDatasetsGenerator
 
@@ -39,3 +45,67 @@ def test_transform_one_sample():
     assert isinstance(transformed_sample, np.ndarray)
     assert transformed_sample.shape[0] == basis.SV_threshold
     assert transformed_sample.shape[1] == len(sample)
+
+
+def test_batch_mode_matches_per_sample_decomposition():
+    X_train, y_train, X_test, y_test = dataset_uni()
+    input_train_data = init_input_data(X_train, y_train)
+    transformed = {}
+    for batch_mode in [True, False]:
+        basis = EigenBasisImplementation({'window_size': 10,
+                                          'low_rank_approximation': False,
+                                          'batch_mode': batch_mode})
+        transformed[batch_mode] = (basis.transform(input_train_data).predict, basis.SV_threshold)
+    assert transformed[True][1] == transformed[False][1]
+    assert np.allclose(transformed[True][0], transformed[False][0])
+
+
+@pytest.mark.parametrize('dataset, chunk_size', [(dataset_uni, 256), (dataset_uni, 3), (dataset_multi, 7)])
+def test_approximate_batch_mode_matches_per_sample_decomposition(dataset, chunk_size, monkeypatch):
+    def init_fixed_random_params(self, tensor):
+        # the same projection for batched and per-matrix decomposition
+        projection_rank = math.ceil(min(tensor.shape) * self.projection_rank)
+        self.random_projection = np.random.default_rng(0).standard_normal((tensor.shape[1], projection_rank))
+
+    monkeypatch.setattr(RSVDDecomposition, '_init_random_params', init_fixed_random_params)
+    X_train, y_train, X_test, y_test = dataset()
+    input_train_data = init_input_data(X_train, y_train)
+    transformed = {}
+    for batch_mode in [True, False]:
+        basis = EigenBasisImplementation({'window_size': 10,
+                                          'batch_mode': batch_mode,
+                                          'chunk_size': chunk_size})
+        transformed[batch_mode] = (basis.transform(input_train_data).predict, basis.SV_threshold)
+    assert transformed[True][1] == transformed[False][1]
+    assert np.allclose(transformed[True][0], transformed[False][0])
+
+
+
+@pytest.mark.parametrize('sample_ranks, n_decompositions', [([3, 3, 3, 3], 4), ([2, 4, 4, 4], 5)])
+def test_chunks_are_decomposed_once_while_threshold_is_selected(sample_ranks, n_decompositions, monkeypatch):
+    X_train, y_train, _, _ = dataset_uni()
+    input_train_data = init_input_data(X_train, y_train)
+    rank_calls, decompose_calls = [], []
+
+    def explained_spectrum_rank(self, spectrum):
+        # samples of every chunk of 5 get the same rank
+        rank_calls.append(1)
+        return sample_ranks[(len(rank_calls) - 1) // 5]
+
+    monkeypatch.setattr(EigenBasisImplementation, '_explained_spectrum_rank', explained_spectrum_rank)
+    decompose_chunk = EigenBasisImplementation._decompose_chunk
+    monkeypatch.setattr(EigenBasisImplementation, '_decompose_chunk',
+                        lambda self, chunk: decompose_calls.append(1) or decompose_chunk(self, chunk))
+
+    transformed, n_calls = {}, {}
+    for chunk_size in [5, 256]:
+        rank_calls.clear()
+        decompose_calls.clear()
+        basis = EigenBasisImplementation({'window_size': 10, 'low_rank_approximation': False,
+                                          'chunk_size': chunk_size})
+        transformed[chunk_size] = basis.transform(input_train_data).predict
+        n_calls[chunk_size] = len(decompose_calls)
+        assert basis.SV_threshold == max(sample_ranks)
+    assert np.allclose(transformed[5], transformed[256])
+    # the first chunk is cut to rank 2 before rank 4 is found, so only it is decomposed again
+    assert n_calls == {5: n_decompositions, 256: 1}
@@ -1,5 +1,6 @@
 import pytest
 
+from fedot_ind.core.architecture.settings.computational import backend_methods as np
 from fedot_ind.core.operation.transformation.data.hankel import HankelMatrix
 from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
 
@@ -42,3 +43,17 @@ def valid_window_size():
 @pytest.fixture
 def zero_window_size():
     return 0
+
+
+@pytest.mark.parametrize('strides', [1, 3])
+def test_batch_trajectory_matrix(ts_data, valid_window_size, strides):
+    batch = np.stack([np.stack([ts_data, 2 * ts_data]), np.stack([3 * ts_data, 4 * ts_data])])
+    trajectory = HankelMatrix.get_batch_trajectory_matrix(batch, window_size=valid_window_size, strides=strides)
+    single_trajectory = HankelMatrix(time_series=ts_data,
+                                     window_size=valid_window_size,
+                                     strides=strides).trajectory_matrix
+
+    assert trajectory.shape == (2, 2, *single_trajectory.shape)
+    assert np.allclose(trajectory[1, 1], 4 * single_trajectory)
+    assert np.shares_memory(trajectory, batch)
+    assert not trajectory.flags.writeable
@@ -41,3 +41,16 @@ def test_TopologicalTransformation_time_series_to_point_cloud(
         window_length=400)
     assert len(topological_transformer.time_series_to_point_cloud(
         basic_periodic_data)) != 0
+
+
+def test_TopologicalTransformation_landmark_point_cloud(basic_periodic_data):
+    exact_transformer = TopologicalTransformation(window_length=200)
+    approximate_transformer = TopologicalTransformation(window_length=200, max_points=50)
+    point_cloud = exact_transformer.time_series_to_point_cloud(basic_periodic_data)
+    landmarks = approximate_transformer.time_series_to_point_cloud(basic_periodic_data)
+
+    distances = np.linalg.norm(point_cloud[:, np.newaxis] - landmarks[np.newaxis], axis=2)
+    assert landmarks.shape == (50, point_cloud.shape[1])
+    assert exact_transformer.approximation is None
+    assert approximate_transformer.approximation['n_points'] == 200
+    assert np.isclose(distances.min(axis=1).max(), approximate_transformer.approximation['covering_radius'])
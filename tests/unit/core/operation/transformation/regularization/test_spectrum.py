@@ -1,8 +1,8 @@
 import numpy as np
 import pytest
 
-from fedot_ind.core.operation.transformation.regularization.spectrum import reconstruct_basis, \
-    singular_value_hard_threshold, sv_to_explained_variance_ratio
+from fedot_ind.core.operation.transformation.regularization.spectrum import hankelize_components, \
+    reconstruct_basis, singular_value_hard_threshold, sv_to_explained_variance_ratio
 from fedot_ind.tools.synthetic.ts_generator import TimeSeriesGenerator
 
 
@@ -49,3 +49,14 @@ def test_reconstruct_basis(matrix_from_ts):
                                             ts_length=299)
     assert isinstance(reconstructed_basis, np.ndarray)
     assert reconstructed_basis.shape == (299, 30)
+
+
+def test_hankelize_components_batch(matrix_from_ts):
+    U, S, VT = np.linalg.svd(np.stack([matrix_from_ts, 2 * matrix_from_ts]), full_matrices=False)
+    components = hankelize_components(U[..., :3], S[..., :3], VT[..., :3, :])
+    first_component = S[1, 0] * np.outer(U[1, :, 0], VT[1, 0, :])[::-1]
+    expected = [first_component.diagonal(j).mean()
+                for j in range(-first_component.shape[0] + 1, first_component.shape[1])]
+    assert components.shape == (2, 299, 3)
+    assert np.allclose(components[1, :, 0], expected)
+    assert np.allclose(components[1], 2 * components[0])
@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+from distributed import LocalCluster
+from fedot.core.pipelines.adapters import PipelineAdapter
+from fedot.core.pipelines.pipeline_builder import PipelineBuilder
+from golem.core.optimisers.fitness import SingleObjFitness
+from golem.core.optimisers.opt_history_objects.individual import Individual
+from joblib.externals.loky import get_reusable_executor
+
+from fedot_ind.core.architecture.abstraction.decorators import DaskServer
+from fedot_ind.core.repository.IndustrialDispatcher import IndustrialDispatcher
+
+
+def nodes_objective(pipeline):
+    return SingleObjFitness(len(pipeline.nodes))
+
+
+def slow_objective(pipeline):
+    time.sleep(1)
+    return SingleObjFitness(len(pipeline.nodes))
+
+
+# set by the test once the dispatcher has given up on the slow individual
+slow_individual_released = threading.Event()
+
+
+def first_slow_objective(pipeline):
+    if len(pipeline.nodes) == 3:
+        slow_individual_released.wait(timeout=60)
+    else:
+        time.sleep(0.05)
+    return SingleObjFitness(len(pipeline.nodes))
+
+
+def release_slow_individual(*args, **kwargs):
+    slow_individual_released.set()
+
+
+def get_population(size: int = 4):
+    adapter = PipelineAdapter()
+    return [Individual(adapter.adapt(PipelineBuilder().add_node('scaling').add_node('rf').build()))
+            for _ in range(size)]
+
+
+def get_population_with_slow_individual(size: int = 6):
+    adapter = PipelineAdapter()
+    slow = Individual(adapter.adapt(PipelineBuilder().add_node('scaling').add_node('pca').add_node('rf').build()))
+    return [slow] + get_population(size - 1)
+
+
+def get_dispatcher_with_slow_individual(monkeypatch, evaluation_backend: str):
+    # the fast individuals wait for each other much longer than the timeout, but each one is evaluated
+    # twenty times faster than it, so they pass only if every one of them is timed from its own start
+    slow_individual_released.clear()
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend=evaluation_backend,
+                                      individual_timeout=1)
+    dispatcher.dispatch(first_slow_objective)
+    monkeypatch.setattr(dispatcher.logger, 'warning', release_slow_individual)
+    return dispatcher
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_evaluate_in_parallel(n_jobs):
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=n_jobs, evaluation_backend='thread')
+    dispatcher.dispatch(nodes_objective)
+    results = dispatcher._evaluate_in_parallel(get_population(), n_jobs)
+    assert len(results) == 4
+    assert all(result.fitness.value == 2 for result in results)
+
+
+def test_evaluate_in_parallel_timeout():
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend='thread',
+                                      individual_timeout=0.1)
+    dispatcher.dispatch(slow_objective)
+    results = dispatcher._evaluate_in_parallel(get_population(), 2)
+    assert results == [None] * 4
+
+
+def test_evaluate_in_parallel_timeout_does_not_leak_threads():
+    n_threads = threading.active_count()
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend='thread',
+                                      individual_timeout=0.1)
+    dispatcher.dispatch(slow_objective)
+    dispatcher._evaluate_in_parallel(get_population(), 2)
+    assert threading.active_count() == n_threads
+
+
+def test_timeout_is_counted_from_start_of_evaluation(monkeypatch):
+    dispatcher = get_dispatcher_with_slow_individual(monkeypatch, 'thread')
+    start = time.time()
+    results = dispatcher._evaluate_in_parallel(get_population_with_slow_individual(), 2)
+    assert time.time() - start > dispatcher.individual_timeout
+    assert results[0] is None
+    assert all(result.fitness.value == 2 for result in results[1:])
+
+
+def test_process_workers_start_up_is_not_counted_in_timeout():
+    # freshly started workers spend much longer than the timeout on imports before the first evaluation
+    get_reusable_executor(max_workers=2).shutdown(wait=True, kill_workers=True)
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend='process',
+                                      individual_timeout=5)
+    dispatcher.dispatch(nodes_objective)
+    results = dispatcher._evaluate_in_parallel(get_population(), 2)
+    assert all(result.fitness.value == 2 for result in results)
+
+
+def test_unknown_backend():
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend='mpi')
+    with pytest.raises(ValueError):
+        dispatcher._get_executor(2)
+
+
+@pytest.fixture
+def dask_server():
+    DaskServer.shutdown()
+    yield DaskServer
+    DaskServer.shutdown()
+    DaskServer.configure()
+
+
+def test_dask_server_is_not_started_for_serial_evaluation(dask_server):
+    dask_server.configure(n_workers=1, threads_per_worker=1)
+    dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=1, evaluation_backend='dask')
+    dispatcher.dispatch(nodes_objective)
+    results = dispatcher._evaluate_in_parallel(get_population(), 1)
+    assert len(results) == 4
+    assert not dask_server.is_running()
+
+
+def test_dask_server_attaches_to_scheduler(dask_server):
+    with LocalCluster(processes=False, n_workers=1, threads_per_worker=2, dashboard_address=None) as cluster:
+        dask_server.configure(address=cluster.scheduler_address)
+        dispatcher = IndustrialDispatcher(adapter=PipelineAdapter(), n_jobs=2, evaluation_backend='dask')
+        dispatcher.dispatch(nodes_objective)
+        results = dispatcher._evaluate_in_parallel(get_population(), 2)
+        assert all(result.fitness.value == 2 for result in results)
+        assert dask_server.is_running()
+        assert DaskServer().client.scheduler.address == cluster.scheduler_address
+        assert DaskServer().cluster is None
+
+
+def test_dask_timeout_is_counted_from_start_of_evaluation(dask_server, monkeypatch):
+    dask_server.configure(n_workers=1, threads_per_worker=2)
+    dispatcher = get_dispatcher_with_slow_individual(monkeypatch, 'dask')
+    results = dispatcher._evaluate_in_parallel(get_population_with_slow_individual(), 2)
+    assert results[0] is None
+    assert all(result.fitness.value == 2 for result in results[1:])
+
+
+def test_dask_server_unknown_params(dask_server):
+    with pytest.raises(ValueError):
+        dask_server.configure(n_cores=4)
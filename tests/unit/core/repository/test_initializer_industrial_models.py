@@ -0,0 +1,16 @@
+from fedot.core.operations.operation import Operation
+from fedot.core.pipelines.verification import class_rules
+
+from fedot_ind.core.repository.industrial_implementations.optimisation import \
+    has_no_data_flow_conflicts_in_industrial_pipeline
+from fedot_ind.core.repository.initializer_industrial_models import IndustrialModels
+
+
+def test_exit_restores_fedot_implementations():
+    with IndustrialModels():
+        IndustrialModels().setup_repository()
+        IndustrialModels().setup_repository()
+        assert Operation.predict_for_fit.__module__.startswith('fedot_ind')
+        assert class_rules.count(has_no_data_flow_conflicts_in_industrial_pipeline) == 1
+    assert Operation.predict_for_fit.__module__ == Operation.__module__
+    assert has_no_data_flow_conflicts_in_industrial_pipeline not in class_rules
@@ -1,7 +1,9 @@
 import os
+import shutil
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from fedot_ind.api.utils.path_lib import PROJECT_PATH
 from fedot_ind.tools.loader import DataLoader
@@ -147,3 +149,42 @@ def test_read_train_test_files():
 
     for i in [x_train, y_train, x_test, y_test, is_multi]:
         assert i is not None
+
+
+@pytest.fixture
+def ts_dataset(tmp_path):
+    dataset_folder = tmp_path / 'data' / 'Fake'
+    dataset_folder.mkdir(parents=True)
+    for subset in ('TRAIN', 'TEST'):
+        shutil.copy(os.path.join(ds_path, f'ItalyPowerDemand_fake_{subset}.ts'),
+                    dataset_folder / f'Fake_{subset}.ts')
+    return tmp_path
+
+
+def test_load_data_binary_cache(ts_dataset, monkeypatch):
+    loader = DataLoader('Fake', folder=str(ts_dataset / 'data'), cache_folder=str(ts_dataset / 'cache'))
+    train_data, test_data = loader.load_data(shuffle=False)
+    assert len(os.listdir(ts_dataset / 'cache')) == 1
+
+    def parse_ts_files(*args, **kwargs):
+        raise AssertionError('Source files are parsed instead of reading the binary cache')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(DataLoader, 'read_ts_files', parse_ts_files)
+        cached_train_data, cached_test_data = loader.load_data(shuffle=False)
+    assert isinstance(cached_test_data[0], np.memmap)
+    for data, cached_data in zip((train_data, test_data), (cached_train_data, cached_test_data)):
+        assert np.array_equal(data[0], cached_data[0])
+        assert np.array_equal(data[1], cached_data[1])
+
+    # cache is rebuilt when the source file changes
+    source_file = ts_dataset / 'data' / 'Fake' / 'Fake_TRAIN.ts'
+    source_file.write_text(''.join(source_file.read_text().splitlines(keepends=True)[:-1]))
+    (x_train, y_train), _ = loader.load_data(shuffle=False)
+    assert x_train.shape[0] == y_train.shape[0] == train_data[0].shape[0] - 1
+
+
+def test_load_data_without_binary_cache(ts_dataset):
+    DataLoader('Fake', folder=str(ts_dataset / 'data'), use_cache=False,
+               cache_folder=str(ts_dataset / 'cache')).load_data()
+    assert not os.path.exists(ts_dataset / 'cache')